@@ -7,6 +7,9 @@ This module contains common functions used by:
 - mm_wireframe_export_setup.py
 - mm_slapcomp_export_setup.py
 - mm_plate_read.py
+- mm_geo_read.py
+- mm_ld_import.py
+- mm_playblast_read.py
 
 Functions include:
 - Context parsing from Nuke script path
@@ -14,6 +17,7 @@ Functions include:
 - Plate ID detection and finding
 - Lens distortion file finding
 - User prompts for ambiguous selections
+- Node building shared by the export setups
 
 Path structures:
     Playblast: /shows/<show>/shots/<seq>/<shot>/user/<user>/mm/maya/playblast/{category}/v###/
@@ -23,8 +27,15 @@ Path structures:
 
 import os
 import re
+import shutil
+import tempfile
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, NoReturn
+from typing import Any, NoReturn, TypeVar
 
 import nuke
 
@@ -48,6 +59,54 @@ def err(msg: str) -> NoReturn:
     raise RuntimeError(msg)
 
 
+def deselect_all() -> None:
+    """
+    Clear the node selection in the current group.
+
+    Two bulk calls replace a setSelected(False) round trip per selected node.
+    """
+    nuke.selectAll()
+    nuke.invertSelection()
+
+
+def apply_knobs(node: nuke.Node, knobs: dict[str, Any]) -> None:
+    """
+    Set knob values on a node, skipping any the node refuses.
+
+    Knobs may be missing or reject values depending on the Nuke version,
+    toolkit and OCIO config, so each one is optional. Values are applied in
+    dict order.
+
+    Args:
+        node: Node to configure
+        knobs: Knob name to value
+    """
+    getknob = node.__getitem__
+    for knob, value in knobs.items():
+        try:
+            getknob(knob).setValue(value)
+        except Exception:
+            pass
+
+
+@contextmanager
+def undo_group(name: str) -> Iterator[None]:
+    """
+    Record everything done inside the block as a single undo step.
+
+    Usable as a decorator, so a whole setup function can be undone at once
+    instead of node by node.
+
+    Args:
+        name: Label shown for the step in Nuke's Edit > Undo menu
+    """
+    nuke.Undo.begin(name)
+    try:
+        yield
+    finally:
+        nuke.Undo.end()
+
+
 def find_index(parts: tuple[str, ...], name: str) -> int:
     """
     Find index of a string in a tuple, returning -1 if not found.
@@ -75,8 +134,224 @@ def version_num(vname: str) -> int:
     Returns:
         Version number as integer, or -1 if invalid format
     """
-    m = re.match(r"v(\d+)$", vname, re.IGNORECASE)
-    return int(m.group(1)) if m else -1
+    # Plain string checks: this runs for every directory entry in version scans
+    if len(vname) < 2 or vname[0] not in "vV":
+        return -1
+    digits = vname[1:]
+    return int(digits) if digits.isascii() and digits.isdigit() else -1
+
+
+# ============================================================================
+# DIRECTORY PROBE CACHE
+# ============================================================================
+
+# Hotkeys often run several find_latest_* lookups back-to-back for the same
+# shot. Directory probes and version listings are remembered for a few
+# seconds so those repeats skip the filesystem round trips.
+DIR_CACHE_TTL = 5.0  # seconds
+_DIR_CACHE_MAX = 1024
+
+_dir_cache: dict[Path, tuple[float, bool]] = {}
+_version_dirs_cache: dict[Path, tuple[float, list[tuple[int, os.DirEntry[str]]]]] = {}
+
+# Whole find_latest_* results live longer: the export setups are usually
+# run one after another for the same shot, and each repeats the full search.
+# Keys start with the resolved root folder, so a config change never hits,
+# followed by every argument of the call.
+RESULT_CACHE_TTL = 30.0  # seconds
+
+_result_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+
+# Failed lookups are remembered briefly as well: while a shot is still being
+# set up, artists re-run the hotkey until the missing folder appears, and
+# each retry would otherwise repeat the whole failing walk. They share the
+# result cache keys, so a miss only answers the exact same call.
+MISS_CACHE_TTL = 5.0  # seconds
+
+_miss_cache: dict[tuple[Any, ...], tuple[float, str]] = {}
+
+
+def clear_cache() -> None:
+    """
+    Forget all cached directory probes, version listings, search results
+    and failed lookups.
+
+    Call this after creating or removing folders that a following
+    find_latest_* lookup needs to see immediately.
+    """
+    _dir_cache.clear()
+    _version_dirs_cache.clear()
+    _result_cache.clear()
+    _miss_cache.clear()
+
+
+def _cached_result(key: tuple[Any, ...]) -> Any | None:
+    """
+    Return a find_latest_* result stored less than RESULT_CACHE_TTL ago.
+
+    Args:
+        key: Lookup key, starting with the function's root folder
+
+    Returns:
+        The stored result, or None if absent or expired
+    """
+    hit = _result_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < RESULT_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def _store_result(key: tuple[Any, ...], result: Any) -> None:
+    """
+    Remember a find_latest_* result for RESULT_CACHE_TTL seconds.
+
+    Args:
+        key: Lookup key, starting with the function's root folder
+        result: Value to hand back on the next matching lookup
+    """
+    if len(_result_cache) >= _DIR_CACHE_MAX:
+        _result_cache.clear()
+    _result_cache[key] = (time.monotonic(), result)
+    _miss_cache.pop(key, None)
+
+
+def _check_miss(key: tuple[Any, ...]) -> None:
+    """
+    Re-raise a find_latest_* failure recorded less than MISS_CACHE_TTL ago.
+
+    Args:
+        key: Lookup key, as passed to _fail()
+
+    Raises:
+        RuntimeError: With the original message, if the lookup failed recently
+    """
+    hit = _miss_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < MISS_CACHE_TTL:
+        err(hit[1])
+
+
+def _fail(key: tuple[Any, ...], msg: str) -> NoReturn:
+    """
+    Record a find_latest_* failure for MISS_CACHE_TTL seconds, then raise it.
+
+    Args:
+        key: Lookup key, starting with the function's root folder
+        msg: Error message shown to the user
+
+    Raises:
+        RuntimeError: Always
+    """
+    if len(_miss_cache) >= _DIR_CACHE_MAX:
+        _miss_cache.clear()
+    _miss_cache[key] = (time.monotonic(), msg)
+    err(msg)
+
+
+def cached_is_dir(path: Path) -> bool:
+    """
+    Check whether a directory exists, reusing recent answers.
+
+    Both positive and negative results are cached for DIR_CACHE_TTL seconds.
+
+    Args:
+        path: Directory to probe
+
+    Returns:
+        True if path is an existing directory
+    """
+    now = time.monotonic()
+    hit = _dir_cache.get(path)
+    if hit is not None and now - hit[0] < DIR_CACHE_TTL:
+        return hit[1]
+    if len(_dir_cache) >= _DIR_CACHE_MAX:
+        _dir_cache.clear()
+    result = path.is_dir()
+    _dir_cache[path] = (now, result)
+    return result
+
+
+def iter_version_dirs(parent: Path) -> Iterator[tuple[int, Path]]:
+    """
+    Lazily yield the v### subdirectories of a directory, latest first.
+
+    The listing is read once and every entry name is parsed exactly once;
+    the parsed number doubles as the filter (-1 means "not a version
+    folder") and the sort key. The directory check and Path are deferred
+    until an entry is yielded, so callers that stop at the first usable
+    version never pay for the older ones. Listings are cached for
+    DIR_CACHE_TTL seconds (see clear_cache()).
+
+    Args:
+        parent: Directory containing version folders
+
+    Yields:
+        (version_number, version_dir) tuples, newest first
+    """
+    now = time.monotonic()
+    hit = _version_dirs_cache.get(parent)
+    if hit is not None and now - hit[0] < DIR_CACHE_TTL:
+        candidates = hit[1]
+    else:
+        with os.scandir(parent) as it:
+            candidates = [(n, entry) for entry in it if (n := version_num(entry.name)) >= 0]
+        candidates.sort(key=lambda t: t[0], reverse=True)
+
+        if len(_version_dirs_cache) >= _DIR_CACHE_MAX:
+            _version_dirs_cache.clear()
+        _version_dirs_cache[parent] = (now, candidates)
+
+    # DirEntry caches its own is_dir() result, so repeat lookups stay free
+    for n, entry in candidates:
+        if entry.is_dir():
+            yield n, Path(entry.path)
+
+
+def list_version_dirs(parent: Path) -> list[tuple[int, Path]]:
+    """
+    List v### subdirectories of a directory, latest first.
+
+    Args:
+        parent: Directory containing version folders
+
+    Returns:
+        List of (version_number, version_dir) tuples sorted newest first
+    """
+    return list(iter_version_dirs(parent))
+
+
+def iter_subdirs(parent: Path) -> Iterator[Path]:
+    """
+    Lazily yield the subdirectories of a directory.
+
+    Entries are streamed from os.scandir(), so callers that break early
+    never pay for the rest of the listing.
+
+    Args:
+        parent: Directory to list
+
+    Yields:
+        Path of each subdirectory (symlinks followed)
+    """
+    with os.scandir(parent) as it:
+        for entry in it:
+            if entry.is_dir():
+                yield Path(entry.path)
+
+
+def split_nk_path(nk_path: str) -> tuple[str, ...]:
+    """
+    Split a script path into its segments without building a Path.
+
+    Backslashes are treated as separators too, so Windows-style paths split
+    the same way on every platform.
+
+    Args:
+        nk_path: Script path as returned by nuke.root().name()
+
+    Returns:
+        Tuple of path segments (a leading "" for absolute paths)
+    """
+    return tuple(nk_path.replace("\\", "/").split("/"))
 
 
 def infer_context_from_nk() -> tuple[str, str, str, str]:
@@ -93,30 +368,89 @@ def infer_context_from_nk() -> tuple[str, str, str, str]:
     if not nk_path or nk_path == "Root":
         err("Please save the Nuke script first so I can infer the shot path.")
 
-    p = Path(nk_path)
-    parts = p.parts
-    i_shows = find_index(parts, "shows")
-    i_shots = find_index(parts, "shots")
-    i_user = find_index(parts, "user")
+    parts = split_nk_path(nk_path)
+
+    # Locate all three anchors (first occurrence of each) in one pass
+    i_shows = i_shots = i_user = -1
+    for i, seg in enumerate(parts):
+        if i_shows < 0 and seg == "shows":
+            i_shows = i
+        elif i_shots < 0 and seg == "shots":
+            i_shots = i
+        elif i_user < 0 and seg == "user":
+            i_user = i
+        if i_shows >= 0 and i_shots >= 0 and i_user >= 0:
+            break
 
     if min(i_shows, i_shots, i_user) < 0:
         err("Couldn't parse show/shot/user from the Nuke script path.\nExpected /shows/<show>/shots/<seq>/<shot>/user/<user>/...")
 
-    try:
-        show = parts[i_shows+1]
-        seq = parts[i_shots+1]
-        shot = parts[i_shots+2]
-        user = parts[i_user+1]
-    except Exception:
+    if len(parts) <= max(i_shows + 1, i_shots + 2, i_user + 1):
         err("Path didn't have enough segments after /shows or /shots or /user.")
 
-    return show, seq, shot, user
+    return parts[i_shows+1], parts[i_shots+1], parts[i_shots+2], parts[i_user+1]
+
+
+_K = TypeVar("_K")  # frame group key
+
+
+def _pick_group(aggs: dict[_K, list[int]], paths: dict[_K, list[str]]) -> _K:
+    """
+    Pick the frame group with the most files, then the newest modification time.
+
+    Scanners fold count, frame range and padding into per-group aggregates as
+    they list the folder, so files are only stat'ed here, when groups tie.
+
+    Args:
+        aggs: Per-group [min_frame, max_frame, max_padding] aggregates
+        paths: Per-group path strings, in scan order
+
+    Returns:
+        Key of the chosen group
+    """
+    if len(aggs) == 1:
+        return next(iter(aggs))
+    max_count = max(len(p) for p in paths.values())
+    top = [key for key, p in paths.items() if len(p) == max_count]
+    if len(top) == 1:
+        return top[0]
+    newest = {key: max(os.stat(p).st_mtime for p in paths[key]) for key in top}
+    return max(top, key=newest.__getitem__)
 
 
 # ============================================================================
 # PLAYBLAST FINDING
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _playblast_seq_rx(base_name: str) -> re.Pattern[str]:
+    """
+    Build (and cache) the image sequence regex for a playblast base name.
+
+    Args:
+        base_name: Base name to match (e.g., "Wireframe")
+
+    Returns:
+        Compiled pattern (use with fullmatch) capturing (frame, extension)
+    """
+    return re.compile(rf"{re.escape(base_name)}\.(\d+)\.([A-Za-z0-9]+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _playblast_movie_names(base_name: str) -> frozenset[str]:
+    """
+    Build (and cache) the lowercase movie filenames for a playblast base name.
+
+    Args:
+        base_name: Base name to match (e.g., "Wireframe")
+
+    Returns:
+        Set of names like "wireframe.mov", one per supported movie extension
+    """
+    stem = base_name.lower()
+    return frozenset(f"{stem}.{ext}" for ext in PipelineConfig.MOVIE_EXTENSIONS)
+
+
 def scan_playblast(vdir: Path, base_name: str) -> dict[str, Any] | None:
     """
     Scan a version folder for playblast image sequences or movie files.
@@ -128,66 +462,80 @@ def scan_playblast(vdir: Path, base_name: str) -> dict[str, Any] | None:
     Returns:
         Dictionary with type-specific data or None if nothing matches
     """
-    if not vdir.exists():
+    if not cached_is_dir(vdir):
         return None
 
-    # 1) Try image sequence
-    rx_seq = re.compile(rf"^{re.escape(base_name)}\.(\d+)\.([A-Za-z0-9]+)$", re.IGNORECASE)
-    files: list[tuple[Path, int, int, str]] = []
-
-    for p in vdir.iterdir():
-        if not p.is_file():
-            continue
-        m = rx_seq.match(p.name)
-        if not m:
-            continue
-        frame_str, ext = m.group(1), m.group(2)
-        files.append((p, int(frame_str), len(frame_str), ext))
-
-    if files:
-        # Group by extension
-        groups: dict[str, list[tuple[Path, int, int, str]]] = {}
-        for p, frame, pad, ext in files:
+    # Single directory pass collects sequence frames and the first movie file
+    rx_seq = _playblast_seq_rx(base_name)
+    movie_names = _playblast_movie_names(base_name)
+    # Per extension: [min_frame, max_frame, max_padding] plus the frame paths
+    aggs: dict[str, list[int]] = {}
+    paths: dict[str, list[str]] = {}
+    movie_path: str | None = None
+
+    with os.scandir(vdir) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            m = rx_seq.fullmatch(entry.name)
+            if not m:
+                if movie_path is None and entry.name.lower() in movie_names:
+                    movie_path = entry.path
+                continue
+            frame_str, ext = m.group(1, 2)
+            frame, pad = int(frame_str), len(frame_str)
             key = ext.lower()
-            groups.setdefault(key, []).append((p, frame, pad, ext))
-
-        # Choose the group with most files, then newest mtime
-        def group_key(kv: tuple[str, list[tuple[Path, int, int, str]]]) -> tuple[int, float]:
-            _, vals = kv
-            count = len(vals)
-            newest = max(v[0].stat().st_mtime for v in vals)
-            return (count, newest)
-
-        ext, vals = max(groups.items(), key=group_key)
-        frames = [v[1] for v in vals]
-        pads = [v[2] for v in vals]
-        fmin, fmax = min(frames), max(frames)
-        pad = max(pads)
-        best_prefix = str(vdir / base_name)
+            agg = aggs.get(key)
+            if agg is None:
+                aggs[key] = [frame, frame, pad]
+                paths[key] = [entry.path]
+                continue
+            if frame < agg[0]:
+                agg[0] = frame
+            elif frame > agg[1]:
+                agg[1] = frame
+            if pad > agg[2]:
+                agg[2] = pad
+            paths[key].append(entry.path)
+
+    # 1) Image sequence takes priority
+    if aggs:
+        ext = _pick_group(aggs, paths)
+        fmin, fmax, pad = aggs[ext]
 
         return {
             "type": "sequence",
-            "best_prefix": best_prefix,
+            "best_prefix": str(vdir / base_name),
             "ext": ext,
             "fmin": fmin,
             "fmax": fmax,
             "pad": pad,
-            "files": [v[0] for v in vals],
+            "files": [Path(p) for p in paths[ext]],
         }
 
-    # 2) Try single movie file
-    movie_exts = ("mov", "mp4", "m4v", "avi", "mxf", "webm", "mkv")
-    for p in vdir.iterdir():
-        if not p.is_file():
-            continue
-        name_low = p.name.lower()
-        for me in movie_exts:
-            if name_low == f"{base_name.lower()}.{me}":
-                return {"type": "movie", "path": str(p)}
+    # 2) Fall back to a single movie file
+    if movie_path is not None:
+        return {"type": "movie", "path": movie_path}
 
     return None
 
 
+def _copy_playblast(playblast: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy a scan_playblast() result, including its "files" list.
+
+    Args:
+        playblast: Playblast info dict
+
+    Returns:
+        A copy that shares no mutable state with the original
+    """
+    copied = dict(playblast)
+    if "files" in copied:
+        copied["files"] = list(copied["files"])
+    return copied
+
+
 def find_latest_playblast(
     show: str, seq: str, shot: str, user: str, category: str
 ) -> tuple[dict[str, Any], str]:
@@ -208,36 +556,40 @@ def find_latest_playblast(
         RuntimeError: If no playblasts found
     """
     playblast_root = PipelineConfig.get_playblast_root(show, seq, shot, user)
-    if not playblast_root.exists():
-        err(f"Playblast root not found:\n{playblast_root}")
+    cache_key = ("playblast", playblast_root, show, seq, shot, user, category)
+    cached = _cached_result(cache_key)
+    if cached is not None:
+        # Hand out a fresh copy so callers cannot edit the cached entry
+        return _copy_playblast(cached[0]), cached[1]
+    _check_miss(cache_key)
+
+    if not cached_is_dir(playblast_root):
+        _fail(cache_key, f"Playblast root not found:\n{playblast_root}")
 
     cat_dir = playblast_root / category
-    if not cat_dir.exists() or not cat_dir.is_dir():
-        err(f"No '{category}' folder under:\n{playblast_root}")
-
-    # Find version directories (latest first)
-    vdirs = [
-        d for d in cat_dir.iterdir()
-        if d.is_dir() and re.match(r"v\d+$", d.name, re.IGNORECASE)
-    ]
-    if not vdirs:
-        err(f"No version folders under:\n{cat_dir}")
-    vdirs.sort(key=lambda d: version_num(d.name), reverse=True)
+    if not cached_is_dir(cat_dir):
+        _fail(cache_key, f"No '{category}' folder under:\n{playblast_root}")
 
     chosen: dict[str, Any] | None = None
     chosen_v: str | None = None
+    seen_version = False
 
-    for vdir in vdirs:
+    # Version directories are produced lazily, latest first
+    for n, vdir in iter_version_dirs(cat_dir):
+        seen_version = True
         hit = scan_playblast(vdir, category)
         if hit:
             chosen = hit
-            chosen_v = vdir.name[1:].zfill(3)
+            chosen_v = f"{n:03d}"
             break
 
+    if not seen_version:
+        _fail(cache_key, f"No version folders under:\n{cat_dir}")
     if not chosen:
-        err(f"No sequences or movies matching '{category}' found under versions in:\n{cat_dir}")
+        _fail(cache_key, f"No sequences or movies matching '{category}' found under versions in:\n{cat_dir}")
 
     assert chosen_v is not None  # Set when chosen is set
+    _store_result(cache_key, (_copy_playblast(chosen), chosen_v))
     return chosen, chosen_v
 
 
@@ -247,6 +599,18 @@ def find_latest_playblast(
 
 PLATE_RX = re.compile(r'\b([A-Z]{2}\d{2})\b', re.IGNORECASE)
 
+# Plate ID in a Read file path: /plate/(input|output)_plate/<ID>/ in the
+# directories, or _plate_<ID>_ in the filename (lookahead keeps it out of
+# directory names). The directory form always sits left of the filename, so
+# leftmost-match order preserves the "path before filename" preference.
+READ_PLATE_RX = re.compile(
+    r'/plate/(?:input_plate|output_plate)/([A-Z]{2}\d{2})/|_plate_([A-Z]{2}\d{2})_(?=[^/]*$)',
+    re.IGNORECASE
+)
+
+
+PLATE_TOKEN_RX = re.compile(r"([A-Za-z]{2})(\d{1,2})")
+
 
 def norm_plate_token(tok: str) -> str | None:
     """
@@ -258,7 +622,7 @@ def norm_plate_token(tok: str) -> str | None:
     Returns:
         Normalized plate ID (e.g., "FG01") or None if invalid
     """
-    m = re.match(r"^([A-Za-z]{2})(\d{1,2})$", tok)
+    m = PLATE_TOKEN_RX.fullmatch(tok)
     if not m:
         return None
     letters = m.group(1).upper()
@@ -273,21 +637,22 @@ def detect_plate_from_reads() -> str | None:
     Returns:
         Plate ID in uppercase (e.g., "FG01") or None if not found
     """
-    for r in nuke.allNodes('Read'):
+    search = READ_PLATE_RX.search
+    reads = nuke.allNodes('Read')
+    for r in reads:
         try:
             p = r['file'].value()
         except Exception:
             continue
 
-        # Check path for /plate/input_plate/<ID>/ or /plate/output_plate/<ID>/
-        m = re.search(r'/plate/(?:input_plate|output_plate)/([A-Za-z]{2}\d{2})/', p, re.IGNORECASE)
-        if m:
-            return m.group(1).upper()
+        # Template scripts often carry Reads with an empty file knob
+        if not p:
+            continue
 
-        # Check filename for _plate_<ID>_
-        m = re.search(r'_plate_([A-Za-z]{2}\d{2})_', os.path.basename(p), re.IGNORECASE)
+        # Single search covers both the path and the filename forms
+        m = search(p)
         if m:
-            return m.group(1).upper()
+            return (m.group(1) or m.group(2)).upper()
 
     return None
 
@@ -297,16 +662,33 @@ def detect_plate_from_nkpath(parts: tuple[str, ...]) -> str | None:
     Detect plate ID from .nk path segments.
 
     Args:
-        parts: Path components from Path.parts
+        parts: Path segments, e.g. from split_nk_path
 
     Returns:
         Plate ID in uppercase (e.g., "FG01") or None if not found
     """
-    for seg in parts:
-        m = PLATE_RX.search(seg)
-        if m:
-            return m.group(1).upper()
-    return None
+    # One search over the joined path: "/" is a non-word character, so the
+    # \b anchors still fall on segment edges and the leftmost hit is the
+    # same one a per-segment scan would return first.
+    m = PLATE_RX.search("/".join(parts))
+    return m.group(1).upper() if m else None
+
+
+def resolve_plate_id() -> str | None:
+    """
+    Detect the plate ID for the current script.
+
+    Read nodes are checked first; the script path is only split when no
+    Read names a plate. PLATE_RX is case-insensitive, so the segments are
+    passed as-is.
+
+    Returns:
+        Plate ID in uppercase (e.g., "FG01") or None if not found
+    """
+    plate_id = detect_plate_from_reads()
+    if not plate_id:
+        plate_id = detect_plate_from_nkpath(split_nk_path(nuke.root().name()))
+    return plate_id
 
 
 def collect_plate_dirs(scene_root: Path) -> list[tuple[Path, str]]:
@@ -320,18 +702,46 @@ def collect_plate_dirs(scene_root: Path) -> list[tuple[Path, str]]:
         List of tuples: (plate_directory_path, plate_id_uppercase)
     """
     out: list[tuple[Path, str]] = []
-    if not scene_root.exists():
+    if not cached_is_dir(scene_root):
         return out
 
-    for d in scene_root.iterdir():
-        if d.is_dir():
-            m = PLATE_RX.fullmatch(d.name)
-            if m:
-                out.append((d, m.group(1).upper()))
+    # Name test first: is_dir() may need a stat (symlinks, filesystems
+    # without d_type), and most entries here are not plate folders
+    with os.scandir(scene_root) as it:
+        for entry in it:
+            m = PLATE_RX.fullmatch(entry.name)
+            if m and entry.is_dir():
+                out.append((Path(entry.path), m.group(1).upper()))
 
     return out
 
 
+@lru_cache(maxsize=256)
+def _plate_seq_rx(shot: str, vnum: str, plate_id: str | None) -> re.Pattern[str]:
+    """
+    Build (and cache) the plate sequence regex for a shot/version/plate triple.
+
+    Args:
+        shot: Shot name to match
+        vnum: Version number string
+        plate_id: Plate ID to match or None for wildcard
+
+    Returns:
+        Compiled pattern (use with fullmatch) with "frame" and "ext" named groups
+    """
+    # Greedy ".+" backtracks from the end of the name, where the short
+    # _v###.<frame>.<ext> tail sits, instead of probing forward one char at a
+    # time. The frame/ext groups cannot contain dots, so the match is the
+    # same as with a lazy ".+?". Dots elsewhere (e.g. "rec.709") stay legal.
+    if plate_id:
+        return re.compile(
+            rf"{re.escape(shot)}_turnover-plate_{re.escape(plate_id)}_.+_v{re.escape(vnum)}\.(?P<frame>\d+)\.(?P<ext>[A-Za-z0-9]+)"
+        )
+    return re.compile(
+        rf"{re.escape(shot)}_turnover-plate_[A-Za-z0-9]+_.+_v{re.escape(vnum)}\.(?P<frame>\d+)\.(?P<ext>[A-Za-z0-9]+)"
+    )
+
+
 def scan_plate_seq(
     dir_path: Path,
     shot: str,
@@ -350,50 +760,133 @@ def scan_plate_seq(
     Returns:
         Tuple of (prefix_path, extension, min_frame, max_frame, padding, file_list) or None
     """
-    if plate_id:
-        rx = re.compile(
-            rf"^{re.escape(shot)}_turnover-plate_{re.escape(plate_id)}_.+?_v{re.escape(vnum)}\.(\d+)\.([A-Za-z0-9]+)$"
-        )
-    else:
-        rx = re.compile(
-            rf"^{re.escape(shot)}_turnover-plate_[A-Za-z0-9]+_.+?_v{re.escape(vnum)}\.(\d+)\.([A-Za-z0-9]+)$"
-        )
+    rx = _plate_seq_rx(shot, vnum, plate_id)
 
-    files: list[tuple[Path, int, int, str]] = []
-    if not dir_path.exists():
+    if not cached_is_dir(dir_path):
         return None
 
-    for p in dir_path.iterdir():
-        if not p.is_file():
-            continue
-        m = rx.match(p.name)
-        if not m:
+    # Per (prefix_without_frame, ext): [min_frame, max_frame, max_padding] plus the frame paths
+    aggs: dict[tuple[str, str], list[int]] = {}
+    paths: dict[tuple[str, str], list[str]] = {}
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            m = rx.fullmatch(entry.name)
+            if not m:
+                continue
+            # One C-level call for both groups
+            frame_str, ext = m.group("frame", "ext")
+            frame, pad = int(frame_str), len(frame_str)
+            # Prefix is the path up to the "." before the frame number
+            path = entry.path
+            key = (path[:len(path) - len(entry.name) + m.start("frame") - 1], ext.lower())
+            agg = aggs.get(key)
+            if agg is None:
+                aggs[key] = [frame, frame, pad]
+                paths[key] = [path]
+                continue
+            if frame < agg[0]:
+                agg[0] = frame
+            elif frame > agg[1]:
+                agg[1] = frame
+            if pad > agg[2]:
+                agg[2] = pad
+            paths[key].append(path)
+
+    if not aggs:
+        return None
+
+    # Pick the largest, newest group
+    best_prefix, ext = best_key = _pick_group(aggs, paths)
+    fmin, fmax, pad = aggs[best_key]
+
+    return best_prefix, ext, fmin, fmax, pad, [Path(p) for p in paths[best_key]]
+
+
+# Upper bound on plate folders scanned concurrently
+PLATE_SEARCH_WORKERS = 8
+
+
+def find_latest_plate_under(
+    bg_dir: Path, shot: str
+) -> tuple[tuple[str, str, int, int, int, list[Path]], str] | None:
+    """
+    Find the latest version of one plate folder that has frames.
+
+    Versions are tried newest first; in each, frames directly under exr/
+    win over those in a resolution subfolder like exr/4448x3096/.
+
+    Args:
+        bg_dir: Plate folder (e.g., .../input_plate/FG01)
+        shot: Shot name for filename matching
+
+    Returns:
+        Tuple of (scan_plate_seq result, version_string) or None
+    """
+    plate = bg_dir.name
+    for n, vdir in iter_version_dirs(bg_dir):
+        # Filenames repeat the folder's own digits (v0001 -> _v0001.####);
+        # the parsed number only orders versions and formats the result
+        file_vnum = vdir.name[1:].zfill(3)
+        vnum = f"{n:03d}"
+        exr_dir = vdir / "exr"
+        if not cached_is_dir(exr_dir):
             continue
-        frame_str, ext = m.group(1), m.group(2)
-        files.append((p, int(frame_str), len(frame_str), ext))
 
-    if not files:
-        return None
+        # 1) Directly in exr/
+        hit = scan_plate_seq(exr_dir, shot, file_vnum, plate_id=plate)
+        if hit:
+            return hit, vnum
+
+        # 2) Subfolder like 4448x3096 inside exr/ (streamed; stops at first hit)
+        for sd in iter_subdirs(exr_dir):
+            hit = scan_plate_seq(sd, shot, file_vnum, plate_id=plate)
+            if hit:
+                return hit, vnum
 
-    # Group by (prefix_without_frame, ext) and pick the largest, newest
-    groups: dict[tuple[str, str], list[tuple[Path, int, int, str]]] = {}
-    for p, frame, pad, ext in files:
-        prefix = re.sub(r"\.\d+\.[A-Za-z0-9]+$", "", str(p))
-        groups.setdefault((prefix, ext.lower()), []).append((p, frame, pad, ext))
+    return None
 
-    def group_key(kv: tuple[tuple[str, str], list[tuple[Path, int, int, str]]]) -> tuple[int, float]:
-        _, vals = kv
-        count = len(vals)
-        newest = max(v[0].stat().st_mtime for v in vals)
-        return (count, newest)
 
-    (best_prefix, ext), vals = max(groups.items(), key=group_key)
-    frames = [v[1] for v in vals]
-    pads = [v[2] for v in vals]
-    fmin, fmax = min(frames), max(frames)
-    pad = max(pads)
+def _find_latest_plate_in(
+    bg_dirs: list[Path], shot: str
+) -> tuple[tuple[str, str, int, int, int, list[Path]], str, str] | None:
+    """
+    Find the latest plate sequence in the first plate folder (in order) that has one.
 
-    return best_prefix, ext, fmin, fmax, pad, [v[0] for v in vals]
+    Plate folders are scanned concurrently since each scan is dominated by
+    readdir/stat latency, but results are consumed in order so the outcome
+    matches a sequential search. Scans still pending once a hit is found
+    are cancelled, and the call returns only after running ones finish.
+
+    Args:
+        bg_dirs: Plate folders, most preferred first
+        shot: Shot name for filename matching
+
+    Returns:
+        Tuple of (scan_plate_seq result, version_string, plate_id) or None
+    """
+    if not bg_dirs:
+        return None
+    if len(bg_dirs) == 1:
+        found = find_latest_plate_under(bg_dirs[0], shot)
+        return (*found, bg_dirs[0].name) if found else None
+
+    with ThreadPoolExecutor(max_workers=min(PLATE_SEARCH_WORKERS, len(bg_dirs))) as ex:
+        futures = [(d.name, ex.submit(find_latest_plate_under, d, shot)) for d in bg_dirs]
+        try:
+            for plate, fut in futures:
+                found = fut.result()
+                if found:
+                    return (*found, plate)
+        finally:
+            # Drop scans that haven't started; leaving the with block then
+            # waits for the running ones, so none writes to the folder
+            # caches after this call (or a clear_cache()) has returned
+            for _plate, fut in futures:
+                fut.cancel()
+
+    return None
 
 
 def find_latest_plate(
@@ -418,16 +911,23 @@ def find_latest_plate(
         RuntimeError: If no plates found or user cancels selection
     """
     plate_root = PipelineConfig.get_plate_root(show, seq, shot)
-    if not plate_root.exists():
-        err(f"Plate root not found:\n{plate_root}")
+    cache_key = ("plate", plate_root, show, seq, shot, plate_id, prompt_on_ambiguity)
+    cached = _cached_result(cache_key)
+    if cached is not None:
+        return cached
+    _check_miss(cache_key)
+
+    if not cached_is_dir(plate_root):
+        _fail(cache_key, f"Plate root not found:\n{plate_root}")
 
     # Gather candidate plate folders
     bg_dirs: list[Path]
-    if plate_id and (plate_root / plate_id).exists():
+    prompted = False
+    if plate_id and cached_is_dir(plate_root / plate_id):
         bg_dirs = [plate_root / plate_id]
     else:
         # Get all plate directories and sort alphabetically for deterministic order
-        bg_dirs = sorted([d for d in plate_root.iterdir() if d.is_dir()])
+        bg_dirs = sorted(iter_subdirs(plate_root))
 
         # If multiple plates and no plate ID detected, prompt user
         if len(bg_dirs) > 1 and prompt_on_ambiguity:
@@ -438,6 +938,7 @@ def find_latest_plate(
             panel = nuke.Panel("Select Plate")
             panel.addEnumerationPulldown("Plate:", " ".join(choices))
             result = panel.show()
+            prompted = True
 
             if not result:
                 err("Plate selection cancelled by user.")
@@ -450,53 +951,24 @@ def find_latest_plate(
             if not bg_dirs:
                 err(f"Selected plate '{selected_plate}' not found.")
 
-    chosen: tuple[str, str, int, int, int, list[Path]] | None = None
-    chosen_v: str | None = None
-    chosen_bg: str | None = None
-
     # Find latest v### that has frames under .../exr/[WxH]/ or .../exr/
-    for bg_dir in bg_dirs:
-        vdirs = [
-            d for d in bg_dir.iterdir()
-            if d.is_dir() and re.match(r"v\d+$", d.name, re.IGNORECASE)
-        ]
-        vdirs.sort(key=lambda d: version_num(d.name), reverse=True)
-
-        for vdir in vdirs:
-            vnum = vdir.name[1:].zfill(3)
-            exr_dir = vdir / "exr"
-            if not exr_dir.exists():
-                continue
+    found = _find_latest_plate_in(bg_dirs, shot)
 
-            # 1) Directly in exr/
-            hit = scan_plate_seq(exr_dir, shot, vnum, plate_id=bg_dir.name)
-            if hit:
-                chosen = hit
-                chosen_v = vnum
-                chosen_bg = bg_dir.name
-                break
-
-            # 2) Subfolder like 4448x3096 inside exr/
-            for sd in [d for d in exr_dir.iterdir() if d.is_dir()]:
-                hit = scan_plate_seq(sd, shot, vnum, plate_id=bg_dir.name)
-                if hit:
-                    chosen = hit
-                    chosen_v = vnum
-                    chosen_bg = bg_dir.name
-                    break
-            if chosen:
-                break
-        if chosen:
-            break
-
-    if not chosen:
-        err("No plate sequences found under:\n" + str(plate_root))
+    if not found:
+        msg = "No plate sequences found under:\n" + str(plate_root)
+        # Only the plate picked in the dialog was searched; the next run asks again
+        if prompted:
+            err(msg)
+        _fail(cache_key, msg)
 
     # Unpack results
-    best_prefix, ext, fmin, fmax, pad, _files = chosen
+    (best_prefix, ext, fmin, fmax, pad, _files), chosen_v, chosen_bg = found
 
-    assert chosen_v is not None and chosen_bg is not None  # Set when chosen is set
-    return best_prefix, ext, fmin, fmax, pad, chosen_v, chosen_bg
+    plate_info = (best_prefix, ext, fmin, fmax, pad, chosen_v, chosen_bg)
+    # A plate picked in the dialog is not remembered, so re-running asks again
+    if not prompted:
+        _store_result(cache_key, plate_info)
+    return plate_info
 
 
 # ============================================================================
@@ -504,28 +976,76 @@ def find_latest_plate(
 # ============================================================================
 
 LD_TAIL_RX = re.compile(r'_LD_v(\d+)\.nk$', re.IGNORECASE)
+LD_MAX_SCORE = 6 + 3 + 1  # exact filename + turnover folder + plate token
 TURNOVER_RX_TMPL = r'^{plate}_{shot}_turnover-plate_{plate}_.+$'
 
 
-def path_has_dot_dir(p: Path, stop_at: Path) -> bool:
+@lru_cache(maxsize=256)
+def _ld_fname_rx(shot: str, plate: str) -> re.Pattern[str]:
     """
-    Check if any ancestor directory (between stop_at and p) contains a dot.
+    Build (and cache) the exact LD filename regex for a shot/plate pair.
 
     Args:
-        p: File path to check
-        stop_at: Directory to stop checking at
+        shot: Shot name
+        plate: Plate ID
 
     Returns:
-        True if any ancestor directory name contains a dot
+        Compiled pattern (use with fullmatch) for <shot>_mm_default_<plate>_LD_v###.nk
     """
-    cur = p.parent
-    while True:
-        if cur == stop_at or cur == stop_at.parent or cur == cur.parent:
-            break
-        if '.' in cur.name:
-            return True
-        cur = cur.parent
-    return False
+    return re.compile(
+        rf'{re.escape(shot)}_mm_default_{re.escape(plate)}_LD_v(\d+)\.nk',
+        re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=256)
+def _turnover_rx(shot: str, plate: str) -> re.Pattern[str]:
+    """
+    Build (and cache) the turnover folder-name regex for a shot/plate pair.
+
+    Args:
+        shot: Shot name
+        plate: Plate ID
+
+    Returns:
+        Compiled pattern matching <plate>_<shot>_turnover-plate_<plate>_...
+    """
+    return re.compile(
+        TURNOVER_RX_TMPL.format(plate=re.escape(plate), shot=re.escape(shot)),
+        re.IGNORECASE
+    )
+
+
+def _walk_nk(root: Path) -> Iterator[os.DirEntry[str]]:
+    """
+    Walk a directory tree for .nk files, pruning dot-named directories.
+
+    Directories whose name contains a dot (e.g. "IMG_1241.JPG/") are never
+    entered, so no yielded file can have such an ancestor below root.
+    Symlinked directories are not followed, matching Path.rglob().
+
+    Entries are yielded unstat'ed, so callers only pay for a stat on the
+    files they actually keep.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        DirEntry of each .nk file found below root
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if '.' not in entry.name:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".nk") and entry.is_file():
+                    yield entry
 
 
 def find_latest_ld_under(
@@ -536,6 +1056,8 @@ def find_latest_ld_under(
     """
     Find the latest lens distortion .nk file under a plate directory.
 
+    The walk stops at the first candidate that reaches LD_MAX_SCORE.
+
     Args:
         plate_dir: Plate directory to search
         shot: Shot name for filename matching
@@ -545,61 +1067,67 @@ def find_latest_ld_under(
         Tuple of (best_file_path, version_string) or (None, None)
     """
     nld = plate_dir / "nuke_lens_distortion"
-    if not nld.exists():
+    if not cached_is_dir(nld):
         return None, None
 
-    # Find version directories
-    vdirs = [
-        d for d in nld.iterdir()
-        if d.is_dir() and re.match(r'v\d+$', d.name, re.IGNORECASE)
-    ]
-    if not vdirs:
-        return None, None
-    vdirs.sort(key=lambda d: version_num(d.name), reverse=True)
-
-    # Precompile scoring regexes
-    fname_rx = re.compile(
-        rf'^{re.escape(shot)}_mm_default_{re.escape(plate)}_LD_v(\d+)\.nk$',
-        re.IGNORECASE
-    )
-    turnover_rx = re.compile(
-        TURNOVER_RX_TMPL.format(plate=re.escape(plate), shot=re.escape(shot)),
-        re.IGNORECASE
-    )
-    plate_rx_inline = re.compile(re.escape(plate), re.IGNORECASE)
+    # Scoring regexes (compiled once per shot/plate)
+    fname_rx = _ld_fname_rx(shot, plate)
+    turnover_rx = _turnover_rx(shot, plate)
+    # Plate IDs are plain alphanumeric tokens: a literal substring test
+    # on uppercased text replaces a case-insensitive regex search
+    plate_u = plate.upper()
+    # Every candidate sits below plate_dir (usually named after the plate),
+    # so when it holds the token the per-directory check can be skipped
+    plate_in_root = plate_u in os.fspath(plate_dir).upper()
 
     best: Path | None = None
     best_v: str | None = None
     best_score: int | None = None
     best_mtime: float | None = None
 
-    # Search latest versions first
-    for vdir in vdirs:
-        vnum = vdir.name[1:].zfill(3)
-
-        for p in vdir.rglob("*.nk"):
-            # Must end with _LD_v###.nk
-            if not LD_TAIL_RX.search(p.name):
-                continue
-
-            # Skip paths with dot directories
-            if path_has_dot_dir(p, vdir):
+    # Search latest versions first; older ones are only checked if needed
+    for n, vdir in iter_version_dirs(nld):
+        vnum = f"{n:03d}"
+
+        # The walker yields a directory's files together, so the folder-side
+        # part of the score is only recomputed when the directory changes
+        parent = ""
+        dir_score = 0
+        plate_in_parent = False
+
+        # Dot directories are pruned by the walker itself
+        for entry in _walk_nk(vdir):
+            name = entry.name
+            # An exact filename hit is an LD file by definition; anything
+            # else must still end with _LD_v###.nk
+            exact = fname_rx.fullmatch(name) is not None
+            if not exact and not LD_TAIL_RX.search(name):
                 continue
 
             # Score candidate
-            score = 0
-            if fname_rx.match(p.name):
-                score += 6
-            if turnover_rx.match(p.parent.name):
-                score += 3
-            if plate_rx_inline.search(str(p.parent)) or plate_rx_inline.search(p.name):
+            path = entry.path
+            dir_path = os.path.dirname(path)
+            if dir_path != parent:
+                parent = dir_path
+                dir_score = 3 if turnover_rx.match(os.path.basename(dir_path)) else 0
+                plate_in_parent = plate_in_root or plate_u in dir_path.upper()
+            score = dir_score
+            if exact:
+                # The exact name contains the plate token as well
+                score += 7
+            elif plate_in_parent or plate_u in name.upper():
                 score += 1
-
-            mtime = p.stat().st_mtime
+            # A lower score can never win, so it costs no stat
+            if best_score is not None and score < best_score:
+                continue
+            mtime = entry.stat().st_mtime
 
             # Higher score wins; newest mtime breaks ties
             if best is None or (score, mtime) > (best_score, best_mtime):
-                best, best_v, best_score, best_mtime = p, vnum, score, mtime
+                best, best_v, best_score, best_mtime = Path(path), vnum, score, mtime
+                # Nothing can outscore this; skip the rest of the walk
+                if score == LD_MAX_SCORE:
+                    break
 
         # Stop at first version that yields any acceptable candidate
         if best:
@@ -628,33 +1156,247 @@ def find_latest_ld(
         RuntimeError: If no LD files found
     """
     scene_root = PipelineConfig.get_ld_root(show, seq, shot, user)
-
-    # Build plate preference list
-    plate_candidates: list[str] = []
-
-    if plate_id:
-        plate_candidates.append(plate_id)
-
-    for _d, pid in collect_plate_dirs(scene_root):
-        if pid not in plate_candidates:
-            plate_candidates.append(pid)
-
-    if not plate_candidates:
-        err(f"No plate folders found under:\n{scene_root}")
-
-    # Search for LD file in order of plate preference
+    cache_key = ("ld", scene_root, show, seq, shot, user, plate_id)
+    cached = _cached_result(cache_key)
+    if cached is not None:
+        return cached
+    _check_miss(cache_key)
+
+    # The detected plate usually has an LD file, so scene_root is only
+    # listed for the other plate folders when it doesn't
     chosen_file: Path | None = None
     chosen_v: str | None = None
     chosen_plate: str | None = None
 
-    for pid in plate_candidates:
-        ld_file, vnum = find_latest_ld_under(scene_root / pid, shot, pid)
-        if ld_file:
-            chosen_file, chosen_v, chosen_plate = ld_file, vnum, pid
-            break
+    if plate_id:
+        chosen_file, chosen_v = find_latest_ld_under(scene_root / plate_id, shot, plate_id)
+        chosen_plate = plate_id
+
+    if not chosen_file:
+        other_plates = [pid for _d, pid in collect_plate_dirs(scene_root) if pid != plate_id]
+        if not plate_id and not other_plates:
+            _fail(cache_key, f"No plate folders found under:\n{scene_root}")
+
+        # Search the rest in folder order
+        for pid in other_plates:
+            ld_file, vnum = find_latest_ld_under(scene_root / pid, shot, pid)
+            if ld_file:
+                chosen_file, chosen_v, chosen_plate = ld_file, vnum, pid
+                break
 
     if not chosen_file:
-        err("No 3DE LD .nk found under any plate folder in:\n" + str(scene_root))
+        _fail(cache_key, "No 3DE LD .nk found under any plate folder in:\n" + str(scene_root))
 
     assert chosen_v is not None and chosen_plate is not None  # Set when chosen_file is set
+    _store_result(cache_key, (chosen_file, chosen_v, chosen_plate))
     return chosen_file, chosen_v, chosen_plate
+
+
+# ============================================================================
+# NODE BUILDING
+# ============================================================================
+
+def build_read(
+    name: str, hash_pattern: str, fmin: int, fmax: int, ext: str, reload: bool = True
+) -> nuke.Node:
+    """
+    Create a Read node for an image sequence.
+
+    Knobs every Read has go to the constructor in one call. The explicit
+    frame range means Nuke needs no concrete frame to detect it. EXRs are
+    read raw and tagged linear; other formats keep the project defaults.
+
+    Args:
+        name: Node name
+        hash_pattern: Sequence path with hash padding (e.g., "/path/plate.####.exr")
+        fmin: First frame
+        fmax: Last frame
+        ext: File extension without the dot
+        reload: Reload the node before returning; pass False to set more
+            knobs (e.g. the format) first and reload afterwards
+
+    Returns:
+        The created Read node
+    """
+    is_exr = ext.lower() == "exr"
+    knob_values: dict[str, Any] = {
+        "name": name,
+        "file": hash_pattern,
+        "first": fmin,
+        "last": fmax,
+        "origfirst": fmin,
+        "origlast": fmax,
+    }
+    if is_exr:
+        knob_values.update(file_type="exr", raw=True)
+    read = nuke.nodes.Read(**knob_values)
+
+    if is_exr:
+        # Optional like any other knob: the OCIO config may not offer "linear"
+        apply_knobs(read, {"colorspace": "linear"})
+
+    if reload:
+        try:
+            read["reload"].execute()
+        except Exception:
+            pass
+
+    return read
+
+
+def build_playblast_read(playblast: dict[str, Any], version: str, category: str) -> nuke.Node:
+    """
+    Create the Read node for a playblast found by find_latest_playblast().
+
+    Args:
+        playblast: Playblast info dict (type "sequence" or "movie")
+        version: Playblast version string (e.g., "003")
+        category: Playblast category (e.g., "Wireframe")
+
+    Returns:
+        The created Read node
+
+    Raises:
+        RuntimeError: If the playblast type is unknown
+    """
+    name = f"Read_playblast_{category}_v{version}"
+
+    if playblast["type"] == "sequence":
+        hash_pattern = f"{playblast['best_prefix']}.{'#' * playblast['pad']}.{playblast['ext']}"
+        return build_read(
+            name, hash_pattern, playblast["fmin"], playblast["fmax"], playblast["ext"]
+        )
+
+    if playblast["type"] == "movie":
+        read = nuke.nodes.Read(name=name)
+        read["file"].fromUserText(playblast["path"])
+        try:
+            read["reload"].execute()
+        except Exception:
+            pass
+        return read
+
+    err("Internal error: unknown playblast type.")
+
+
+def build_plate_read(
+    prefix: str, ext: str, fmin: int, fmax: int, pad: int, version: str, plate: str
+) -> nuke.Node:
+    """
+    Create the raw plate Read node for a plate found by find_latest_plate().
+
+    The arguments are find_latest_plate()'s result, in order.
+
+    Args:
+        prefix: Path prefix of the sequence (without frame number)
+        ext: File extension
+        fmin: First frame
+        fmax: Last frame
+        pad: Frame number padding
+        version: Plate version string (e.g., "002")
+        plate: Plate ID (e.g., "FG01")
+
+    Returns:
+        The created Read node
+    """
+    hash_pattern = f"{prefix}.{'#' * pad}.{ext}"
+    return build_read(f"Read_rawPlate_{plate}_v{version}", hash_pattern, fmin, fmax, ext)
+
+
+def build_transform(name: str, source: nuke.Node) -> nuke.Node:
+    """
+    Create the Transform that scales a playblast up to the plate's framing.
+
+    Args:
+        name: Node name
+        source: Node connected to input 0
+
+    Returns:
+        The created Transform node
+    """
+    transform = nuke.nodes.Transform(name=name, scale=1.1, center=[2156, 1152])
+    transform.setInput(0, source)
+    return transform
+
+
+def paste_ld_groups(ld_file: Path, count: int = 1) -> list[nuke.Node]:
+    """
+    Paste the LD .nk file count times, reading it only once.
+
+    The first paste comes from ld_file. For further copies its nodes are
+    copied to a local temp file that the remaining pastes use, so a slow
+    shot share is read a single time and the user's clipboard is left
+    untouched.
+
+    Args:
+        ld_file: Lens distortion .nk file to paste
+        count: Number of copies to create
+
+    Returns:
+        The primary Group/LiveGroup node of each paste, in paste order
+
+    Raises:
+        RuntimeError: If the pasted nodes contain no Group/LiveGroup
+    """
+    groups: list[nuke.Node] = []
+    copy_dir: str | None = None
+    source = str(ld_file)
+    try:
+        for i in range(count):
+            # Clear selection before paste
+            deselect_all()
+
+            nuke.nodePaste(source)
+            pasted = nuke.selectedNodes()
+
+            # The pasted nodes are still selected, so this copies all of them
+            if i == 0 and count > 1:
+                copy_dir = tempfile.mkdtemp(prefix="mm_ld_")
+                source = os.path.join(copy_dir, ld_file.name)
+                nuke.nodeCopy(source)
+
+            # Find the primary Group/LiveGroup
+            ld_group = next((n for n in pasted if n.Class() in ("Group", "LiveGroup")), None)
+            if not ld_group:
+                err(f"No Group/LiveGroup found in pasted LD file:\n{ld_file}")
+            groups.append(ld_group)
+    finally:
+        if copy_dir:
+            shutil.rmtree(copy_dir, ignore_errors=True)
+
+    return groups
+
+
+def build_write_tank(name: str, camera_element: str, source: nuke.Node) -> nuke.Node:
+    """
+    Create a WriteTank configured for a Camera Elements export.
+
+    Args:
+        name: Node name
+        camera_element: Value for the profile's camera_element knob (e.g., "lineupGeo")
+        source: Node connected to input 0
+
+    Returns:
+        The created WriteTank node
+
+    Raises:
+        RuntimeError: If the WriteTank node type is not available
+    """
+    # Check if WriteTank exists
+    try:
+        write_tank = nuke.nodes.WriteTank(name=name)
+    except Exception:
+        err("WriteTank node type not found.\nThis node requires Shotgun/Flow toolkit integration.")
+
+    write_tank.setInput(0, source)
+
+    # The profile creates the custom knobs, so it is set first
+    apply_knobs(write_tank, {
+        "profile_name": "Camera Elements",
+        "custom_knob_camera_element": camera_element,
+        "colorspace": "lin_sgamut3cine",
+        "file_type": "exr",
+        "channels": "rgb",
+    })
+
+    return write_tank
@@ -20,14 +20,21 @@ Usage:
     mm_geo_read.run()  # Creates Read node for latest geo render
 """
 
+import os
 import re
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import NoReturn
 
 import nuke
 
+from export_utils import build_read
 from pipeline_config import PipelineConfig
 
+# Names of Nuke formats seen so far; see _format_exists()
+_format_names_cache: set[str] = set()
+
 
 def _err(msg: str) -> NoReturn:
     """
@@ -84,8 +91,48 @@ def _version_num(vname: str) -> int:
         >>> _version_num("invalid")
         -1
     """
-    m = re.match(r"v(\d+)$", vname, re.IGNORECASE)
-    return int(m.group(1)) if m else -1
+    # Plain string checks: this runs for every entry in the renders root
+    if len(vname) < 2 or vname[0] not in "vV":
+        return -1
+    digits = vname[1:]
+    return int(digits) if digits.isascii() and digits.isdigit() else -1
+
+
+def _newest_first(vdirs: list[tuple[int, Path]]) -> Iterator[tuple[int, Path]]:
+    """
+    Yield (version_number, dir) pairs from newest to oldest.
+
+    The newest version usually has what we need, so it is found with max()
+    and the full sort only happens if the caller asks for the next one.
+
+    Args:
+        vdirs: Unsorted (version_number, dir) pairs
+
+    Yields:
+        The same pairs, highest version first
+    """
+    if not vdirs:
+        return
+    yield max(vdirs)
+    yield from sorted(vdirs, reverse=True)[1:]
+
+
+@lru_cache(maxsize=256)
+def _geo_seq_rx(shot: str, vnum: str) -> re.Pattern[str]:
+    """
+    Build (and cache) the render sequence regex for a shot/version pair.
+
+    Args:
+        shot: Shot name to match
+        vnum: Version number string
+
+    Returns:
+        Compiled pattern capturing (frame, extension)
+    """
+    return re.compile(
+        rf"^{re.escape(shot)}_scene_.+?_v{re.escape(vnum)}\.(\d+)\.([A-Za-z0-9]+)$",
+        re.IGNORECASE
+    )
 
 
 def _scan_seq(
@@ -100,7 +147,8 @@ def _scan_seq(
         <shot>_scene_<anything>_v<vvv>.<frame>.<ext>
 
     Groups files by prefix and extension, selecting the group with the most
-    files and newest modification time.
+    files and newest modification time. Frame range and padding are folded
+    in while scanning; files are stat'ed only when groups tie.
 
     Args:
         dir_path: Directory to scan for sequences
@@ -115,47 +163,75 @@ def _scan_seq(
         Result might be:
         ("/path/to/shot_scene_geoRender_v001", "exr", 1001, 1100, 4, [...])
     """
-    rx = re.compile(
-        rf"^{re.escape(shot)}_scene_.+?_v{re.escape(vnum)}\.(\d+)\.([A-Za-z0-9]+)$",
-        re.IGNORECASE
-    )
-    files: list[tuple[Path, int, int, str]] = []
+    rx = _geo_seq_rx(shot, vnum)
+    # Per (prefix_without_frame, ext): [min_frame, max_frame, max_pad] plus the frame paths
+    aggs: dict[tuple[str, str], list[int]] = {}
+    paths: dict[tuple[str, str], list[str]] = {}
 
-    if not dir_path.exists():
+    try:
+        it = os.scandir(dir_path)
+    except OSError:
         return None
 
-    for p in dir_path.iterdir():
-        if not p.is_file():
-            continue
-        m = rx.match(p.name)
-        if not m:
-            continue
-        frame_str, ext = m.group(1), m.group(2)
-        files.append((p, int(frame_str), len(frame_str), ext))
-
-    if not files:
+    with it:
+        for entry in it:
+            m = rx.match(entry.name)
+            if not m or not entry.is_file():
+                continue
+            frame_str, ext = m.group(1), m.group(2)
+            frame, pad = int(frame_str), len(frame_str)
+            # Prefix is the path up to the "." before the frame number
+            key = (entry.path[:len(entry.path) - len(entry.name) + m.start(1) - 1], ext.lower())
+            agg = aggs.get(key)
+            if agg is None:
+                aggs[key] = [frame, frame, pad]
+                paths[key] = [entry.path]
+                continue
+            if frame < agg[0]:
+                agg[0] = frame
+            elif frame > agg[1]:
+                agg[1] = frame
+            if pad > agg[2]:
+                agg[2] = pad
+            paths[key].append(entry.path)
+
+    if not aggs:
         return None
 
-    # Group by (prefix_without_frame, ext)
-    groups: dict[tuple[str, str], list[tuple[Path, int, int, str]]] = {}
-    for p, frame, pad, ext in files:
-        prefix = re.sub(r"\.\d+\.[A-Za-z0-9]+$", "", str(p))
-        groups.setdefault((prefix, ext.lower()), []).append((p, frame, pad, ext))
+    # Pick the largest group; only stat files when several tie on count
+    max_count = max(len(p) for p in paths.values())
+    top = [key for key, p in paths.items() if len(p) == max_count]
+    if len(top) == 1:
+        best = top[0]
+    else:
+        newest = {key: max(os.stat(p).st_mtime for p in paths[key]) for key in top}
+        best = max(top, key=newest.__getitem__)
+    best_prefix, ext = best
+    fmin, fmax, pad = aggs[best]
 
-    # Choose group with most files, then newest mtime
-    def group_key(kv: tuple[tuple[str, str], list[tuple[Path, int, int, str]]]) -> tuple[int, float]:
-        _, vals = kv
-        count = len(vals)
-        newest = max(v[0].stat().st_mtime for v in vals)
-        return (count, newest)
+    # Paths are only built for the chosen group
+    return best_prefix, ext, fmin, fmax, pad, [Path(p) for p in paths[best]]
 
-    (best_prefix, ext), vals = max(groups.items(), key=group_key)
-    frames = [v[1] for v in vals]
-    pads = [v[2] for v in vals]
-    fmin, fmax = min(frames), max(frames)
-    pad = max(pads)
 
-    return best_prefix, ext, fmin, fmax, pad, [v[0] for v in vals]
+def _format_exists(fmt_name: str) -> bool:
+    """
+    Check whether a format name is registered in Nuke.
+
+    Known names are cached at module level, so repeated hits don't call
+    format.name() for every registered format. A miss re-reads
+    nuke.formats() once in case the format was added elsewhere.
+
+    Args:
+        fmt_name: Format name to look up
+
+    Returns:
+        True if Nuke knows a format with this name
+    """
+    if fmt_name in _format_names_cache:
+        return True
+    _format_names_cache.clear()
+    _format_names_cache.update(f.name() for f in nuke.formats())
+    return fmt_name in _format_names_cache
 
 
 def _maybe_set_format_from_res(read_node: nuke.Node, seq_dir: Path) -> None:
@@ -175,8 +251,10 @@ def _maybe_set_format_from_res(read_node: nuke.Node, seq_dir: Path) -> None:
     """
     def wh(name: str | None) -> tuple[int | None, int | None]:
         """Extract width and height from string like '4096x2268'."""
-        m = re.match(r"^(\d+)x(\d+)$", name or "")
-        return (int(m.group(1)), int(m.group(2))) if m else (None, None)
+        w_str, sep, h_str = (name or "").partition("x")
+        if sep and (w_str + h_str).isascii() and w_str.isdigit() and h_str.isdigit():
+            return int(w_str), int(h_str)
+        return None, None
 
     w, h = wh(seq_dir.name)
     if not w and seq_dir.parent:
@@ -186,8 +264,9 @@ def _maybe_set_format_from_res(read_node: nuke.Node, seq_dir: Path) -> None:
         fmt_name = f"{w}x{h}_from_geo"
         try:
             # Create format if it doesn't exist
-            if not any(f.name() == fmt_name for f in nuke.formats()):
+            if not _format_exists(fmt_name):
                 nuke.addFormat(f"{w} {h} 0 0 {w} {h} 1 {fmt_name}")
+                _format_names_cache.add(fmt_name)
             read_node["format"].setValue(fmt_name)
         except Exception:
             # Fallback: set format directly
@@ -226,7 +305,7 @@ def create_latest_geo_read_hash() -> nuke.Node:
 
     # Parse context from path
     try:
-        context = PipelineConfig.parse_show_shot_from_path(Path(nk_path))
+        context = PipelineConfig.parse_show_shot_from_path(nk_path)
         show = context['show']
         seq = context['seq']
         shot = context['shot']
@@ -240,27 +319,28 @@ def create_latest_geo_read_hash() -> nuke.Node:
         _err(f"Renders root not found:\n{renders_root}")
 
     # Find version directories (latest first)
-    vdirs = [
-        d for d in renders_root.iterdir()
-        if d.is_dir() and re.match(r"v\d+$", d.name, re.IGNORECASE)
-    ]
+    with os.scandir(renders_root) as it:
+        vdirs = [
+            (n, Path(e.path)) for e in it
+            if (n := _version_num(e.name)) >= 0 and e.is_dir()
+        ]
     if not vdirs:
         _err(f"No version folders under:\n{renders_root}")
-    vdirs.sort(key=lambda d: _version_num(d.name), reverse=True)
 
     chosen: tuple[str, str, int, int, int, list[Path]] | None = None
     chosen_v: str | None = None
     seq_dir_for_format: Path | None = None
 
     # Search latest versions first
-    for vdir in vdirs:
+    for _n, vdir in _newest_first(vdirs):
         vnum = vdir.name[1:].zfill(3)
 
         # Collect any subdirectory starting with "geo"
-        geo_dirs = [
-            d for d in vdir.iterdir()
-            if d.is_dir() and d.name.lower().startswith("geo")
-        ]
+        with os.scandir(vdir) as it:
+            geo_dirs = [
+                Path(e.path) for e in it
+                if e.name.lower().startswith("geo") and e.is_dir()
+            ]
         if not geo_dirs:
             continue
 
@@ -275,7 +355,9 @@ def create_latest_geo_read_hash() -> nuke.Node:
         # 2) If not found, scan subfolders (e.g., 4096x2268)
         if not found:
             for gdir in geo_dirs:
-                for sd in [d for d in gdir.iterdir() if d.is_dir()]:
+                with os.scandir(gdir) as it:
+                    sub_dirs = [Path(e.path) for e in it if e.is_dir()]
+                for sd in sub_dirs:
                     hit = _scan_seq(sd, shot, vnum)
                     if hit:
                         found = (sd, hit)
@@ -295,34 +377,8 @@ def create_latest_geo_read_hash() -> nuke.Node:
     best_prefix, ext, fmin, fmax, pad, _files = chosen
     hashes = "#" * pad
     hash_pattern = f"{best_prefix}.{hashes}.{ext}"
-    first_frame_path = f"{best_prefix}.{str(fmin).zfill(pad)}.{ext}"
-
-    # Create Read node
-    r = nuke.nodes.Read()
-    r["name"].setValue(f"Read_geoRender_v{chosen_v}")
-
-    # Load concrete frame first, then swap to #### for sequence detection
-    r["file"].fromUserText(first_frame_path)
-    r["file"].fromUserText(hash_pattern)
-
-    # Set EXR-specific settings
-    if ext.lower() == "exr":
-        for k, v in (("file_type", "exr"), ("colorspace", "linear")):
-            try:
-                r[k].setValue(v)
-            except Exception:
-                pass
-        try:
-            r["raw"].setValue(True)
-        except Exception:
-            pass
 
-    # Set frame range
-    for knob, val in (("first", fmin), ("last", fmax), ("origfirst", fmin), ("origlast", fmax)):
-        try:
-            r[knob].setValue(int(val))
-        except Exception:
-            pass
+    r = build_read(f"Read_geoRender_v{chosen_v}", hash_pattern, fmin, fmax, ext, reload=False)
 
     # Auto-detect format from folder name
     if seq_dir_for_format:
@@ -33,17 +33,30 @@ Usage:
 
 import os
 import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import NoReturn
 
 import nuke
 
+from export_utils import clear_cache, find_latest_ld_under, split_nk_path
 from pipeline_config import PipelineConfig
 
 # Regex patterns
 PLATE_RX = re.compile(r'\b([A-Z]{2}\d{2})\b', re.IGNORECASE)  # FG01 / BG01 / MG01 ...
-LD_TAIL_RX = re.compile(r'_LD_v(\d+)\.nk$', re.IGNORECASE)
-TURNOVER_RX_TMPL = r'^{plate}_{shot}_turnover-plate_{plate}_.+$'  # folder name pattern
+# Plate ID in a Read file path: /plate/(input|output)_plate/<ID>/ in the
+# directories, or _plate_<ID>_ in the filename (lookahead keeps it out of
+# directory names). The directory form always sits left of the filename, so
+# leftmost-match order preserves the "path before filename" preference.
+READ_PLATE_RX = re.compile(
+    r'/plate/(?:input_plate|output_plate)/([A-Z]{2}\d{2})/|_plate_([A-Z]{2}\d{2})_(?=[^/]*$)',
+    re.IGNORECASE
+)
+
+# Upper bound on plate folders scanned concurrently
+LD_SEARCH_WORKERS = 8
 
 
 def _err(msg: str) -> NoReturn:
@@ -60,37 +73,6 @@ def _err(msg: str) -> NoReturn:
     raise RuntimeError(msg)
 
 
-def _idx(parts: tuple[str, ...], name: str) -> int:
-    """
-    Find index of a string in a tuple, returning -1 if not found.
-
-    Args:
-        parts: Tuple of strings to search
-        name: String to find
-
-    Returns:
-        Index of name in parts, or -1 if not found
-    """
-    try:
-        return parts.index(name)
-    except ValueError:
-        return -1
-
-
-def _vnum(s: str) -> int:
-    """
-    Extract version number from version string.
-
-    Args:
-        s: Version string (e.g., "v001", "V123")
-
-    Returns:
-        Version number as integer, or -1 if invalid format
-    """
-    m = re.match(r'v(\d+)$', s, re.IGNORECASE)
-    return int(m.group(1)) if m else -1
-
-
 def _detect_plate_from_reads() -> str | None:
     """
     Detect plate ID from existing Read nodes in the current Nuke script.
@@ -107,21 +89,21 @@ def _detect_plate_from_reads() -> str | None:
         Read node with file: "/shows/demo/.../plate/input_plate/FG01/..."
         Returns: "FG01"
     """
+    search = READ_PLATE_RX.search
     for r in nuke.allNodes('Read'):
         try:
             p = r['file'].value()
         except Exception:
             continue
 
-        # Check path for /plate/input_plate/<ID>/ or /plate/output_plate/<ID>/
-        m = re.search(r'/plate/(?:input_plate|output_plate)/([A-Za-z]{2}\d{2})/', p, re.IGNORECASE)
-        if m:
-            return m.group(1).upper()
+        # Template scripts often carry Reads with an empty file knob
+        if not p:
+            continue
 
-        # Check filename for _plate_<ID>_
-        m = re.search(r'_plate_([A-Za-z]{2}\d{2})_', os.path.basename(p), re.IGNORECASE)
+        # Single search covers both the path and the filename forms
+        m = search(p)
         if m:
-            return m.group(1).upper()
+            return (m.group(1) or m.group(2)).upper()
 
     return None
 
@@ -133,7 +115,7 @@ def _detect_plate_from_nkpath(parts: tuple[str, ...]) -> str | None:
     Searches for patterns like FG01, BG01, MG01 in the path.
 
     Args:
-        parts: Path components from Path.parts
+        parts: Path segments, e.g. from split_nk_path
 
     Returns:
         Plate ID in uppercase (e.g., "FG01") or None if not found
@@ -149,154 +131,102 @@ def _detect_plate_from_nkpath(parts: tuple[str, ...]) -> str | None:
     return None
 
 
-def _collect_plate_dirs(scene_root: Path) -> list[tuple[Path, str]]:
+@lru_cache(maxsize=8)
+def _scan_plate_dirs(scene_root: str, _mtime_ns: int) -> tuple[tuple[Path, str], ...]:
     """
-    Collect plate directories from scene root.
+    Scan scene root for plate directories (cached).
 
-    Scans scene root for subdirectories matching plate ID pattern (e.g., FG01, BG01).
+    The mtime argument only serves as part of the cache key: adding or
+    removing a plate folder changes the directory's mtime and forces a
+    rescan.
 
     Args:
-        scene_root: Root directory to scan (typically .../exports/scene/)
+        scene_root: Root directory to scan
+        _mtime_ns: Modification time of scene_root in nanoseconds
 
     Returns:
-        List of tuples: (plate_directory_path, plate_id_uppercase)
-
-    Example:
-        scene_root contains: FG01/, BG01/, MG02/
-        Returns: [(Path('.../FG01'), 'FG01'), (Path('.../BG01'), 'BG01'), ...]
+        Tuple of (plate_directory_path, plate_id_uppercase) pairs
     """
     out: list[tuple[Path, str]] = []
-    if not scene_root.exists():
-        return out
+    with os.scandir(scene_root) as it:
+        for entry in it:
+            m = PLATE_RX.fullmatch(entry.name)
+            if m and entry.is_dir():
+                out.append((Path(entry.path), m.group(1).upper()))
+    return tuple(out)
 
-    for d in scene_root.iterdir():
-        if d.is_dir():
-            m = PLATE_RX.fullmatch(d.name)
-            if m:
-                out.append((d, m.group(1).upper()))
 
-    return out
-
-
-def _path_has_dot_dir(p: Path, stop_at: Path) -> bool:
+def _collect_plate_dirs(scene_root: Path) -> list[tuple[Path, str]]:
     """
-    Check if any ancestor directory (between stop_at and p) contains a dot.
+    Collect plate directories from scene root.
 
-    This helps skip spurious files in folders like "IMG_1241.JPG/".
+    Scans scene root for subdirectories matching plate ID pattern (e.g., FG01, BG01).
+    Results are reused across runs until scene_root's mtime changes, so
+    repeated hotkey presses cost a single stat.
 
     Args:
-        p: File path to check
-        stop_at: Directory to stop checking at
+        scene_root: Root directory to scan (typically .../exports/scene/)
 
     Returns:
-        True if any ancestor directory name contains a dot
+        List of tuples: (plate_directory_path, plate_id_uppercase)
 
     Example:
-        p = Path("/path/IMG_1241.JPG/subdir/file.nk")
-        stop_at = Path("/path")
-        Returns: True (IMG_1241.JPG contains dot)
+        scene_root contains: FG01/, BG01/, MG02/
+        Returns: [(Path('.../FG01'), 'FG01'), (Path('.../BG01'), 'BG01'), ...]
     """
-    cur = p.parent
-    while True:
-        if cur == stop_at or cur == stop_at.parent or cur == cur.parent:
-            break
-        if '.' in cur.name:
-            return True
-        cur = cur.parent
-    return False
+    try:
+        st = os.stat(scene_root)
+    except OSError:
+        return []
+    if not stat.S_ISDIR(st.st_mode):
+        return []
+
+    return list(_scan_plate_dirs(os.fspath(scene_root), st.st_mtime_ns))
 
 
-def _find_latest_ld_under(
-    plate_dir: Path,
+def _find_latest_ld_for_plates(
+    scene_root: Path,
     shot: str,
-    plate: str
-) -> tuple[Path | None, str | None]:
+    plate_candidates: list[str]
+) -> tuple[Path | None, str | None, str | None]:
     """
-    Find the latest lens distortion .nk file under a plate directory.
+    Find the latest LD file for the first plate (in preference order) that has one.
 
-    Searches plate_dir/nuke_lens_distortion/v###/** for *_LD_v###.nk files.
-    Uses a scoring system to rank candidates:
-        +6: Filename exactly matches <SHOT>_mm_default_<PLATE>_LD_v###.nk
-        +3: Parent folder matches turnover context pattern
-        +1: Path contains plate token
-        -∞: Path contains directory with dot in name (skipped)
-
-    Picks highest scoring candidate from the latest version directory,
-    using newest mtime as tiebreaker.
+    Plate folders are scanned concurrently since each scan is dominated by
+    readdir/stat latency, but results are consumed in preference order so the
+    outcome matches a sequential search. Scans still pending once a hit is
+    found are cancelled, and the call returns only after running ones finish.
 
     Args:
-        plate_dir: Plate directory to search (e.g., .../scene/FG01/)
+        scene_root: LD scene root containing <PLATE>/ folders
         shot: Shot name for filename matching
-        plate: Plate ID for filename matching
+        plate_candidates: Plate IDs, most preferred first
 
     Returns:
-        Tuple of (best_file_path, version_string) or (None, None) if not found
-
-    Example:
-        Returns: (Path(".../v003/FG01_shot_LD_v003.nk"), "003")
+        Tuple of (ld_file, version_string, plate_id) or (None, None, None)
     """
-    nld = plate_dir / "nuke_lens_distortion"
-    if not nld.exists():
-        return None, None
-
-    # Find version directories
-    vdirs = [
-        d for d in nld.iterdir()
-        if d.is_dir() and re.match(r'v\d+$', d.name, re.IGNORECASE)
-    ]
-    if not vdirs:
-        return None, None
-    vdirs.sort(key=lambda d: _vnum(d.name), reverse=True)
-
-    # Precompile scoring regexes
-    fname_rx = re.compile(
-        rf'^{re.escape(shot)}_mm_default_{re.escape(plate)}_LD_v(\d+)\.nk$',
-        re.IGNORECASE
-    )
-    turnover_rx = re.compile(
-        TURNOVER_RX_TMPL.format(plate=re.escape(plate), shot=re.escape(shot)),
-        re.IGNORECASE
-    )
-    plate_rx_inline = re.compile(re.escape(plate), re.IGNORECASE)
-
-    best: Path | None = None
-    best_v: str | None = None
-    best_score: int | None = None
-    best_mtime: float | None = None
-
-    # Search latest versions first
-    for vdir in vdirs:
-        vnum = vdir.name[1:].zfill(3)
-
-        for p in vdir.rglob("*.nk"):
-            # Must end with _LD_v###.nk
-            if not LD_TAIL_RX.search(p.name):
-                continue
-
-            # Skip paths with dot directories (e.g., IMG_1241.JPG/)
-            if _path_has_dot_dir(p, vdir):
-                continue
-
-            # Score candidate
-            score = 0
-            if fname_rx.match(p.name):
-                score += 6
-            if turnover_rx.match(p.parent.name):
-                score += 3
-            if plate_rx_inline.search(str(p.parent)) or plate_rx_inline.search(p.name):
-                score += 1
-
-            mtime = p.stat().st_mtime
-
-            # Higher score wins; newest mtime breaks ties
-            if best is None or (score, mtime) > (best_score, best_mtime):
-                best, best_v, best_score, best_mtime = p, vnum, score, mtime
-
-        # Stop at first version that yields any acceptable candidate
-        if best:
-            break
+    if len(plate_candidates) == 1:
+        pid = plate_candidates[0]
+        ld_file, vnum = find_latest_ld_under(scene_root / pid, shot, pid)
+        return (ld_file, vnum, pid) if ld_file else (None, None, None)
+
+    with ThreadPoolExecutor(max_workers=min(LD_SEARCH_WORKERS, len(plate_candidates))) as ex:
+        futures = [
+            (pid, ex.submit(find_latest_ld_under, scene_root / pid, shot, pid))
+            for pid in plate_candidates
+        ]
+        try:
+            for pid, fut in futures:
+                ld_file, vnum = fut.result()
+                if ld_file:
+                    return ld_file, vnum, pid
+        finally:
+            # Drop scans that haven't started; leaving the with block then
+            # waits for the running ones, so none outlives this call
+            for _pid, fut in futures:
+                fut.cancel()
 
-    return best, best_v
+    return None, None, None
 
 
 def import_latest_ld_nk() -> list[nuke.Node]:
@@ -338,17 +268,15 @@ def import_latest_ld_nk() -> list[nuke.Node]:
     if not nk_path or nk_path == "Root":
         _err("Please save the Nuke script first so I can infer the shot path.")
 
-    parts = Path(nk_path).parts
-    i_shows = _idx(parts, "shows")
-    i_shots = _idx(parts, "shots")
-    i_user = _idx(parts, "user")
-    if min(i_shows, i_shots, i_user) < 0:
-        _err("Couldn't parse show/shot/user from path.\nExpected /shows/<show>/shots/<seq>/<shot>/user/<user>/...")
-
-    show = parts[i_shows+1]
-    seq = parts[i_shots+1]
-    shot = parts[i_shots+2]
-    user = parts[i_user+1]
+    # Parse context from path
+    try:
+        context = PipelineConfig.parse_show_shot_from_path(nk_path)
+        show = context['show']
+        seq = context['seq']
+        shot = context['shot']
+        user = context['user']
+    except ValueError as e:
+        _err(str(e))
 
     # Get LD root using config
     scene_root = PipelineConfig.get_ld_root(show, seq, shot, user)
@@ -360,27 +288,28 @@ def import_latest_ld_nk() -> list[nuke.Node]:
     if p_from_reads:
         plate_candidates.append(p_from_reads)
 
-    p_from_nk = _detect_plate_from_nkpath(tuple(s.lower() for s in parts))
+    p_from_nk = _detect_plate_from_nkpath(split_nk_path(nk_path))
     if p_from_nk and p_from_nk not in plate_candidates:
         plate_candidates.append(p_from_nk)
 
-    for _d, pid in _collect_plate_dirs(scene_root):
-        if pid not in plate_candidates:
-            plate_candidates.append(pid)
-
-    if not plate_candidates:
-        _err(f"No plate folders found under:\n{scene_root}")
+    # Search for LD file in order of plate preference. A detected plate
+    # usually has one, so scene_root is only listed when none of them does.
+    chosen_file, chosen_v, chosen_plate = None, None, None
+    if plate_candidates:
+        chosen_file, chosen_v, chosen_plate = _find_latest_ld_for_plates(
+            scene_root, shot, plate_candidates
+        )
 
-    # Search for LD file in order of plate preference
-    chosen_file: Path | None = None
-    chosen_v: str | None = None
-    chosen_plate: str | None = None
-
-    for pid in plate_candidates:
-        ld_file, vnum = _find_latest_ld_under(scene_root / pid, shot, pid)
-        if ld_file:
-            chosen_file, chosen_v, chosen_plate = ld_file, vnum, pid
-            break
+    if not chosen_file:
+        other_plates = [
+            pid for _d, pid in _collect_plate_dirs(scene_root) if pid not in plate_candidates
+        ]
+        if not plate_candidates and not other_plates:
+            _err(f"No plate folders found under:\n{scene_root}")
+        if other_plates:
+            chosen_file, chosen_v, chosen_plate = _find_latest_ld_for_plates(
+                scene_root, shot, other_plates
+            )
 
     if not chosen_file:
         _err("No 3DE LD .nk found under any plate folder in:\n" + str(scene_root))
@@ -389,8 +318,8 @@ def import_latest_ld_nk() -> list[nuke.Node]:
     selected_before_paste = nuke.selectedNodes()
     source_node: nuke.Node | None = selected_before_paste[0] if selected_before_paste else None
 
-    # Paste into the graph
-    for n in nuke.selectedNodes():
+    # Paste into the graph; the saved list is exactly what needs deselecting
+    for n in selected_before_paste:
         n.setSelected(False)
 
     nuke.nodePaste(str(chosen_file))
@@ -438,4 +367,8 @@ def run() -> list[nuke.Node]:
         import mm_ld_import
         mm_ld_import.run()
     """
+    # Folder searches are cached for a short while; set MM_FORCE_REFRESH to
+    # pick up versions published since the last run
+    if os.environ.get("MM_FORCE_REFRESH"):
+        clear_cache()
     return import_latest_ld_nk()
@@ -23,14 +23,30 @@ Usage:
     mm_plate_read.run()  # Creates Read node for latest plate
 """
 
+import os
 import re
+from collections.abc import Collection, Iterator
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import NoReturn
 
 import nuke
 
+from export_utils import build_read
 from pipeline_config import PipelineConfig
 
+# Regex patterns
+NON_ALNUM_RX = re.compile(r"[^A-Za-z0-9]+")  # filename token separators
+RES_RX = re.compile(r"^(\d+)x(\d+)$")  # 4448x3096 folder names
+
+# Names of Nuke formats seen so far; see _format_exists()
+_format_names_cache: set[str] = set()
+
+# (width, height) of resolution folders -> format name already registered
+_res_format_cache: dict[tuple[int, int], str] = {}
+
 
 def _err(msg: str) -> NoReturn:
     """
@@ -46,21 +62,23 @@ def _err(msg: str) -> NoReturn:
     raise RuntimeError(msg)
 
 
-def _find_index(parts: tuple[str, ...], name: str) -> int:
+def _index_map(parts: tuple[str, ...]) -> dict[str, int]:
     """
-    Find index of a string in a tuple, returning -1 if not found.
+    Map each path segment to the index of its first occurrence.
+
+    One pass over the parts, after which every anchor lookup is a dict get
+    instead of another tuple.index() scan.
 
     Args:
-        parts: Tuple of strings to search
-        name: String to find
+        parts: Path segments
 
     Returns:
-        Index of name in parts, or -1 if not found
+        Dictionary of segment -> first index
     """
-    try:
-        return parts.index(name)
-    except ValueError:
-        return -1
+    idx: dict[str, int] = {}
+    for i, name in enumerate(parts):
+        idx.setdefault(name, i)
+    return idx
 
 
 def _version_num(vname: str) -> int:
@@ -73,8 +91,11 @@ def _version_num(vname: str) -> int:
     Returns:
         Version number as integer, or -1 if invalid format
     """
-    m = re.match(r"v(\d+)$", vname, re.IGNORECASE)
-    return int(m.group(1)) if m else -1
+    # Plain string checks: this runs for every entry in a version listing
+    if len(vname) < 2 or vname[0] not in "vV":
+        return -1
+    digits = vname[1:]
+    return int(digits) if digits.isascii() and digits.isdigit() else -1
 
 
 def _norm_plate_token(tok: str) -> str | None:
@@ -100,15 +121,16 @@ def _norm_plate_token(tok: str) -> str | None:
         >>> _norm_plate_token("invalid")
         None
     """
-    m = re.match(r"^([A-Za-z]{2})(\d{1,2})$", tok)
-    if not m:
+    # Plain string checks: this runs for every filename token and path segment
+    if not 3 <= len(tok) <= 4:
+        return None
+    letters, digits = tok[:2], tok[2:]
+    if not (letters.isascii() and letters.isalpha() and digits.isascii() and digits.isdigit()):
         return None
-    letters = m.group(1).upper()
-    digits = f"{int(m.group(2)):02d}"
-    return f"{letters}{digits}"
+    return f"{letters.upper()}{digits.zfill(2)}"
 
 
-def _candidate_plate_ids_from_path(nk_path: Path) -> list[str]:
+def _candidate_plate_ids_from_path(nk_path: str | Path) -> list[str]:
     """
     Extract potential plate IDs from Nuke script path and filename.
 
@@ -117,7 +139,7 @@ def _candidate_plate_ids_from_path(nk_path: Path) -> list[str]:
     2. Directory path segments
 
     Args:
-        nk_path: Path to Nuke script file
+        nk_path: Path to Nuke script file, as a string or Path
 
     Returns:
         List of normalized plate IDs found (deduplicated, order preserved)
@@ -126,53 +148,35 @@ def _candidate_plate_ids_from_path(nk_path: Path) -> list[str]:
         For path: .../scene/FG01/DM_066_FG01_v001.nk
         Returns: ['FG01']
     """
-    cands: list[str] = []
-
-    # 1) From filename tokens (split on non-alnum)
-    stem = nk_path.stem
-    for tok in re.split(r"[^A-Za-z0-9]+", stem):
-        norm = _norm_plate_token(tok) if tok else None
-        if norm:
-            cands.append(norm)
-
-    # 2) From directory segments
-    for seg in nk_path.parts:
-        norm = _norm_plate_token(seg)
-        if norm:
-            cands.append(norm)
-
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    out: list[str] = []
-    for t in cands:
-        if t not in seen:
-            seen.add(t)
-            out.append(t)
-
-    return out
-
-
-def _detect_plate_id(nk_path: Path, plate_root: Path) -> str | None:
+    # Plain string splits; Path.stem/.parts would parse the path first
+    parts = os.fspath(nk_path).split("/")
+    name = parts[-1]
+    head, dot, _ext = name.rpartition(".")
+    stem = head if dot and head else name
+    # Filename tokens, then directory segments, in one pass. Dict keys drop
+    # repeats while keeping each ID at its first position.
+    tokens = chain(NON_ALNUM_RX.split(stem), parts)
+    return list(dict.fromkeys(norm for tok in tokens if (norm := _norm_plate_token(tok))))
+
+
+def _detect_plate_id(nk_path: str | Path, plate_names: Collection[str]) -> str | None:
     """
     Detect the most appropriate plate ID for this shot.
 
-    Tries to match candidate plate IDs from the path against actual
-    directories that exist under plate_root. If multiple candidates
+    Tries to match candidate plate IDs from the path against the plate
+    folders that exist under the plate root. If multiple candidates
     exist, prefers the first one that has a matching folder.
 
     Args:
         nk_path: Path to current Nuke script
-        plate_root: Root directory containing plate ID folders
+        plate_names: Names of the plate ID folders under the plate root
 
     Returns:
         Detected plate ID (e.g., "FG01") or None if none found
 
     Example:
-        >>> _detect_plate_id(
-        ...     Path("/shows/demo/.../FG01_v001.nk"),
-        ...     Path("/shows/demo/.../plate/input_plate")
-        ... )
-        'FG01'  # if /shows/demo/.../plate/input_plate/FG01 exists
+        >>> _detect_plate_id(Path("/shows/demo/.../FG01_v001.nk"), {"BG01", "FG01"})
+        'FG01'
     """
     cands = _candidate_plate_ids_from_path(nk_path)
     if not cands:
@@ -180,19 +184,95 @@ def _detect_plate_id(nk_path: Path, plate_root: Path) -> str | None:
 
     # Prefer candidate that exists on disk
     for c in cands:
-        if (plate_root / c).exists():
+        if c in plate_names:
             return c
 
     # Fallback to first detected token
     return cands[0]
 
 
+def _subdirs(dir_path: Path) -> list[Path]:
+    """
+    List the subdirectories of a directory.
+
+    Uses the d_type reported by readdir, so no per-entry stat is needed on
+    most filesystems. A missing or unreadable directory yields an empty list,
+    which lets callers skip a separate exists() probe.
+
+    Args:
+        dir_path: Directory to list
+
+    Returns:
+        Paths of the subdirectories (in directory order)
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return [Path(e.path) for e in it if e.is_dir()]
+    except OSError:
+        return []
+
+
+def _iter_candidate_dirs(bg_dir: Path) -> Iterator[tuple[str, Path, list[str]]]:
+    """
+    Yield the directories that may hold a plate's frames, in search order.
+
+    Versions are visited newest first. For each one, os.walk() yields
+    v###/exr/ before its subfolders (e.g. exr/4448x3096/) and is pruned
+    below that level. Every folder is listed once, and its file names are
+    handed on so the caller can match them without listing it again.
+    Subfolders are only listed if the caller keeps iterating past exr/.
+
+    Args:
+        bg_dir: Plate folder (e.g., .../input_plate/FG01/)
+
+    Yields:
+        Tuples of (version_string, directory, file_names_in_directory)
+    """
+    # Parse each version number once, then sort on the ints alone
+    vdirs = [(n, d) for d in _subdirs(bg_dir) if (n := _version_num(d.name)) >= 0]
+    vdirs.sort(key=itemgetter(0), reverse=True)
+
+    for _n, vdir in vdirs:
+        vnum = vdir.name[1:].zfill(3)
+        exr_dir = str(vdir / "exr")
+        # A missing exr/ yields nothing. Pruning at depth 1 makes following
+        # symlinked resolution folders safe, as the old is_dir() check did.
+        for dirpath, dirnames, filenames in os.walk(exr_dir, followlinks=True):
+            if dirpath != exr_dir:
+                dirnames.clear()
+            yield vnum, Path(dirpath), filenames
+
+
+@lru_cache(maxsize=128)
+def _plate_seq_rx(shot: str, vnum: str, plate_id: str | None) -> re.Pattern[str]:
+    """
+    Build (and cache) the plate sequence regex for a shot/version/plate triple.
+
+    Args:
+        shot: Shot name to match
+        vnum: Version number string (e.g., "001")
+        plate_id: Plate ID to match or None for wildcard
+
+    Returns:
+        Compiled pattern capturing (frame, ext)
+    """
+    # Greedy ".+", as in export_utils: it backtracks from the short tail
+    if plate_id:
+        return re.compile(
+            rf"^{re.escape(shot)}_turnover-plate_{re.escape(plate_id)}_.+_v{re.escape(vnum)}\.(\d+)\.([A-Za-z0-9]+)$"
+        )
+    return re.compile(
+        rf"^{re.escape(shot)}_turnover-plate_[A-Za-z0-9]+_.+_v{re.escape(vnum)}\.(\d+)\.([A-Za-z0-9]+)$"
+    )
+
+
 def _scan_seq(
     dir_path: Path,
     shot: str,
     vnum: str,
-    plate_id: str | None
-) -> tuple[str, str, int, int, int, list[Path]] | None:
+    plate_id: str | None,
+    file_names: Collection[str] | None = None
+) -> tuple[str, str, int, int, int] | None:
     """
     Scan directory for plate image sequences matching shot, version, and plate ID.
 
@@ -202,66 +282,100 @@ def _scan_seq(
     If plate_id is None, wildcards any plate ID (less specific matching).
 
     Groups files by prefix and extension, selecting the group with the most
-    files and newest modification time.
+    files and newest modification time. Only a running count, frame range
+    and padding are kept per group; files are stat'ed only when groups tie.
 
     Args:
         dir_path: Directory to scan for sequences
         shot: Shot name to match in filenames
         vnum: Version number string (e.g., "001")
         plate_id: Plate ID to match (e.g., "FG01") or None for wildcard
+        file_names: Names of the files in dir_path, if already listed (e.g.,
+            by os.walk); the directory is listed here otherwise
 
     Returns:
-        Tuple of (prefix_path, extension, min_frame, max_frame, padding, file_list)
+        Tuple of (prefix_path, extension, min_frame, max_frame, padding)
         or None if no matching sequences found
 
     Example:
         Result might be:
-        ("/path/to/shot_turnover-plate_FG01_linear_v001", "exr", 1001, 1100, 4, [...])
+        ("/path/to/shot_turnover-plate_FG01_linear_v001", "exr", 1001, 1100, 4)
     """
-    if plate_id:
-        rx = re.compile(
-            rf"^{re.escape(shot)}_turnover-plate_{re.escape(plate_id)}_.+?_v{re.escape(vnum)}\.(\d+)\.([A-Za-z0-9]+)$"
-        )
-    else:
-        rx = re.compile(
-            rf"^{re.escape(shot)}_turnover-plate_[A-Za-z0-9]+_.+?_v{re.escape(vnum)}\.(\d+)\.([A-Za-z0-9]+)$"
-        )
-
-    files: list[tuple[Path, int, int, str]] = []
-    if not dir_path.exists():
-        return None
-
-    for p in dir_path.iterdir():
-        if not p.is_file():
-            continue
-        m = rx.match(p.name)
+    rx = _plate_seq_rx(shot, vnum, plate_id)
+    if file_names is None:
+        try:
+            with os.scandir(dir_path) as it:
+                file_names = [e.name for e in it if e.is_file()]
+        except OSError:
+            return None
+
+    # Per (name_prefix, ext) group: [count, min_frame, max_frame, max_pad]
+    groups: dict[tuple[str, str], list[int]] = {}
+    for name in file_names:
+        m = rx.match(name)
         if not m:
             continue
         frame_str, ext = m.group(1), m.group(2)
-        files.append((p, int(frame_str), len(frame_str), ext))
-
-    if not files:
+        frame, pad = int(frame_str), len(frame_str)
+        # Drop ".<frame>.<ext>"; both lengths are already known from the match
+        key = (name[:-(pad + len(ext) + 2)], ext.lower())
+        agg = groups.get(key)
+        if agg is None:
+            groups[key] = [1, frame, frame, pad]
+        else:
+            agg[0] += 1
+            if frame < agg[1]:
+                agg[1] = frame
+            elif frame > agg[2]:
+                agg[2] = frame
+            if pad > agg[3]:
+                agg[3] = pad
+
+    if not groups:
         return None
 
-    # Group by (prefix_without_frame, ext) and pick the largest, newest
-    groups: dict[tuple[str, str], list[tuple[Path, int, int, str]]] = {}
-    for p, frame, pad, ext in files:
-        prefix = re.sub(r"\.\d+\.[A-Za-z0-9]+$", "", str(p))
-        groups.setdefault((prefix, ext.lower()), []).append((p, frame, pad, ext))
+    # Pick the largest group; only stat files when several tie on count
+    max_count = max(agg[0] for agg in groups.values())
+    top = [key for key, agg in groups.items() if agg[0] == max_count]
+    if len(top) == 1:
+        best = top[0]
+    else:
+        newest = dict.fromkeys(top, 0.0)
+        for name in file_names:
+            m = rx.match(name)
+            if not m:
+                continue
+            key = (name[:-(len(m.group(1)) + len(m.group(2)) + 2)], m.group(2).lower())
+            if key in newest:
+                mtime = os.stat(dir_path / name).st_mtime
+                if mtime > newest[key]:
+                    newest[key] = mtime
+        best = max(top, key=newest.__getitem__)
+
+    _count, fmin, fmax, pad = groups[best]
+    name_prefix, ext = best
+    return str(dir_path / name_prefix), ext, fmin, fmax, pad
+
+
+def _format_exists(fmt_name: str) -> bool:
+    """
+    Check whether a format name is registered in Nuke.
 
-    def group_key(kv: tuple[tuple[str, str], list[tuple[Path, int, int, str]]]) -> tuple[int, float]:
-        _, vals = kv
-        count = len(vals)
-        newest = max(v[0].stat().st_mtime for v in vals)
-        return (count, newest)
+    Known names are cached at module level, so repeated hits don't call
+    format.name() for every registered format. A miss re-reads
+    nuke.formats() once in case the format was added elsewhere.
 
-    (best_prefix, ext), vals = max(groups.items(), key=group_key)
-    frames = [v[1] for v in vals]
-    pads = [v[2] for v in vals]
-    fmin, fmax = min(frames), max(frames)
-    pad = max(pads)
+    Args:
+        fmt_name: Format name to look up
 
-    return best_prefix, ext, fmin, fmax, pad, [v[0] for v in vals]
+    Returns:
+        True if Nuke knows a format with this name
+    """
+    if fmt_name in _format_names_cache:
+        return True
+    _format_names_cache.clear()
+    _format_names_cache.update(f.name() for f in nuke.formats())
+    return fmt_name in _format_names_cache
 
 
 def _maybe_set_format_from_res(read_node: nuke.Node, seq_dir: Path) -> None:
@@ -281,7 +395,7 @@ def _maybe_set_format_from_res(read_node: nuke.Node, seq_dir: Path) -> None:
     """
     def wh(name: str | None) -> tuple[int | None, int | None]:
         """Extract width and height from string like '4448x3096'."""
-        m = re.match(r"^(\d+)x(\d+)$", name or "")
+        m = RES_RX.match(name or "")
         return (int(m.group(1)), int(m.group(2))) if m else (None, None)
 
     w, h = wh(seq_dir.name)
@@ -289,11 +403,17 @@ def _maybe_set_format_from_res(read_node: nuke.Node, seq_dir: Path) -> None:
         w, h = wh(seq_dir.parent.name)
 
     if w and h:
-        fmt_name = f"{w}x{h}_from_plate"
+        # Most Reads in a show share a few plate resolutions, so a repeat
+        # resolution goes straight to setValue()
+        fmt_name = _res_format_cache.get((w, h))
         try:
-            # Create format if it doesn't exist
-            if not any(f.name() == fmt_name for f in nuke.formats()):
-                nuke.addFormat(f"{w} {h} 0 0 {w} {h} 1 {fmt_name}")
+            if fmt_name is None:
+                fmt_name = f"{w}x{h}_from_plate"
+                # Create format if it doesn't exist
+                if not _format_exists(fmt_name):
+                    nuke.addFormat(f"{w} {h} 0 0 {w} {h} 1 {fmt_name}")
+                    _format_names_cache.add(fmt_name)
+                _res_format_cache[(w, h)] = fmt_name
             read_node["format"].setValue(fmt_name)
         except Exception:
             # Fallback: set format directly
@@ -331,10 +451,10 @@ def create_latest_plate_read_hash() -> nuke.Node:
     if not nk_path or nk_path == "Root":
         _err("Please save the Nuke script first so I can infer the shot path.")
 
-    p = Path(nk_path)
-    parts = p.parts
-    i_shows = _find_index(parts, "shows")
-    i_shots = _find_index(parts, "shots")
+    parts = tuple(nk_path.split("/"))
+    part_idx = _index_map(parts)
+    i_shows = part_idx.get("shows", -1)
+    i_shots = part_idx.get("shots", -1)
     if min(i_shows, i_shots) < 0:
         _err("Couldn't parse show/shot from the Nuke script path.\nExpected /shows/<show>/shots/<seq>/<shot>/...")
 
@@ -347,19 +467,24 @@ def create_latest_plate_read_hash() -> nuke.Node:
 
     # Get plate root using config
     plate_root = PipelineConfig.get_plate_root(show, seq, shot)
-    if not plate_root.exists():
+
+    # List plate folders once; every later lookup reuses this mapping
+    try:
+        with os.scandir(plate_root) as it:
+            plate_dirs = {e.name: Path(e.path) for e in it if e.is_dir()}
+    except OSError:
         _err(f"Plate root not found:\n{plate_root}")
 
     # Detect preferred plate ID
-    plate_id = _detect_plate_id(p, plate_root)
+    plate_id = _detect_plate_id(nk_path, plate_dirs)
 
     # Gather candidate plate folders (prefer detected ID if it exists, else scan all)
     bg_dirs: list[Path]
-    if plate_id and (plate_root / plate_id).exists():
-        bg_dirs = [plate_root / plate_id]
+    if plate_id and plate_id in plate_dirs:
+        bg_dirs = [plate_dirs[plate_id]]
     else:
         # Sort alphabetically for deterministic fallback
-        bg_dirs = sorted([d for d in plate_root.iterdir() if d.is_dir()])
+        bg_dirs = sorted(plate_dirs.values())
 
         # Prompt user when multiple plates found and no plate ID detected
         if len(bg_dirs) > 1:
@@ -377,44 +502,23 @@ def create_latest_plate_read_hash() -> nuke.Node:
             nuke.tprint(f"[plate] User selected: {selected_plate}")
             bg_dirs = [plate_root / selected_plate]
 
-    chosen: tuple[str, str, int, int, int, list[Path]] | None = None
+    chosen: tuple[str, str, int, int, int] | None = None
     chosen_v: str | None = None
     chosen_seq_dir: Path | None = None
     chosen_bg: str | None = None
 
+    # Folders walked by the first pass, kept so the wildcard pass can
+    # revisit them without listing anything again
+    listed: dict[Path, list[tuple[str, Path, list[str]]]] = {}
+
     # For each plate folder, find latest v### that has frames under .../exr/[WxH]/ or .../exr/
     for bg_dir in bg_dirs:
-        vdirs = [
-            d for d in bg_dir.iterdir()
-            if d.is_dir() and re.match(r"v\d+$", d.name, re.IGNORECASE)
-        ]
-        vdirs.sort(key=lambda d: _version_num(d.name), reverse=True)
-
-        for vdir in vdirs:
-            vnum = vdir.name[1:].zfill(3)
-            exr_dir = vdir / "exr"
-            if not exr_dir.exists():
-                continue
-
-            # 1) Directly in exr/
-            hit = _scan_seq(exr_dir, shot, vnum, plate_id=bg_dir.name)
+        walked = listed[bg_dir] = []
+        for vnum, scan_dir, names in _iter_candidate_dirs(bg_dir):
+            walked.append((vnum, scan_dir, names))
+            hit = _scan_seq(scan_dir, shot, vnum, plate_id=bg_dir.name, file_names=names)
             if hit:
-                chosen = hit
-                chosen_v = vnum
-                chosen_seq_dir = exr_dir
-                chosen_bg = bg_dir.name
-                break
-
-            # 2) Subfolder like 4448x3096 inside exr/
-            for sd in [d for d in exr_dir.iterdir() if d.is_dir()]:
-                hit = _scan_seq(sd, shot, vnum, plate_id=bg_dir.name)
-                if hit:
-                    chosen = hit
-                    chosen_v = vnum
-                    chosen_seq_dir = sd
-                    chosen_bg = bg_dir.name
-                    break
-            if chosen:
+                chosen, chosen_v, chosen_seq_dir, chosen_bg = hit, vnum, scan_dir, bg_dir.name
                 break
         if chosen:
             break
@@ -422,36 +526,12 @@ def create_latest_plate_read_hash() -> nuke.Node:
     # Last resort: wildcard any plate ID across all folders/versions
     if not chosen:
         # Sort alphabetically for deterministic fallback
-        for bg_dir in sorted([d for d in plate_root.iterdir() if d.is_dir()]):
-            vdirs = [
-                d for d in bg_dir.iterdir()
-                if d.is_dir() and re.match(r"v\d+$", d.name, re.IGNORECASE)
-            ]
-            vdirs.sort(key=lambda d: _version_num(d.name), reverse=True)
-
-            for vdir in vdirs:
-                vnum = vdir.name[1:].zfill(3)
-                exr_dir = vdir / "exr"
-                if not exr_dir.exists():
-                    continue
-
-                hit = _scan_seq(exr_dir, shot, vnum, plate_id=None)
+        for bg_dir in sorted(plate_dirs.values()):
+            candidates = listed[bg_dir] if bg_dir in listed else _iter_candidate_dirs(bg_dir)
+            for vnum, scan_dir, names in candidates:
+                hit = _scan_seq(scan_dir, shot, vnum, plate_id=None, file_names=names)
                 if hit:
-                    chosen = hit
-                    chosen_v = vnum
-                    chosen_seq_dir = exr_dir
-                    chosen_bg = bg_dir.name
-                    break
-
-                for sd in [d for d in exr_dir.iterdir() if d.is_dir()]:
-                    hit = _scan_seq(sd, shot, vnum, plate_id=None)
-                    if hit:
-                        chosen = hit
-                        chosen_v = vnum
-                        chosen_seq_dir = sd
-                        chosen_bg = bg_dir.name
-                        break
-                if chosen:
+                    chosen, chosen_v, chosen_seq_dir, chosen_bg = hit, vnum, scan_dir, bg_dir.name
                     break
             if chosen:
                 break
@@ -460,40 +540,11 @@ def create_latest_plate_read_hash() -> nuke.Node:
         _err("No plate sequences found under:\n" + str(plate_root))
 
     # Unpack results
-    best_prefix, ext, fmin, fmax, pad, _files = chosen
+    best_prefix, ext, fmin, fmax, pad = chosen
     hashes = "#" * pad
     hash_pattern = f"{best_prefix}.{hashes}.{ext}"
-    first_frame_path = f"{best_prefix}.{str(fmin).zfill(pad)}.{ext}"
-
-    # Create Read node
-    r = nuke.nodes.Read()
-    r["name"].setValue(f"Read_rawPlate_{chosen_bg}_v{chosen_v}")
 
-    # Concrete frame first, then #### to make Nuke scan the sequence
-    r["file"].fromUserText(first_frame_path)
-    r["file"].fromUserText(hash_pattern)
-
-    # Set EXR-specific settings
-    if ext.lower() == "exr":
-        try:
-            r["file_type"].setValue("exr")
-        except Exception:
-            pass
-        try:
-            r["colorspace"].setValue("linear")  # Adjust for your OCIO if needed
-        except Exception:
-            pass
-        try:
-            r["raw"].setValue(True)
-        except Exception:
-            pass
-
-    # Set frame range
-    for knob, val in (("first", fmin), ("last", fmax), ("origfirst", fmin), ("origlast", fmax)):
-        try:
-            r[knob].setValue(int(val))
-        except Exception:
-            pass
+    r = build_read(f"Read_rawPlate_{chosen_bg}_v{chosen_v}", hash_pattern, fmin, fmax, ext, reload=False)
 
     # Auto-detect format from folder name
     if chosen_seq_dir:
@@ -24,12 +24,16 @@ Usage:
     mm_playblast_read.run()  # Creates Read node for latest Wireframe playblast
 """
 
+import os
 import re
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, NoReturn
 
 import nuke
 
+from export_utils import build_read
 from pipeline_config import PipelineConfig
 
 
@@ -47,35 +51,35 @@ def _err(msg: str) -> NoReturn:
     raise RuntimeError(msg)
 
 
-def _find_index(parts: tuple[str, ...], name: str) -> int:
+def _version_num(vname: str) -> int:
     """
-    Find index of a string in a tuple, returning -1 if not found.
+    Extract version number from version string.
 
     Args:
-        parts: Tuple of strings to search
-        name: String to find
+        vname: Version string (e.g., "v001", "V123")
 
     Returns:
-        Index of name in parts, or -1 if not found
+        Version number as integer, or -1 if invalid format
     """
-    try:
-        return parts.index(name)
-    except ValueError:
+    # Plain string checks: this runs for every entry in a version listing
+    if len(vname) < 2 or vname[0] not in "vV":
         return -1
+    digits = vname[1:]
+    return int(digits) if digits.isascii() and digits.isdigit() else -1
 
 
-def _version_num(vname: str) -> int:
+@lru_cache(maxsize=32)
+def _playblast_seq_rx(base_name: str) -> re.Pattern[str]:
     """
-    Extract version number from version string.
+    Build (and cache) the <base_name>.####.ext sequence regex.
 
     Args:
-        vname: Version string (e.g., "v001", "V123")
+        base_name: Playblast base name (e.g., "Wireframe")
 
     Returns:
-        Version number as integer, or -1 if invalid format
+        Compiled case-insensitive pattern capturing (frame, ext)
     """
-    m = re.match(r"v(\d+)$", vname, re.IGNORECASE)
-    return int(m.group(1)) if m else -1
+    return re.compile(rf"^{re.escape(base_name)}\.(\d+)\.([A-Za-z0-9]+)$", re.IGNORECASE)
 
 
 def _scan_playblast(vdir: Path, base_name: str) -> dict[str, Any] | None:
@@ -119,41 +123,57 @@ def _scan_playblast(vdir: Path, base_name: str) -> dict[str, Any] | None:
         For Wireframe.mov:
         Returns: {"type": "movie", "path": ".../Wireframe.mov"}
     """
-    if not vdir.exists():
+    rx_seq = _playblast_seq_rx(base_name)
+    movie_names = frozenset(f"{base_name.lower()}.{me}" for me in PipelineConfig.MOVIE_EXTENSIONS)
+    # Per extension: [min_frame, max_frame, max_pad] plus the frame entries.
+    # Entries are kept as-is; Paths are only built for the winner.
+    aggs: dict[str, list[int]] = {}
+    entries: dict[str, list[os.DirEntry[str]]] = {}
+    movie_path: str | None = None
+
+    # Single directory pass folds frames into their group and remembers
+    # the first movie file
+    try:
+        it = os.scandir(vdir)
+    except OSError:
         return None
-
-    # 1) Try image sequence
-    rx_seq = re.compile(rf"^{re.escape(base_name)}\.(\d+)\.([A-Za-z0-9]+)$", re.IGNORECASE)
-    files: list[tuple[Path, int, int, str]] = []
-
-    for p in vdir.iterdir():
-        if not p.is_file():
-            continue
-        m = rx_seq.match(p.name)
-        if not m:
-            continue
-        frame_str, ext = m.group(1), m.group(2)
-        files.append((p, int(frame_str), len(frame_str), ext))
-
-    if files:
-        # Group by extension. Prefix is constant (base_name).
-        groups: dict[str, list[tuple[Path, int, int, str]]] = {}
-        for p, frame, pad, ext in files:
+    with it:
+        for entry in it:
+            m = rx_seq.match(entry.name)
+            if not m:
+                if movie_path is None and entry.name.lower() in movie_names and entry.is_file():
+                    movie_path = entry.path
+                continue
+            if not entry.is_file():
+                continue
+            frame_str, ext = m.group(1), m.group(2)
+            frame, pad = int(frame_str), len(frame_str)
+            # Prefix is constant (base_name), so groups are keyed by extension
             key = ext.lower()
-            groups.setdefault(key, []).append((p, frame, pad, ext))
-
-        # Choose the group with most files, then newest mtime
-        def group_key(kv: tuple[str, list[tuple[Path, int, int, str]]]) -> tuple[int, float]:
-            _, vals = kv
-            count = len(vals)
-            newest = max(v[0].stat().st_mtime for v in vals)
-            return (count, newest)
-
-        ext, vals = max(groups.items(), key=group_key)
-        frames = [v[1] for v in vals]
-        pads = [v[2] for v in vals]
-        fmin, fmax = min(frames), max(frames)
-        pad = max(pads)
+            agg = aggs.get(key)
+            if agg is None:
+                aggs[key] = [frame, frame, pad]
+                entries[key] = [entry]
+                continue
+            if frame < agg[0]:
+                agg[0] = frame
+            elif frame > agg[1]:
+                agg[1] = frame
+            if pad > agg[2]:
+                agg[2] = pad
+            entries[key].append(entry)
+
+    # 1) Image sequence takes priority
+    if aggs:
+        # Choose the group with most files, then newest mtime. Files are only
+        # stat'ed when several groups tie on count.
+        max_count = max(len(v) for v in entries.values())
+        top = [key for key, v in entries.items() if len(v) == max_count]
+        if len(top) == 1:
+            ext = top[0]
+        else:
+            ext = max(top, key=lambda key: max(e.stat().st_mtime for e in entries[key]))
+        fmin, fmax, pad = aggs[ext]
         best_prefix = str(vdir / base_name)
 
         return {
@@ -163,18 +183,12 @@ def _scan_playblast(vdir: Path, base_name: str) -> dict[str, Any] | None:
             "fmin": fmin,
             "fmax": fmax,
             "pad": pad,
-            "files": [v[0] for v in vals],
+            "files": [Path(e.path) for e in entries[ext]],
         }
 
-    # 2) Try single movie file
-    movie_exts = ("mov", "mp4", "m4v", "avi", "mxf", "webm", "mkv")
-    for p in vdir.iterdir():
-        if not p.is_file():
-            continue
-        name_low = p.name.lower()
-        for me in movie_exts:
-            if name_low == f"{base_name.lower()}.{me}":
-                return {"type": "movie", "path": str(p)}
+    # 2) Fall back to a single movie file
+    if movie_path is not None:
+        return {"type": "movie", "path": movie_path}
 
     return None
 
@@ -193,24 +207,12 @@ def _infer_context_from_nk() -> tuple[str, str, str, str]:
     if not nk_path or nk_path == "Root":
         _err("Please save the Nuke script first so I can infer the shot path.")
 
-    p = Path(nk_path)
-    parts = p.parts
-    i_shows = _find_index(parts, "shows")
-    i_shots = _find_index(parts, "shots")
-    i_user = _find_index(parts, "user")
-
-    if min(i_shows, i_shots, i_user) < 0:
-        _err("Couldn't parse show/shot/user from the Nuke script path.\nExpected /shows/<show>/shots/<seq>/<shot>/user/<user>/...")
-
     try:
-        show = parts[i_shows+1]
-        seq = parts[i_shots+1]
-        shot = parts[i_shots+2]
-        user = parts[i_user+1]
-    except Exception:
-        _err("Path didn't have enough segments after /shows or /shots or /user.")
+        context = PipelineConfig.parse_show_shot_from_path(nk_path)
+    except ValueError as e:
+        _err(str(e))
 
-    return show, seq, shot, user
+    return context['show'], context['seq'], context['shot'], context['user']
 
 
 def create_latest_playblast_read(category: str = "Wireframe") -> nuke.Node:
@@ -257,26 +259,28 @@ def create_latest_playblast_read(category: str = "Wireframe") -> nuke.Node:
 
     # Get playblast root using config
     playblast_root = PipelineConfig.get_playblast_root(show, seq, shot, user)
-    if not playblast_root.exists():
-        _err(f"Playblast root not found:\n{playblast_root}")
-
     cat_dir = playblast_root / category
-    if not cat_dir.exists() or not cat_dir.is_dir():
+
+    # One stat for the common case; the root is only probed to pick the error
+    if not cat_dir.is_dir():
+        if not playblast_root.exists():
+            _err(f"Playblast root not found:\n{playblast_root}")
         _err(f"No '{category}' folder under:\n{playblast_root}")
 
     # Find version directories (latest first)
-    vdirs = [
-        d for d in cat_dir.iterdir()
-        if d.is_dir() and re.match(r"v\d+$", d.name, re.IGNORECASE)
-    ]
+    with os.scandir(cat_dir) as it:
+        vdirs = [
+            (n, Path(e.path)) for e in it
+            if (n := _version_num(e.name)) >= 0 and e.is_dir()
+        ]
     if not vdirs:
         _err(f"No version folders under:\n{cat_dir}")
-    vdirs.sort(key=lambda d: _version_num(d.name), reverse=True)
+    vdirs.sort(key=itemgetter(0), reverse=True)
 
     chosen: dict[str, Any] | None = None
     chosen_v: str | None = None
 
-    for vdir in vdirs:
+    for _n, vdir in vdirs:
         hit = _scan_playblast(vdir, category)
         if hit:
             chosen = hit
@@ -296,38 +300,8 @@ def create_latest_playblast_read(category: str = "Wireframe") -> nuke.Node:
 
         hashes = "#" * pad
         hash_pattern = f"{best_prefix}.{hashes}.{ext}"
-        first_frame_path = f"{best_prefix}.{str(fmin).zfill(pad)}.{ext}"
-
-        r = nuke.nodes.Read()
-        r["name"].setValue(f"Read_playblast_{category}_v{chosen_v}")
-
-        # Load a real frame first, then the hash pattern
-        r["file"].fromUserText(first_frame_path)
-        r["file"].fromUserText(hash_pattern)
-
-        # Set frame range
-        for knob, val in (("first", fmin), ("last", fmax), ("origfirst", fmin), ("origlast", fmax)):
-            try:
-                r[knob].setValue(int(val))
-            except Exception:
-                pass
-
-        # PNG/JPG etc: leave colorspace to project defaults; EXR: set raw/linear
-        if ext.lower() == "exr":
-            for k, v in (("file_type", "exr"), ("colorspace", "linear")):
-                try:
-                    r[k].setValue(v)
-                except Exception:
-                    pass
-            try:
-                r["raw"].setValue(True)
-            except Exception:
-                pass
 
-        try:
-            r["reload"].execute()
-        except Exception:
-            pass
+        r = build_read(f"Read_playblast_{category}_v{chosen_v}", hash_pattern, fmin, fmax, ext)
 
         # Note: Read nodes are source nodes and don't have inputs.
         # Auto-connection is not applicable for Read nodes.
@@ -339,8 +313,7 @@ def create_latest_playblast_read(category: str = "Wireframe") -> nuke.Node:
     elif chosen["type"] == "movie":
         movie_path = chosen["path"]
 
-        r = nuke.nodes.Read()
-        r["name"].setValue(f"Read_playblast_{category}_v{chosen_v}")
+        r = nuke.nodes.Read(name=f"Read_playblast_{category}_v{chosen_v}")
         r["file"].fromUserText(movie_path)
 
         try:
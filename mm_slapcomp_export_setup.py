@@ -21,21 +21,33 @@ Hotkey:
     Ctrl+Alt+Shift+S (registered in menu.py)
 """
 
-from pathlib import Path
+import os
 
 import nuke
 
 from export_utils import (
-    detect_plate_from_nkpath,
-    detect_plate_from_reads,
-    err,
+    build_plate_read,
+    build_playblast_read,
+    build_transform,
+    build_write_tank,
+    clear_cache,
+    deselect_all,
     find_latest_ld,
     find_latest_plate,
     find_latest_playblast,
     infer_context_from_nk,
+    paste_ld_groups,
+    resolve_plate_id,
+    undo_group,
 )
 
+# Playblast categories built by the setup, each with its own pipeline
+CATEGORIES = ("Cones", "Wireframe")
+CATEGORY_ELEMENT = {"Cones": "cones", "Wireframe": "lineupGeo"}  # WriteTank camera_element
+CATEGORY_X_OFFSET = {"Cones": -200, "Wireframe": 400}  # DAG column: left / right
 
+
+@undo_group("Slap Comp Export Setup")
 def create_slapcomp_export_setup() -> dict[str, dict[str, nuke.Node]]:
     """
     Create dual-export slap comp setup (Cones + Wireframe) sharing one plate.
@@ -90,71 +102,35 @@ def create_slapcomp_export_setup() -> dict[str, dict[str, nuke.Node]]:
 
     # Parse context
     show, seq, shot, user = infer_context_from_nk()
-    nk_parts = Path(nuke.root().name()).parts
-
-    # Detect plate ID
-    plate_id = detect_plate_from_reads()
-    if not plate_id:
-        plate_id = detect_plate_from_nkpath(tuple(s.lower() for s in nk_parts))
 
+    plate_id = resolve_plate_id()
     nuke.tprint(f"[Slap Comp] Detected plate ID: {plate_id or '(auto-detect from available plates)'}")
 
     # Find latest plate (shared resource)
     nuke.tprint("[Slap Comp] Finding latest plate...")
-    plate_prefix, plate_ext, plate_fmin, plate_fmax, plate_pad, plate_v, plate_bg = find_latest_plate(
-        show, seq, shot, plate_id
-    )
+    plate = find_latest_plate(show, seq, shot, plate_id)
+    *_, plate_v, plate_bg = plate
 
     # Find latest LD (shared detection, pasted separately for each pipeline)
     nuke.tprint("[Slap Comp] Finding latest LD file...")
     ld_file, ld_v, ld_plate = find_latest_ld(show, seq, shot, user, plate_bg)
 
+    # Find latest playblast per category before any node is created, so a
+    # missing one doesn't leave a half-built tree behind
+    playblasts = {
+        category: find_latest_playblast(show, seq, shot, user, category)
+        for category in CATEGORIES
+    }
+
     # Clear selection
-    for n in nuke.selectedNodes():
-        n.setSelected(False)
+    deselect_all()
 
     # ========================================================================
     # CREATE SHARED PLATE READ NODE
     # ========================================================================
     nuke.tprint("[Slap Comp] Creating shared plate Read node...")
 
-    plate_hashes = "#" * plate_pad
-    plate_hash_pattern = f"{plate_prefix}.{plate_hashes}.{plate_ext}"
-    plate_first_frame_path = f"{plate_prefix}.{str(plate_fmin).zfill(plate_pad)}.{plate_ext}"
-
-    plate_read = nuke.nodes.Read()
-    plate_read["name"].setValue(f"Read_rawPlate_{plate_bg}_v{plate_v}")
-
-    # Load real frame first, then hash pattern
-    plate_read["file"].fromUserText(plate_first_frame_path)
-    plate_read["file"].fromUserText(plate_hash_pattern)
-
-    # Set EXR-specific settings
-    if plate_ext.lower() == "exr":
-        try:
-            plate_read["file_type"].setValue("exr")
-        except Exception:
-            pass
-        try:
-            plate_read["colorspace"].setValue("linear")
-        except Exception:
-            pass
-        try:
-            plate_read["raw"].setValue(True)
-        except Exception:
-            pass
-
-    # Set frame range
-    for knob, val in (("first", plate_fmin), ("last", plate_fmax), ("origfirst", plate_fmin), ("origlast", plate_fmax)):
-        try:
-            plate_read[knob].setValue(int(val))
-        except Exception:
-            pass
-
-    try:
-        plate_read["reload"].execute()
-    except Exception:
-        pass
+    plate_read = build_plate_read(*plate)
 
     # Position plate Read node
     plate_read.setXYpos(200, -200)
@@ -163,91 +139,30 @@ def create_slapcomp_export_setup() -> dict[str, dict[str, nuke.Node]]:
     # CREATE DUAL EXPORT PIPELINES
     # ========================================================================
 
-    categories = ["Cones", "Wireframe"]
-    category_element_map = {
-        "Cones": "cones",
-        "Wireframe": "lineupGeo"
-    }
-
-    # Position offsets for each pipeline
-    category_x_offset = {
-        "Cones": -200,  # Left side
-        "Wireframe": 400  # Right side
-    }
-
     results: dict[str, dict[str, nuke.Node]] = {
         "shared": {"plate_read": plate_read}
     }
 
-    for category in categories:
+    # One LD group per pipeline; the .nk file itself is only read once
+    ld_groups = dict(zip(CATEGORIES, paste_ld_groups(ld_file, len(CATEGORIES)), strict=True))
+
+    # Root format is the same for every pipeline's full-frame crop
+    root = nuke.root()
+    root_w, root_h = root.width(), root.height()
+
+    for category in CATEGORIES:
         nuke.tprint(f"[Slap Comp] Creating {category} pipeline...")
 
-        # Find latest playblast for this category
-        playblast_data, playblast_v = find_latest_playblast(show, seq, shot, user, category)
+        playblast_data, playblast_v = playblasts[category]
 
         # Get position offset
-        x_offset = category_x_offset[category]
+        x_offset = CATEGORY_X_OFFSET[category]
 
         # ====================================================================
         # 1. CREATE PLAYBLAST READ NODE
         # ====================================================================
 
-        if playblast_data["type"] == "sequence":
-            best_prefix = playblast_data["best_prefix"]
-            ext = playblast_data["ext"]
-            fmin = playblast_data["fmin"]
-            fmax = playblast_data["fmax"]
-            pad = playblast_data["pad"]
-
-            hashes = "#" * pad
-            hash_pattern = f"{best_prefix}.{hashes}.{ext}"
-            first_frame_path = f"{best_prefix}.{str(fmin).zfill(pad)}.{ext}"
-
-            playblast_read = nuke.nodes.Read()
-            playblast_read["name"].setValue(f"Read_playblast_{category}_v{playblast_v}")
-
-            # Load real frame first, then hash pattern
-            playblast_read["file"].fromUserText(first_frame_path)
-            playblast_read["file"].fromUserText(hash_pattern)
-
-            # Set frame range
-            for knob, val in (("first", fmin), ("last", fmax), ("origfirst", fmin), ("origlast", fmax)):
-                try:
-                    playblast_read[knob].setValue(int(val))
-                except Exception:
-                    pass
-
-            # PNG/JPG: leave colorspace to project defaults; EXR: set raw/linear
-            if ext.lower() == "exr":
-                for k, v in (("file_type", "exr"), ("colorspace", "linear")):
-                    try:
-                        playblast_read[k].setValue(v)
-                    except Exception:
-                        pass
-                try:
-                    playblast_read["raw"].setValue(True)
-                except Exception:
-                    pass
-
-            try:
-                playblast_read["reload"].execute()
-            except Exception:
-                pass
-
-        elif playblast_data["type"] == "movie":
-            movie_path = playblast_data["path"]
-
-            playblast_read = nuke.nodes.Read()
-            playblast_read["name"].setValue(f"Read_playblast_{category}_v{playblast_v}")
-            playblast_read["file"].fromUserText(movie_path)
-
-            try:
-                playblast_read["reload"].execute()
-            except Exception:
-                pass
-
-        else:
-            err("Internal error: unknown playblast type.")
+        playblast_read = build_playblast_read(playblast_data, playblast_v, category)
 
         # Position playblast Read
         playblast_read.setXYpos(x_offset, -300)
@@ -256,43 +171,16 @@ def create_slapcomp_export_setup() -> dict[str, dict[str, nuke.Node]]:
         # 2. CREATE TRANSFORM NODE
         # ====================================================================
 
-        transform = nuke.nodes.Transform()
-        transform["name"].setValue(f"Transform_{category}Scale")
-        try:
-            transform["scale"].setValue(1.1)
-        except Exception:
-            pass
-        try:
-            transform["center"].setValue([2156, 1152])
-        except Exception:
-            pass
-
-        # Connect to playblast
-        transform.setInput(0, playblast_read)
+        transform = build_transform(f"Transform_{category}Scale", playblast_read)
 
         # Position Transform
         transform.setXYpos(x_offset, -200)
 
         # ====================================================================
-        # 3. PASTE LD .NK FILE
+        # 3. PLACE LD GROUP (pasted above)
         # ====================================================================
 
-        # Clear selection before paste
-        for n in nuke.selectedNodes():
-            n.setSelected(False)
-
-        nuke.nodePaste(str(ld_file))
-        pasted = nuke.selectedNodes()
-
-        # Find the primary Group/LiveGroup
-        ld_group: nuke.Node | None = None
-        for n in pasted:
-            if n.Class() in ("Group", "LiveGroup"):
-                ld_group = n
-                break
-
-        if not ld_group:
-            err(f"No Group/LiveGroup found in pasted LD file:\n{ld_file}")
+        ld_group = ld_groups[category]
 
         # Rename LD group
         try:
@@ -310,8 +198,7 @@ def create_slapcomp_export_setup() -> dict[str, dict[str, nuke.Node]]:
         # 4. CREATE MERGE NODE
         # ====================================================================
 
-        merge = nuke.nodes.Merge2()
-        merge["name"].setValue(f"Merge_{category}Plate")
+        merge = nuke.nodes.Merge2(name=f"Merge_{category}Plate")
 
         # Connect inputs: A=Plate (foreground), B=Playblast+LD (background)
         merge.setInput(0, ld_group)      # B input (background)
@@ -324,14 +211,8 @@ def create_slapcomp_export_setup() -> dict[str, dict[str, nuke.Node]]:
         # 5. CREATE CROP NODE
         # ====================================================================
 
-        crop = nuke.nodes.Crop()
-        crop["name"].setValue(f"Crop_{category}")
-
-        # Set crop box to full frame
-        try:
-            crop["box"].setValue([0, 0, nuke.root().width(), nuke.root().height()])
-        except Exception:
-            pass
+        # Crop box covers the full frame
+        crop = nuke.nodes.Crop(name=f"Crop_{category}", box=[0, 0, root_w, root_h])
 
         # Connect to merge
         crop.setInput(0, merge)
@@ -343,47 +224,9 @@ def create_slapcomp_export_setup() -> dict[str, dict[str, nuke.Node]]:
         # 6. CREATE WRITETANK NODE
         # ====================================================================
 
-        # Check if WriteTank exists
-        try:
-            write_tank = nuke.nodes.WriteTank()
-        except Exception:
-            err("WriteTank node type not found.\nThis node requires Shotgun/Flow toolkit integration.")
-
-        write_tank["name"].setValue(f"WriteTank_{category}Export")
-
-        # Connect to crop
-        write_tank.setInput(0, crop)
-
-        # Configure WriteTank - match example settings
-        try:
-            write_tank["profile_name"].setValue("Camera Elements")
-        except Exception:
-            pass
-
-        # Set category-specific camera_element value
-        camera_element = category_element_map[category]
-        try:
-            write_tank["custom_knob_camera_element"].setValue(camera_element)
-        except Exception:
-            pass
-
-        # Colorspace settings
-        try:
-            write_tank["colorspace"].setValue("lin_sgamut3cine")
-        except Exception:
-            pass
-
-        # File type
-        try:
-            write_tank["file_type"].setValue("exr")
-        except Exception:
-            pass
-
-        # Channels
-        try:
-            write_tank["channels"].setValue("rgb")
-        except Exception:
-            pass
+        write_tank = build_write_tank(
+            f"WriteTank_{category}Export", CATEGORY_ELEMENT[category], crop
+        )
 
         # Position WriteTank
         write_tank.setXYpos(x_offset, 100)
@@ -421,4 +264,8 @@ def run() -> dict[str, dict[str, nuke.Node]]:
         import mm_slapcomp_export_setup
         mm_slapcomp_export_setup.run()  # Creates Cones + Wireframe export trees
     """
+    # Folder searches are cached for a short while; set MM_FORCE_REFRESH to
+    # pick up versions published since the last run
+    if os.environ.get("MM_FORCE_REFRESH"):
+        clear_cache()
     return create_slapcomp_export_setup()
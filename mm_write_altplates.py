@@ -29,13 +29,33 @@ Usage:
 """
 
 import re
-from pathlib import Path
-from typing import NoReturn
+from functools import lru_cache
+from typing import Any, NoReturn
 
 import nuke
 
 from pipeline_config import PipelineConfig
 
+# Filename sanitizing: anything but word characters, "-" and "." becomes "_",
+# then runs of "_" collapse to one
+UNSAFE_CHARS_RX = re.compile(r'[^\w\-.]')
+UNDERSCORE_RUN_RX = re.compile(r'_+')
+# ASCII-only equivalent of UNSAFE_CHARS_RX for str.translate (ASCII \w is [A-Za-z0-9_])
+UNSAFE_ASCII_TABLE = str.maketrans(
+    {c: '_' for c in map(chr, range(128)) if not (c.isalnum() or c in '_-.')}
+)
+
+# Write knob values for AltPlates outputs: EXR, RGBA, raw, ACES display
+ALTPLATES_WRITE_KNOBS: dict[str, Any] = {
+    "file_type": "exr",
+    "first_part": "rgba",
+    "raw": True,
+    "create_directories": True,
+    "ocioColorspace": "scene_linear",
+    "display": "ACES",
+    "view": "Client3DLUT + grade",
+}
+
 
 def _err(msg: str) -> NoReturn:
     """
@@ -51,21 +71,26 @@ def _err(msg: str) -> NoReturn:
     raise RuntimeError(msg)
 
 
-def _find_index(parts: tuple[str, ...], name: str) -> int:
+def _apply_knobs(node: nuke.Node, knobs: dict[str, Any]) -> None:
     """
-    Find index of a string in a tuple, returning -1 if not found.
+    Set knob values on a node, skipping any the node refuses.
 
-    Args:
-        parts: Tuple of strings to search
-        name: String to find
+    Knobs may be missing or reject values depending on the Nuke version and
+    OCIO config, so each one is optional.
 
-    Returns:
-        Index of name in parts, or -1 if not found
+    Same as export_utils.apply_knobs; like _err it is kept here so this
+    script only depends on pipeline_config.
+
+    Args:
+        node: Node to configure
+        knobs: Knob name to value, applied in dict order
     """
-    try:
-        return parts.index(name)
-    except ValueError:
-        return -1
+    getknob = node.__getitem__
+    for knob, value in knobs.items():
+        try:
+            getknob(knob).setValue(value)
+        except Exception:
+            pass
 
 
 def _sanitize_name(name: str) -> str:
@@ -84,10 +109,12 @@ def _sanitize_name(name: str) -> str:
         >>> _sanitize_name("My Node! (v2)")
         "My_Node_v2"
     """
-    # Replace spaces and special characters with underscores
-    name = re.sub(r'[^\w\-.]', '_', name)
+    # Replace spaces and special characters with underscores. Node names are
+    # almost always ASCII, where a translate table does it in one C pass.
+    name = name.translate(UNSAFE_ASCII_TABLE) if name.isascii() else UNSAFE_CHARS_RX.sub('_', name)
     # Remove consecutive underscores
-    name = re.sub(r'_+', '_', name)
+    if '__' in name:
+        name = UNDERSCORE_RUN_RX.sub('_', name)
     # Remove leading/trailing underscores
     name = name.strip('_')
     return name if name else "Graded"
@@ -108,23 +135,66 @@ def _get_selected_node() -> nuke.Node | None:
     return selected[0] if selected else None
 
 
-def _get_selected_node_name() -> str:
+def _get_selected_node_name(node: nuke.Node | None) -> str:
     """
-    Get the name of the currently selected node.
+    Get the output name for the selected node.
+
+    Args:
+        node: Selected node, as returned by _get_selected_node
 
     Returns:
-        Sanitized name of selected node, or "Graded" if nothing selected
+        Sanitized name of the node, or "Graded" if nothing is selected
 
     Example:
         If "Grade1" is selected, returns "Grade1"
         If nothing is selected, returns "Graded"
     """
-    node = _get_selected_node()
     if not node:
         return "Graded"
 
-    node_name = node.name()
-    return _sanitize_name(node_name)
+    return _sanitize_name(node.name())
+
+
+@lru_cache(maxsize=64)
+def _parse_shot_context(nk_path: str) -> tuple[str, str, str]:
+    """
+    Parse show, sequence and shot from a Nuke script path.
+
+    Cached per path, so repeated hotkey presses in the same script skip the
+    parse. Failures raise and are not cached.
+
+    Args:
+        nk_path: Path to the current Nuke script
+
+    Returns:
+        Tuple of (show, seq, shot)
+
+    Raises:
+        RuntimeError: If the path doesn't match /shows/<show>/shots/<seq>/<shot>/...
+    """
+    # Plain split instead of Path(...).parts; backslashes count as separators
+    parts = nk_path.replace("\\", "/").split("/")
+    # Index every segment in one pass (first occurrence wins, like list.index)
+    part_idx: dict[str, int] = {}
+    for i, name in enumerate(parts):
+        part_idx.setdefault(name, i)
+    i_shows = part_idx.get("shows", -1)
+    i_shots = part_idx.get("shots", -1)
+
+    if min(i_shows, i_shots) < 0:
+        _err(
+            "Couldn't parse show/shot from the Nuke script path.\n"
+            "Expected /shows/<show>/shots/<seq>/<shot>/..."
+        )
+
+    try:
+        show = parts[i_shows + 1]
+        seq = parts[i_shots + 1]
+        shot = parts[i_shots + 2]
+    except IndexError:
+        _err("Path didn't have enough segments after /shows or /shots.")
+
+    return show, seq, shot
 
 
 def create_altplates_write() -> nuke.Node:
@@ -170,82 +240,27 @@ def create_altplates_write() -> nuke.Node:
     if not nk_path or nk_path == "Root":
         _err("Please save the Nuke script first so I can infer the shot path.")
 
-    p = Path(nk_path)
-    parts = p.parts
-    i_shows = _find_index(parts, "shows")
-    i_shots = _find_index(parts, "shots")
-
-    if min(i_shows, i_shots) < 0:
-        _err(
-            "Couldn't parse show/shot from the Nuke script path.\n"
-            "Expected /shows/<show>/shots/<seq>/<shot>/..."
-        )
-
-    try:
-        show = parts[i_shows + 1]
-        seq = parts[i_shots + 1]
-        shot = parts[i_shots + 2]
-    except IndexError:
-        _err("Path didn't have enough segments after /shows or /shots.")
+    show, seq, shot = _parse_shot_context(nk_path)
 
     # Get output directory using config
     output_dir = PipelineConfig.get_altplates_output(show, seq, shot)
 
     # Get selected node (for filename and connection)
     selected_node = _get_selected_node()
-    base_name = _get_selected_node_name()
+    base_name = _get_selected_node_name(selected_node)
 
-    # Build full output path with hash pattern (single # for Nuke)
-    output_file = output_dir / f"{base_name}.#.exr"
+    # Build full output path with hash pattern (single # for Nuke). It is
+    # only ever used as text, so no Path is built for it.
+    output_file = f"{output_dir}/{base_name}.#.exr"
 
     # Create Write node
-    w = nuke.nodes.Write()
-    w["name"].setValue(f"Write_AltPlates_{base_name}")
+    w = nuke.nodes.Write(name=f"Write_AltPlates_{base_name}")
 
     # Set file path
-    w["file"].fromUserText(str(output_file))
-
-    # Set EXR format
-    try:
-        w["file_type"].setValue("exr")
-    except Exception:
-        pass
-
-    # Set first_part to rgba
-    try:
-        w["first_part"].setValue("rgba")
-    except Exception:
-        pass
-
-    # Enable raw
-    try:
-        w["raw"].setValue(True)
-    except Exception:
-        pass
+    w["file"].fromUserText(output_file)
 
-    # Enable create directories
-    try:
-        w["create_directories"].setValue(True)
-    except Exception:
-        pass
-
-    # Set OCIO colorspace to scene_linear
-    try:
-        w["ocioColorspace"].setValue("scene_linear")
-    except Exception:
-        pass
-
-    # Set display to ACES
-    try:
-        w["display"].setValue("ACES")
-    except Exception:
-        pass
-
-    # Set view to "Client3DLUT + grade"
-    try:
-        w["view"].setValue("Client3DLUT + grade")
-    except Exception:
-        pass
+    # Output settings
+    _apply_knobs(w, ALTPLATES_WRITE_KNOBS)
 
     # Note: If you have a custom before_render() callback function,
     # you can add it here with:
@@ -256,11 +271,12 @@ def create_altplates_write() -> nuke.Node:
 
     # Connect to selected node if there is one
     if selected_node:
+        selected_name = selected_node.name()
         try:
             w.setInput(0, selected_node)
-            nuke.tprint(f"[AltPlates] Connected to: {selected_node.name()}")
+            nuke.tprint(f"[AltPlates] Connected to: {selected_name}")
         except Exception as e:
-            nuke.tprint(f"[AltPlates] Warning: Could not connect to {selected_node.name()}: {e}")
+            nuke.tprint(f"[AltPlates] Warning: Could not connect to {selected_name}: {e}")
 
     nuke.tprint(f"[AltPlates] Created Write node: {output_file}")
     nuke.tprint(f"[AltPlates] Output name: {base_name}")
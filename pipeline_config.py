@@ -5,8 +5,41 @@ Centralized configuration for VFX pipeline paths and settings.
 Manages path templates for renders, plates, lens distortion, and playblasts.
 """
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
+# Standard script location: /shows/<show>/shots/<seq>/<shot>/user/<user>/...
+# Anchored (use .match) so it only fires when each of shows/shots/user is the
+# first such segment in the path; the split fallback picks the same fields.
+NK_CONTEXT_RX = re.compile(
+    r"(?:(?!(?:shows|shots|user)/)[^/]*/)*"
+    r"shows/((?!(?:shots|user)/)[^/]+)/shots/((?!user/)[^/]+)/((?!user/)[^/]+)/user/([^/]+)/"
+)
+
+
+@lru_cache(maxsize=256)
+def _template_path(template: str, show: str, seq: str, shot: str, user: str = "") -> Path:
+    """
+    Format a path template into a Path, caching the result.
+
+    Menu and hotkey runs ask for the same shot's roots over and over. The
+    template is part of the key, so changing a *_TEMPLATE attribute takes
+    effect immediately. Paths are immutable, so sharing them is safe.
+
+    Args:
+        template: Path template with {show}/{seq}/{shot}/{user} placeholders
+        show: Show name
+        seq: Sequence name
+        shot: Shot name
+        user: User name (ignored by templates without {user})
+
+    Returns:
+        Formatted path
+    """
+    return Path(template.format(show=show, seq=seq, shot=shot, user=user))
+
 
 class PipelineConfig:
     """
@@ -42,9 +75,9 @@ class PipelineConfig:
     PLATE_FILENAME_PATTERN = "{shot}_turnover-plate_{plate}_*_v{version}.####.{ext}"
     LD_FILENAME_PATTERN = "{shot}_mm_default_{plate}_LD_v{version}.nk"
 
-    # Supported file extensions
-    IMAGE_EXTENSIONS = ("exr", "dpx", "jpg", "jpeg", "png", "tif", "tiff")
-    MOVIE_EXTENSIONS = ("mov", "mp4", "m4v", "avi", "mxf", "webm", "mkv")
+    # Supported file extensions (lowercase, no dot); sets, as callers only test membership
+    IMAGE_EXTENSIONS = frozenset({"exr", "dpx", "jpg", "jpeg", "png", "tif", "tiff"})
+    MOVIE_EXTENSIONS = frozenset({"mov", "mp4", "m4v", "avi", "mxf", "webm", "mkv"})
 
     # Default settings
     DEFAULT_PADDING = 4
@@ -68,9 +101,7 @@ class PipelineConfig:
             >>> PipelineConfig.get_renders_root("demo", "010", "0100", "artist")
             PosixPath('/shows/demo/shots/010/0100/user/artist/mm/maya/renders/mm-default')
         """
-        return Path(PipelineConfig.RENDERS_ROOT_TEMPLATE.format(
-            show=show, seq=seq, shot=shot, user=user
-        ))
+        return _template_path(PipelineConfig.RENDERS_ROOT_TEMPLATE, show, seq, shot, user)
 
     @staticmethod
     def get_plate_root(show: str, seq: str, shot: str) -> Path:
@@ -89,9 +120,7 @@ class PipelineConfig:
             >>> PipelineConfig.get_plate_root("demo", "010", "0100")
             PosixPath('/shows/demo/shots/010/0100/publish/turnover/plate/input_plate')
         """
-        return Path(PipelineConfig.PLATE_ROOT_TEMPLATE.format(
-            show=show, seq=seq, shot=shot
-        ))
+        return _template_path(PipelineConfig.PLATE_ROOT_TEMPLATE, show, seq, shot)
 
     @staticmethod
     def get_ld_root(show: str, seq: str, shot: str, user: str) -> Path:
@@ -111,9 +140,7 @@ class PipelineConfig:
             >>> PipelineConfig.get_ld_root("demo", "010", "0100", "artist")
             PosixPath('/shows/demo/shots/010/0100/user/artist/mm/3de/mm-default/exports/scene')
         """
-        return Path(PipelineConfig.LD_ROOT_TEMPLATE.format(
-            show=show, seq=seq, shot=shot, user=user
-        ))
+        return _template_path(PipelineConfig.LD_ROOT_TEMPLATE, show, seq, shot, user)
 
     @staticmethod
     def get_playblast_root(show: str, seq: str, shot: str, user: str) -> Path:
@@ -133,9 +160,7 @@ class PipelineConfig:
             >>> PipelineConfig.get_playblast_root("demo", "010", "0100", "artist")
             PosixPath('/shows/demo/shots/010/0100/user/artist/mm/maya/playblast')
         """
-        return Path(PipelineConfig.PLAYBLAST_ROOT_TEMPLATE.format(
-            show=show, seq=seq, shot=shot, user=user
-        ))
+        return _template_path(PipelineConfig.PLAYBLAST_ROOT_TEMPLATE, show, seq, shot, user)
 
     @staticmethod
     def get_altplates_output(show: str, seq: str, shot: str) -> Path:
@@ -157,12 +182,10 @@ class PipelineConfig:
             >>> PipelineConfig.get_altplates_output("jack_ryan", "DD_230", "DD_230_0360")
             PosixPath('/shows/jack_ryan/shots/DD_230/DD_230_0360/user/gabriel-h/mm/nuke/outputs/AltPlates')
         """
-        return Path(PipelineConfig.ALTPLATES_OUTPUT_TEMPLATE.format(
-            show=show, seq=seq, shot=shot
-        ))
+        return _template_path(PipelineConfig.ALTPLATES_OUTPUT_TEMPLATE, show, seq, shot)
 
     @staticmethod
-    def parse_show_shot_from_path(nk_path: Path) -> dict[str, str]:
+    def parse_show_shot_from_path(nk_path: str | Path) -> dict[str, str]:
         """
         Parse show, sequence, shot, and user from a Nuke script path.
 
@@ -170,7 +193,8 @@ class PipelineConfig:
             /shows/<show>/shots/<seq>/<shot>/user/<user>/...
 
         Args:
-            nk_path: Path to Nuke script
+            nk_path: Path to Nuke script, as a string or Path. Backslashes
+                are treated as separators too.
 
         Returns:
             Dictionary with keys: 'show', 'seq', 'shot', 'user'
@@ -183,7 +207,17 @@ class PipelineConfig:
             >>> PipelineConfig.parse_show_shot_from_path(path)
             {'show': 'demo', 'seq': '010', 'shot': '0100', 'user': 'artist'}
         """
-        parts = nk_path.parts
+        path_str = os.fspath(nk_path).replace("\\", "/")
+
+        # One regex search covers the standard layout; anything else goes
+        # through the anchor-by-anchor parse, which also words the error
+        m = NK_CONTEXT_RX.match(path_str)
+        if m:
+            show, seq, shot, user = m.group(1, 2, 3, 4)
+            return {'show': show, 'seq': seq, 'shot': shot, 'user': user}
+
+        # One plain split; building Path.parts would parse the path first
+        parts = path_str.split("/")
 
         try:
             show_idx = parts.index("shows")
@@ -211,7 +245,7 @@ class PipelineConfig:
 
 
 # Convenience function for backward compatibility
-def parse_show_shot_user(nk_path: Path) -> tuple[str, str, str, str]:
+def parse_show_shot_user(nk_path: str | Path) -> tuple[str, str, str, str]:
     """
     Parse show, seq, shot, and user from Nuke script path.
 
@@ -7,7 +7,8 @@ allowing tests to run outside of Nuke's environment.
 Quick Start
 -----------
 
-1. Use `mock_nuke` fixture to get a fresh mock::
+1. Use `mock_nuke` fixture to get a freshly reset mock (one instance is
+   installed as `nuke` for the whole session)::
 
     def test_my_script(mock_nuke):
         mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SEQ_0010/user/artist/scene/comp.nk")
@@ -27,8 +28,11 @@ Quick Start
 
 from __future__ import annotations
 
+import itertools
+import os
 import sys
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from functools import partial
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock
@@ -43,10 +47,13 @@ import pytest
 class MockKnob:
     """Mock Nuke knob for storing node values."""
 
+    __slots__ = ("_name", "_value", "_from_user_text_calls")
+
     def __init__(self, name: str, value: Any = None) -> None:
         self._name = name
         self._value = value
-        self._from_user_text_calls: list[str] = []
+        # Only file knobs ever see fromUserText; the list is made on first call
+        self._from_user_text_calls: list[str] | None = None
 
     def value(self) -> Any:
         return self._value
@@ -56,6 +63,8 @@ class MockKnob:
 
     def fromUserText(self, text: str) -> None:
         """Record calls for testing file path loading."""
+        if self._from_user_text_calls is None:
+            self._from_user_text_calls = []
         self._from_user_text_calls.append(text)
         self._value = text
 
@@ -67,59 +76,66 @@ class MockKnob:
         pass
 
 
+# Knobs every MockNode answers for, with their initial values. Knob objects
+# are only created when first looked up, so nodes a test never inspects
+# cost no knob allocations.
+MOCK_KNOB_DEFAULTS: dict[str, Any] = {
+    # File knobs
+    "file": None,
+    "first": 1001,
+    "last": 1100,
+    "origfirst": 1001,
+    "origlast": 1100,
+    # Color/format knobs
+    "colorspace": None,
+    "raw": False,
+    "file_type": None,
+    "format": None,
+    "ocioColorspace": None,
+    "display": None,
+    "view": None,
+    # Write knobs
+    "create_directories": False,
+    "channels": None,
+    "first_part": None,
+    # Transform knobs
+    "scale": 1.0,
+    "center": (0, 0),
+    # Action knobs
+    "reload": None,
+    # WriteTank knobs
+    "profile_name": None,
+    "custom_knob_camera_element": None,
+    # General
+    "name": None,
+}
+
+
 class MockNode:
     """Mock Nuke node with knob support."""
 
-    _node_counter = 0
+    __slots__ = ("_class", "_name", "_knobs", "_inputs", "_selected", "_xpos", "_ypos")
+
+    # Class-level so names stay unique across nodes; rebound to reset numbering
+    _node_counter = itertools.count(1)
 
     def __init__(self, node_class: str = "Node") -> None:
-        MockNode._node_counter += 1
         self._class = node_class
-        self._name = f"{node_class}{MockNode._node_counter}"
-        self._knobs: dict[str, MockKnob] = {
-            # File knobs
-            "file": MockKnob("file"),
-            "first": MockKnob("first", 1001),
-            "last": MockKnob("last", 1100),
-            "origfirst": MockKnob("origfirst", 1001),
-            "origlast": MockKnob("origlast", 1100),
-            # Color/format knobs
-            "colorspace": MockKnob("colorspace"),
-            "raw": MockKnob("raw", False),
-            "file_type": MockKnob("file_type"),
-            "format": MockKnob("format"),
-            "ocioColorspace": MockKnob("ocioColorspace"),
-            "display": MockKnob("display"),
-            "view": MockKnob("view"),
-            # Write knobs
-            "create_directories": MockKnob("create_directories", False),
-            "channels": MockKnob("channels"),
-            "first_part": MockKnob("first_part"),
-            # Transform knobs
-            "scale": MockKnob("scale", 1.0),
-            "center": MockKnob("center", [0, 0]),
-            # Action knobs
-            "reload": MockKnob("reload"),
-            # WriteTank knobs
-            "profile_name": MockKnob("profile_name"),
-            "custom_knob_camera_element": MockKnob("custom_knob_camera_element"),
-            # General
-            "name": MockKnob("name"),
-        }
+        self._name = f"{node_class}{next(MockNode._node_counter)}"
+        self._knobs: dict[str, MockKnob] = {}
         self._inputs: list[MockNode | None] = [None] * 10
         self._selected = False
         self._xpos = 0
         self._ypos = 0
 
     def __getitem__(self, key: str) -> MockKnob:
-        if key not in self._knobs:
-            self._knobs[key] = MockKnob(key)
-        return self._knobs[key]
+        knob = self._knobs.get(key)
+        if knob is None:
+            knob = self._knobs[key] = MockKnob(key, MOCK_KNOB_DEFAULTS.get(key))
+        return knob
 
     def __setitem__(self, key: str, value: Any) -> None:
-        if key not in self._knobs:
-            self._knobs[key] = MockKnob(key)
-        self._knobs[key].setValue(value)
+        self[key].setValue(value)
 
     def name(self) -> str:
         return self._name
@@ -168,7 +184,15 @@ class MockNode:
         self._ypos = y
 
     def knob(self, name: str) -> MockKnob | None:
-        return self._knobs.get(name)
+        if name in self._knobs or name in MOCK_KNOB_DEFAULTS:
+            return self[name]
+        return None
+
+    def knobs(self) -> dict[str, MockKnob]:
+        """Return a name -> knob mapping, like Node.knobs() in Nuke."""
+        for key in MOCK_KNOB_DEFAULTS:
+            self[key]
+        return dict(self._knobs)
 
 
 class MockRoot(MockNode):
@@ -191,52 +215,28 @@ class MockRoot(MockNode):
 
 
 class MockNodesFactory:
-    """Factory for creating mock Nuke nodes."""
-
-    def Read(self, **kwargs: Any) -> MockNode:
-        node = MockNode("Read")
-        for key, value in kwargs.items():
-            node[key].setValue(value)
-        return node
-
-    def Write(self, **kwargs: Any) -> MockNode:
-        node = MockNode("Write")
-        for key, value in kwargs.items():
-            node[key].setValue(value)
-        return node
-
-    def Merge2(self, **kwargs: Any) -> MockNode:
-        node = MockNode("Merge2")
-        for key, value in kwargs.items():
-            node[key].setValue(value)
-        return node
-
-    def Transform(self, **kwargs: Any) -> MockNode:
-        node = MockNode("Transform")
-        for key, value in kwargs.items():
-            node[key].setValue(value)
-        return node
-
-    def Group(self, **kwargs: Any) -> MockNode:
-        node = MockNode("Group")
-        for key, value in kwargs.items():
-            node[key].setValue(value)
-        return node
-
-    def WriteTank(self, **kwargs: Any) -> MockNode:
-        node = MockNode("WriteTank")
-        for key, value in kwargs.items():
-            node[key].setValue(value)
-        return node
+    """
+    Factory for creating mock Nuke nodes.
 
-    def LiveGroup(self, **kwargs: Any) -> MockNode:
-        node = MockNode("LiveGroup")
-        for key, value in kwargs.items():
-            node[key].setValue(value)
-        return node
+    Any attribute is treated as a node class, like nuke.nodes, so
+    ``factory.Read(file=...)`` returns a MockNode of class "Read" with the
+    given knob values.
+    """
 
-    def Crop(self, **kwargs: Any) -> MockNode:
-        node = MockNode("Crop")
+    def __init__(self) -> None:
+        self._factory_cache: dict[str, Callable[..., MockNode]] = {}
+
+    def __getattr__(self, node_class: str) -> Callable[..., MockNode]:
+        if node_class.startswith("_"):
+            raise AttributeError(node_class)
+        fn = self._factory_cache.get(node_class)
+        if fn is None:
+            fn = self._factory_cache[node_class] = partial(self._make, node_class)
+        return fn
+
+    @staticmethod
+    def _make(node_class: str, **kwargs: Any) -> MockNode:
+        node = MockNode(node_class)
         for key, value in kwargs.items():
             node[key].setValue(value)
         return node
@@ -276,22 +276,24 @@ class MockPanel:
         self._knobs[name] = value
 
 
+class MockUndo:
+    """Mock nuke.Undo that records undo group boundaries."""
+
+    def __init__(self) -> None:
+        self._calls: list[str] = []
+
+    def begin(self, name: str = "") -> None:
+        self._calls.append(f"begin:{name}")
+
+    def end(self) -> None:
+        self._calls.append("end")
+
+
 class MockNukeModule:
     """Mock implementation of the nuke module."""
 
     def __init__(self) -> None:
-        self._root = MockRoot()
-        self._selected_nodes: list[MockNode] = []
-        self._all_nodes: list[MockNode] = []
-        self.nodes = MockNodesFactory()
-        self._tprint_messages: list[str] = []
-        self._message_calls: list[str] = []
-        self._pasted_files: list[str] = []
-        self._formats: list[str] = []
-        self._panels: list[MockPanel] = []
-
-        # Hotkey tracking (used by menu.py)
-        self._bb_hotkeys_bound: set[tuple[str, str]] = set()
+        self._clear()
 
         # Type aliases for type hints in Nuke scripts
         self.Node = MockNode  # type: ignore[assignment]
@@ -310,9 +312,23 @@ class MockNukeModule:
 
     def allNodes(self, node_class: str | None = None) -> list[MockNode]:
         if node_class:
-            return [n for n in self._all_nodes if n.Class() == node_class]
+            return self._nodes_by_class.get(node_class, []).copy()
         return self._all_nodes.copy()
 
+    def selectAll(self) -> None:
+        """Select every node in the scene."""
+        for n in self._all_nodes:
+            n.setSelected(True)
+        self._selected_nodes = self._all_nodes.copy()
+
+    def invertSelection(self) -> None:
+        """Invert the selection state of every node in the scene."""
+        for n in self._selected_nodes:
+            n.setSelected(False)
+        self._selected_nodes = [n for n in self._all_nodes if n not in self._selected_nodes]
+        for n in self._selected_nodes:
+            n.setSelected(True)
+
     def tprint(self, message: str) -> None:
         """Record tprint calls for testing."""
         self._tprint_messages.append(message)
@@ -333,7 +349,11 @@ class MockNukeModule:
         pasted_node = MockNode("Group")
         pasted_node.setName("LD_3DE_FG01_v001", unique=False)
         self._selected_nodes = [pasted_node]
-        self._all_nodes.append(pasted_node)
+        self._add_node(pasted_node)
+
+    def nodeCopy(self, filepath: str) -> None:
+        """Record nodeCopy calls (the selection itself is not serialized)."""
+        self._copied_files.append(filepath)
 
     def formats(self) -> list[str]:
         """Return list of available formats."""
@@ -354,7 +374,7 @@ class MockNukeModule:
         node = MockNode(node_class)
         for key, value in kwargs.items():
             node[key].setValue(value)
-        self._all_nodes.append(node)
+        self._add_node(node)
         return node
 
     # Test helpers
@@ -367,18 +387,27 @@ class MockNukeModule:
         self._selected_nodes = nodes
 
     def _add_node(self, node: MockNode) -> None:
-        """Add a node to the scene for testing."""
+        """Add a node to the scene for testing, indexed by class for allNodes()."""
         self._all_nodes.append(node)
+        self._nodes_by_class.setdefault(node.Class(), []).append(node)
 
     def _clear(self) -> None:
-        """Clear all state for fresh tests."""
-        self._selected_nodes = []
-        self._all_nodes = []
-        self._tprint_messages = []
-        self._message_calls = []
-        self._pasted_files = []
-        self._panels = []
-        MockNode._node_counter = 0
+        """Reset all state, leaving the mock as it was when first created."""
+        self._root = MockRoot()
+        self._selected_nodes: list[MockNode] = []
+        self._all_nodes: list[MockNode] = []
+        self._nodes_by_class: dict[str, list[MockNode]] = {}
+        self.nodes = MockNodesFactory()
+        self.Undo = MockUndo()
+        self._tprint_messages: list[str] = []
+        self._message_calls: list[str] = []
+        self._pasted_files: list[str] = []
+        self._copied_files: list[str] = []
+        self._formats: list[str] = []
+        self._panels: list[MockPanel] = []
+
+        # Hotkey tracking (used by menu.py)
+        self._bb_hotkeys_bound: set[tuple[str, str]] = set()
 
 
 # =============================================================================
@@ -386,23 +415,34 @@ class MockNukeModule:
 # =============================================================================
 
 
-@pytest.fixture
-def mock_nuke() -> Generator[MockNukeModule, None, None]:
+@pytest.fixture(scope="session", autouse=True)
+def _install_mock_nuke() -> Generator[MockNukeModule, None, None]:
     """
-    Provide a fresh mock nuke module for each test.
+    Install one mock nuke module as 'nuke' in sys.modules for the session.
 
-    The mock is automatically installed as 'nuke' in sys.modules.
-    Node counter is reset to ensure deterministic node names.
+    Scripts bind `nuke` once at import, so every test sees the same object
+    and modules under test don't have to be reloaded to pick it up.
     """
-    MockNode._node_counter = 0  # Reset for deterministic names
     mock = MockNukeModule()
     sys.modules["nuke"] = mock  # type: ignore[assignment]
     yield mock
     # Cleanup
-    if "nuke" in sys.modules:
+    if sys.modules.get("nuke") is mock:
         del sys.modules["nuke"]
 
 
+@pytest.fixture
+def mock_nuke(_install_mock_nuke: MockNukeModule) -> MockNukeModule:
+    """
+    Provide the session mock nuke module, reset to a fresh state.
+
+    Node counter is reset to ensure deterministic node names.
+    """
+    MockNode._node_counter = itertools.count(1)  # Reset for deterministic names
+    _install_mock_nuke._clear()
+    return _install_mock_nuke
+
+
 @pytest.fixture
 def sample_script_path() -> str:
     """Provide a sample Nuke script path for testing."""
@@ -453,6 +493,21 @@ def tmp_shot_structure(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def version_sort_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Create a read-only tree of unordered version folders, once per session.
+
+    Structure:
+        versions/v001, v003, v002, v010
+
+    Tests share the same directory, so they must not modify it.
+    """
+    base = tmp_path_factory.mktemp("versions")
+    create_version_dirs(base, ["v001", "v003", "v002", "v010"])
+    return base
+
+
 @pytest.fixture
 def project_root() -> Path:
     """Return the project root directory."""
@@ -472,8 +527,14 @@ def create_version_dirs(base_path: Path, versions: list[str]) -> None:
         base_path: Parent directory for versions
         versions: List of version names (e.g., ["v001", "v002"])
     """
+    # Parents once, then a bare mkdir per version
+    base = os.fspath(base_path)
+    os.makedirs(base, exist_ok=True)
     for version in versions:
-        (base_path / version).mkdir(parents=True, exist_ok=True)
+        try:
+            os.mkdir(os.path.join(base, version))
+        except FileExistsError:
+            pass
 
 
 def create_image_sequence(
@@ -496,12 +557,14 @@ def create_image_sequence(
     Returns:
         List of created file paths
     """
+    # Plain os.open/close per frame; Path.touch() would also build a Path
+    # and try an extra utime call for every file
+    base = f"{os.fspath(directory)}{os.sep}{prefix}."
     files = []
     for frame in frames:
-        filename = f"{prefix}.{str(frame).zfill(padding)}.{extension}"
-        filepath = directory / filename
-        filepath.touch()
-        files.append(filepath)
+        name = f"{base}{frame:0{padding}d}.{extension}"
+        os.close(os.open(name, os.O_WRONLY | os.O_CREAT, 0o644))
+        files.append(Path(name))
     return files
 
 
@@ -525,10 +588,57 @@ def create_ld_file(
     """
     filename = f"{shot}_mm_default_{plate}_LD_v{version:03d}.nk"
     filepath = directory / filename
-    filepath.write_text("# Mock LD file\n")
+    # Raw bytes; the content is fixed ASCII, so no text-mode encoder is needed
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b"# Mock LD file\n")
+    finally:
+        os.close(fd)
     return filepath
 
 
+def create_export_shot_tree(
+    root: Path,
+    plate_version: int,
+    ld_version: int,
+    playblasts: dict[str, tuple[int, str]],
+    frames: range,
+    shot: str = "SH010",
+    plate: str = "FG01"
+) -> None:
+    """
+    Create the plate, LD and playblast folders an export setup searches.
+
+    Layout under root (point the PipelineConfig templates at these):
+        plate/<plate>/v###/exr/<shot>_turnover-plate_<plate>_linear_v###.####.exr
+        ld/<plate>/nuke_lens_distortion/v###/<shot>_mm_default_<plate>_LD_v###.nk
+        playblast/<category>/v###/<category>.####.<ext>
+
+    Args:
+        root: Directory to build the tree in
+        plate_version: Plate version number
+        ld_version: LD file version number
+        playblasts: Playblast category -> (version number, file extension)
+        frames: Range of frame numbers for the plate and playblasts
+        shot: Shot name
+        plate: Plate ID
+    """
+    exr_dir = root / "plate" / plate / f"v{plate_version:03d}" / "exr"
+    exr_dir.mkdir(parents=True)
+    create_image_sequence(
+        exr_dir, f"{shot}_turnover-plate_{plate}_linear_v{plate_version:03d}", "exr", frames
+    )
+
+    ld_dir = root / "ld" / plate / "nuke_lens_distortion" / f"v{ld_version:03d}"
+    ld_dir.mkdir(parents=True)
+    create_ld_file(ld_dir, shot, plate, ld_version)
+
+    for category, (version, extension) in playblasts.items():
+        vdir = root / "playblast" / category / f"v{version:03d}"
+        vdir.mkdir(parents=True)
+        create_image_sequence(vdir, category, extension, frames)
+
+
 def create_playblast_sequence(
     directory: Path,
     shot: str,
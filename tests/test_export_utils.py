@@ -6,18 +6,49 @@ Tests the shared utility functions used by export setup scripts.
 
 from __future__ import annotations
 
-import importlib
-import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
-from conftest import MockNukeModule, create_version_dirs
+from conftest import (
+    MockKnob,
+    MockNode,
+    MockNukeModule,
+    create_image_sequence,
+    create_ld_file,
+    create_version_dirs,
+)
 
 
-def _reload_export_utils() -> None:
-    """Reload export_utils to pick up the mock nuke module."""
-    if "export_utils" in sys.modules:
-        importlib.reload(sys.modules["export_utils"])
+@pytest.fixture(autouse=True)
+def _clear_export_caches() -> Iterator[None]:
+    """Start every test with empty directory and result caches."""
+    import export_utils
+
+    export_utils.clear_cache()
+    yield
+    export_utils.clear_cache()
+
+
+@pytest.fixture(scope="module")
+def _scan_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared parent for the small per-test scan folders in this module."""
+    return tmp_path_factory.mktemp("scan")
+
+
+@pytest.fixture
+def vdir(_scan_root: Path) -> Iterator[Path]:
+    """Provide an empty version folder, without a numbered tmp_path per test."""
+    d = Path(tempfile.mkdtemp(prefix="v001_", dir=_scan_root))
+    yield d
+    shutil.rmtree(d, ignore_errors=True)
 
 
 class TestVersionNum:
@@ -34,14 +65,54 @@ class TestVersionNum:
         ("v", -1),
         ("", -1),
         ("v1a", -1),
+        ("v-1", -1),
+        ("v\u00b2", -1),
+        ("xv001", -1),
     ])
-    def test_version_num(self, mock_nuke: MockNukeModule, version_str: str, expected: int) -> None:
+    def test_version_num(self, version_str: str, expected: int) -> None:
         """Test version number extraction from various formats."""
         import export_utils
 
         assert export_utils.version_num(version_str) == expected
 
 
+class TestDeselectAll:
+    """Tests for deselect_all function."""
+
+    def test_clears_selection(self, mock_nuke: MockNukeModule) -> None:
+        """Test every node ends up unselected, including ones not selected before."""
+        import export_utils
+
+        nodes = [MockNode("Read"), MockNode("Merge2"), MockNode("Group")]
+        for n in nodes:
+            mock_nuke._add_node(n)
+        nodes[0].setSelected(True)
+        mock_nuke._set_selected_nodes([nodes[0], nodes[2]])
+        nodes[2].setSelected(True)
+
+        export_utils.deselect_all()
+
+        assert mock_nuke.selectedNodes() == []
+        assert not any(n.isSelected() for n in nodes)
+
+
+class TestApplyKnobs:
+    """Tests for apply_knobs function."""
+
+    def test_skips_rejected_knobs(self, mock_nuke: MockNukeModule) -> None:
+        """Test a rejected knob doesn't stop the rest and is skipped silently."""
+        import export_utils
+
+        node = MockNode("Write")
+        node._knobs["raw"] = Mock(setValue=Mock(side_effect=ValueError("no such knob")))
+
+        export_utils.apply_knobs(node, {"file_type": "exr", "raw": True, "channels": "rgb"})
+
+        assert node["file_type"].value() == "exr"
+        assert node["channels"].value() == "rgb"
+        assert mock_nuke._tprint_messages == []
+
+
 class TestFindIndex:
     """Tests for find_index function."""
 
@@ -82,9 +153,7 @@ class TestNormPlateToken:
         ("invalid", None),
         ("", None),
     ])
-    def test_norm_plate_token(
-        self, mock_nuke: MockNukeModule, input_token: str, expected: str | None
-    ) -> None:
+    def test_norm_plate_token(self, input_token: str, expected: str | None) -> None:
         """Test plate ID normalization from various formats."""
         import export_utils
 
@@ -97,7 +166,7 @@ class TestDetectPlateFromReads:
     def test_detect_from_read_path(self, mock_nuke: MockNukeModule) -> None:
         """Test plate detection from existing Read node file paths."""
         from conftest import MockNode
-        _reload_export_utils()
+
         import export_utils
 
         # Create a Read node with a plate path
@@ -111,7 +180,7 @@ class TestDetectPlateFromReads:
     def test_detect_from_filename(self, mock_nuke: MockNukeModule) -> None:
         """Test plate detection from filename pattern."""
         from conftest import MockNode
-        _reload_export_utils()
+
         import export_utils
 
         # Create a Read node with plate in filename
@@ -122,9 +191,33 @@ class TestDetectPlateFromReads:
         result = export_utils.detect_plate_from_reads()
         assert result == "BG02"
 
+    def test_filename_pattern_ignores_directories(self, mock_nuke: MockNukeModule) -> None:
+        """Test _plate_<ID>_ is only honoured in the filename, not in directories."""
+        from conftest import MockNode
+
+        import export_utils
+
+        read_node = MockNode("Read")
+        read_node["file"].setValue("/path/old_plate_BG02_dir/render.exr")
+        mock_nuke._add_node(read_node)
+
+        assert export_utils.detect_plate_from_reads() is None
+
+    def test_skips_empty_file_knobs(self, mock_nuke: MockNukeModule) -> None:
+        """Test Read nodes without a file path are skipped."""
+        from conftest import MockNode
+
+        import export_utils
+
+        mock_nuke._add_node(MockNode("Read"))
+        read_node = MockNode("Read")
+        read_node["file"].setValue("/path/to/shot_plate_MG03_linear.exr")
+        mock_nuke._add_node(read_node)
+
+        assert export_utils.detect_plate_from_reads() == "MG03"
+
     def test_no_read_nodes(self, mock_nuke: MockNukeModule) -> None:
         """Test returns None when no Read nodes exist."""
-        _reload_export_utils()
         import export_utils
 
         result = export_utils.detect_plate_from_reads()
@@ -142,6 +235,13 @@ class TestDetectPlateFromNkpath:
         result = export_utils.detect_plate_from_nkpath(parts)
         assert result == "FG01"
 
+    def test_first_segment_wins(self, mock_nuke: MockNukeModule) -> None:
+        """Test the earliest matching segment is returned, not one spanning segments."""
+        import export_utils
+
+        parts = ("shows", "DEMO", "shots", "ab", "12", "scene", "bg02", "fg01_comp.nk")
+        assert export_utils.detect_plate_from_nkpath(parts) == "BG02"
+
     def test_no_plate_in_path(self, mock_nuke: MockNukeModule) -> None:
         """Test returns None when no plate ID in path."""
         import export_utils
@@ -178,32 +278,11 @@ class TestCollectPlateDirs:
         assert result == []
 
 
-class TestPathHasDotDir:
-    """Tests for path_has_dot_dir function."""
-
-    def test_no_dot_dir(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
-        """Test returns False when no dot directories."""
-        import export_utils
-
-        test_file = tmp_path / "sub" / "file.nk"
-        result = export_utils.path_has_dot_dir(test_file, tmp_path)
-        assert result is False
-
-    def test_with_dot_dir(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
-        """Test returns True when dot directory exists."""
-        import export_utils
-
-        test_file = tmp_path / "IMG_1234.JPG" / "file.nk"
-        result = export_utils.path_has_dot_dir(test_file, tmp_path)
-        assert result is True
-
-
 class TestErrorHandling:
     """Tests for error handling functions."""
 
     def test_err_shows_message_and_raises(self, mock_nuke: MockNukeModule) -> None:
         """Test err() shows message and raises RuntimeError."""
-        _reload_export_utils()
         import export_utils
 
         with pytest.raises(RuntimeError, match="Test error"):
@@ -218,7 +297,6 @@ class TestInferContextFromNk:
     def test_valid_path(self, mock_nuke: MockNukeModule) -> None:
         """Test context inference from valid path."""
         mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SEQ_0010/user/artist/scene/comp.nk")
-        _reload_export_utils()
         import export_utils
 
         show, seq, shot, user = export_utils.infer_context_from_nk()
@@ -231,32 +309,59 @@ class TestInferContextFromNk:
     def test_unsaved_script_raises(self, mock_nuke: MockNukeModule) -> None:
         """Test raises RuntimeError for unsaved script."""
         mock_nuke._set_script_path("")
-        _reload_export_utils()
         import export_utils
 
         with pytest.raises(RuntimeError, match="(?i)save"):
             export_utils.infer_context_from_nk()
 
+    def test_truncated_path_raises(self, mock_nuke: MockNukeModule) -> None:
+        """Test raises RuntimeError when segments are missing after an anchor."""
+        mock_nuke._set_script_path("/shows/DEMO/user/artist/shots/SEQ")
+        import export_utils
+
+        with pytest.raises(RuntimeError, match="enough segments"):
+            export_utils.infer_context_from_nk()
+
     def test_invalid_path_raises(self, mock_nuke: MockNukeModule) -> None:
         """Test raises RuntimeError for invalid path structure."""
         mock_nuke._set_script_path("/invalid/path/structure")
-        _reload_export_utils()
         import export_utils
 
         with pytest.raises(RuntimeError):
             export_utils.infer_context_from_nk()
 
+    def test_windows_path(self, mock_nuke: MockNukeModule) -> None:
+        """Test backslash-separated paths parse like forward-slash ones."""
+        mock_nuke._set_script_path("Z:\\shows\\DEMO\\shots\\SEQ\\SEQ_0010\\user\\artist\\comp.nk")
+        import export_utils
+
+        assert export_utils.infer_context_from_nk() == ("DEMO", "SEQ", "SEQ_0010", "artist")
+
+
+class TestSplitNkPath:
+    """Tests for split_nk_path function."""
+
+    def test_posix_path(self, mock_nuke: MockNukeModule) -> None:
+        """Test an absolute path splits with a leading empty segment."""
+        import export_utils
+
+        assert export_utils.split_nk_path("/shows/DEMO/comp.nk") == ("", "shows", "DEMO", "comp.nk")
+
+    def test_mixed_separators(self, mock_nuke: MockNukeModule) -> None:
+        """Test backslashes and forward slashes both separate segments."""
+        import export_utils
+
+        assert export_utils.split_nk_path("C:\\shows/DEMO\\comp.nk") == ("C:", "shows", "DEMO", "comp.nk")
+
 
 class TestScanPlayblast:
     """Tests for scan_playblast function."""
 
-    def test_scan_image_sequence(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+    def test_scan_image_sequence(self, mock_nuke: MockNukeModule, vdir: Path) -> None:
         """Test scanning directory for image sequence."""
         import export_utils
 
         # Create test sequence
-        vdir = tmp_path / "v001"
-        vdir.mkdir()
         for i in range(1001, 1006):
             (vdir / f"Wireframe.{i:04d}.png").touch()
 
@@ -268,12 +373,10 @@ class TestScanPlayblast:
         assert result["fmin"] == 1001
         assert result["fmax"] == 1005
 
-    def test_scan_movie_file(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+    def test_scan_movie_file(self, mock_nuke: MockNukeModule, vdir: Path) -> None:
         """Test scanning directory for movie file."""
         import export_utils
 
-        vdir = tmp_path / "v001"
-        vdir.mkdir()
         (vdir / "Wireframe.mov").touch()
 
         result = export_utils.scan_playblast(vdir, "Wireframe")
@@ -282,25 +385,711 @@ class TestScanPlayblast:
         assert result["type"] == "movie"
         assert "Wireframe.mov" in result["path"]
 
-    def test_scan_empty_directory(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
-        """Test scanning empty directory returns None."""
+    def test_sequence_preferred_over_movie(self, mock_nuke: MockNukeModule, vdir: Path) -> None:
+        """Test an image sequence wins over a movie in the same folder."""
         import export_utils
 
-        vdir = tmp_path / "v001"
-        vdir.mkdir()
+        (vdir / "WIREFRAME.MOV").touch()
+        (vdir / "Wireframe.1001.png").touch()
+
+        result = export_utils.scan_playblast(vdir, "Wireframe")
+
+        assert result is not None
+        assert result["type"] == "sequence"
+
+        (vdir / "Wireframe.1001.png").unlink()
+        result = export_utils.scan_playblast(vdir, "Wireframe")
+
+        assert result is not None
+        assert result["type"] == "movie"
+        assert result["path"].endswith("WIREFRAME.MOV")
+
+    def test_scan_empty_directory(self, mock_nuke: MockNukeModule, vdir: Path) -> None:
+        """Test scanning empty directory returns None."""
+        import export_utils
 
         result = export_utils.scan_playblast(vdir, "Wireframe")
         assert result is None
 
 
+class TestDirCache:
+    """Tests for the directory probe cache."""
+
+    def test_negative_result_cached_until_cleared(
+        self, mock_nuke: MockNukeModule, tmp_path: Path
+    ) -> None:
+        """Test a missing directory stays cached as missing until clear_cache()."""
+        import export_utils
+
+        target = tmp_path / "later"
+        assert export_utils.cached_is_dir(target) is False
+
+        target.mkdir()
+        assert export_utils.cached_is_dir(target) is False
+
+        export_utils.clear_cache()
+        assert export_utils.cached_is_dir(target) is True
+
+    def test_version_listing_cached(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test version listings are reused and callers get independent copies."""
+        import export_utils
+
+        create_version_dirs(tmp_path, ["v001"])
+        first = export_utils.list_version_dirs(tmp_path)
+        first.clear()
+
+        create_version_dirs(tmp_path, ["v002"])
+        assert [n for n, _ in export_utils.list_version_dirs(tmp_path)] == [1]
+
+        export_utils.clear_cache()
+        assert [n for n, _ in export_utils.list_version_dirs(tmp_path)] == [2, 1]
+
+    def test_version_iteration_is_lazy(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test versions are produced one at a time, latest first."""
+        import export_utils
+
+        create_version_dirs(tmp_path, ["v001", "v010", "v002"])
+        (tmp_path / "v011").touch()  # Skipped only when reached
+
+        it = export_utils.iter_version_dirs(tmp_path)
+
+        assert next(it) == (10, tmp_path / "v010")
+        assert [n for n, _ in it] == [2, 1]
+
+    def test_playblast_without_versions_raises(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a category folder with no v### folders is reported as such."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLAYBLAST_ROOT_TEMPLATE", str(tmp_path))
+        (tmp_path / "Wireframe" / "notes").mkdir(parents=True)
+
+        with pytest.raises(RuntimeError, match="No version folders"):
+            export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")
+
+
+class TestResultCache:
+    """Tests for the find_latest_* result cache."""
+
+    def test_playblast_result_reused_until_cleared(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a repeat lookup skips the search until clear_cache()."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLAYBLAST_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        cat_dir = tmp_path / "SEQ_0010" / "Wireframe"
+        create_version_dirs(cat_dir, ["v001"])
+        create_image_sequence(cat_dir / "v001", "Wireframe", "png", range(1, 3))
+
+        assert export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")[1] == "001"
+
+        create_version_dirs(cat_dir, ["v002"])
+        create_image_sequence(cat_dir / "v002", "Wireframe", "png", range(1, 3))
+        assert export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")[1] == "001"
+
+        export_utils.clear_cache()
+        assert export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")[1] == "002"
+
+    def test_prompted_plate_choice_not_cached(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a plate picked in the dialog is asked for again on the next lookup."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        for plate in ("BG01", "FG01"):
+            exr_dir = tmp_path / "SEQ_0010" / plate / "v001" / "exr"
+            exr_dir.mkdir(parents=True)
+            create_image_sequence(
+                exr_dir, f"SEQ_0010_turnover-plate_{plate}_linear_v001", "exr", range(1, 3)
+            )
+
+        for _ in range(2):
+            assert export_utils.find_latest_plate("DEMO", "SEQ", "SEQ_0010", None)[-1] == "BG01"
+
+        assert len(mock_nuke._panels) == 2
+
+    def test_unprompted_plate_result_not_reused_for_prompting_lookup(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a lookup that skipped the dialog does not answer one that would show it."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        for plate in ("BG01", "FG01"):
+            exr_dir = tmp_path / "SEQ_0010" / plate / "v001" / "exr"
+            exr_dir.mkdir(parents=True)
+            create_image_sequence(
+                exr_dir, f"SEQ_0010_turnover-plate_{plate}_linear_v001", "exr", range(1, 3)
+            )
+
+        export_utils.find_latest_plate("DEMO", "SEQ", "SEQ_0010", None, prompt_on_ambiguity=False)
+        export_utils.find_latest_plate("DEMO", "SEQ", "SEQ_0010", None)
+
+        assert len(mock_nuke._panels) == 1
+
+    def test_unprompted_plate_miss_not_reused_for_prompting_lookup(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a miss recorded without the dialog does not short-circuit one that shows it."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        for plate in ("BG01", "FG01"):
+            (tmp_path / "SEQ_0010" / plate / "v001" / "exr").mkdir(parents=True)
+
+        for prompt in (False, True):
+            with pytest.raises(RuntimeError, match="No plate sequences"):
+                export_utils.find_latest_plate(
+                    "DEMO", "SEQ", "SEQ_0010", None, prompt_on_ambiguity=prompt
+                )
+
+        assert len(mock_nuke._panels) == 1
+
+    def test_cached_playblast_dict_is_a_copy(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test editing a returned playblast dict or its file list does not change later results."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLAYBLAST_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        cat_dir = tmp_path / "SEQ_0010" / "Wireframe"
+        create_version_dirs(cat_dir, ["v001"])
+        create_image_sequence(cat_dir / "v001", "Wireframe", "png", range(1, 3))
+
+        first, _ = export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")
+        first["type"] = "changed"
+        second, _ = export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")
+        first["files"].clear()
+        second["ext"] = "changed"
+        second["files"].append(Path("changed.png"))
+        third, _ = export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")
+
+        assert third["type"] == "sequence"
+        assert third["ext"] == "png"
+        assert sorted(p.name for p in third["files"]) == ["Wireframe.0001.png", "Wireframe.0002.png"]
+
+    def test_failed_lookup_reraised_until_cleared(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a recent miss is re-raised without searching again until clear_cache()."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLAYBLAST_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        cat_dir = tmp_path / "SEQ_0010" / "Wireframe"
+
+        with pytest.raises(RuntimeError, match="Playblast root not found"):
+            export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")
+
+        create_version_dirs(cat_dir, ["v001"])
+        create_image_sequence(cat_dir / "v001", "Wireframe", "png", range(1, 3))
+        with pytest.raises(RuntimeError, match="Playblast root not found"):
+            export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")
+
+        export_utils.clear_cache()
+        assert export_utils.find_latest_playblast("DEMO", "SEQ", "SEQ_0010", "artist", "Wireframe")[1] == "001"
+
+
+class TestScanPlateSeq:
+    """Tests for scan_plate_seq function."""
+
+    def test_picks_largest_group(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test the group with the most frames wins."""
+        import export_utils
+
+        create_image_sequence(
+            tmp_path, "SEQ_0010_turnover-plate_FG01_linear_v001", "exr", range(1001, 1011)
+        )
+        create_image_sequence(
+            tmp_path, "SEQ_0010_turnover-plate_FG01_srgb_v001", "exr", range(1001, 1004)
+        )
+
+        result = export_utils.scan_plate_seq(tmp_path, "SEQ_0010", "001", "FG01")
+
+        assert result is not None
+        prefix, ext, fmin, fmax, pad, files = result
+        assert prefix == str(tmp_path / "SEQ_0010_turnover-plate_FG01_linear_v001")
+        assert ext == "exr"
+        assert (fmin, fmax, pad) == (1001, 1010, 4)
+        assert len(files) == 10
+        assert all(isinstance(f, Path) and f.exists() for f in files)
+
+    def test_newest_group_breaks_tie(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test equal-sized groups are resolved by newest modification time."""
+        import export_utils
+
+        old = create_image_sequence(
+            tmp_path, "SEQ_0010_turnover-plate_FG01_linear_v001", "exr", range(1001, 1004)
+        )
+        create_image_sequence(
+            tmp_path, "SEQ_0010_turnover-plate_FG01_srgb_v001", "exr", range(1001, 1004)
+        )
+        for f in old:
+            os.utime(f, (1_000_000, 1_000_000))
+
+        result = export_utils.scan_plate_seq(tmp_path, "SEQ_0010", "001", "FG01")
+
+        assert result is not None
+        assert result[0] == str(tmp_path / "SEQ_0010_turnover-plate_FG01_srgb_v001")
+
+    def test_dotted_colorspace_token(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test colorspace tokens containing dots still match."""
+        import export_utils
+
+        create_image_sequence(
+            tmp_path, "SEQ_0010_turnover-plate_FG01_rec.709_v001", "exr", range(1001, 1003)
+        )
+
+        result = export_utils.scan_plate_seq(tmp_path, "SEQ_0010", "001", "FG01")
+
+        assert result is not None
+        assert result[0] == str(tmp_path / "SEQ_0010_turnover-plate_FG01_rec.709_v001")
+
+    def test_ignores_other_plate(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test files for a different plate ID are not matched."""
+        import export_utils
+
+        create_image_sequence(
+            tmp_path, "SEQ_0010_turnover-plate_BG01_linear_v001", "exr", range(1001, 1004)
+        )
+
+        assert export_utils.scan_plate_seq(tmp_path, "SEQ_0010", "001", "FG01") is None
+        assert export_utils.scan_plate_seq(tmp_path, "SEQ_0010", "001", None) is not None
+
+
+class TestFindLatestPlate:
+    """Tests for find_latest_plate function."""
+
+    def test_latest_version_in_resolution_subfolder(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the newest version wins and exr/<WxH>/ subfolders are searched."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(
+            PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path / "{show}_{seq}_{shot}")
+        )
+        plate_root = tmp_path / "DEMO_SEQ_SEQ_0010"
+        old_dir = plate_root / "FG01" / "v001" / "exr"
+        new_dir = plate_root / "FG01" / "v002" / "exr" / "4448x3096"
+        old_dir.mkdir(parents=True)
+        new_dir.mkdir(parents=True)
+        create_image_sequence(
+            old_dir, "SEQ_0010_turnover-plate_FG01_linear_v001", "exr", range(1001, 1004)
+        )
+        create_image_sequence(
+            new_dir, "SEQ_0010_turnover-plate_FG01_linear_v002", "exr", range(1001, 1006)
+        )
+
+        prefix, ext, fmin, fmax, pad, vnum, plate = export_utils.find_latest_plate(
+            "DEMO", "SEQ", "SEQ_0010", "FG01"
+        )
+
+        assert prefix == str(new_dir / "SEQ_0010_turnover-plate_FG01_linear_v002")
+        assert (ext, fmin, fmax, pad) == ("exr", 1001, 1005, 4)
+        assert (vnum, plate) == ("002", "FG01")
+
+    @pytest.mark.parametrize(("with_frames", "expected"), [
+        (("BG01", "FG01"), "BG01"),
+        (("FG01",), "FG01"),
+    ])
+    def test_plate_folder_order_kept(
+        self,
+        mock_nuke: MockNukeModule,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        with_frames: tuple[str, ...],
+        expected: str,
+    ) -> None:
+        """Test the first plate folder with frames wins although folders are scanned concurrently."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        for plate in ("BG01", "FG01", "MG01"):
+            exr_dir = tmp_path / "SEQ_0010" / plate / "v001" / "exr"
+            exr_dir.mkdir(parents=True)
+            if plate in with_frames:
+                create_image_sequence(
+                    exr_dir, f"SEQ_0010_turnover-plate_{plate}_linear_v001", "exr", range(1, 3)
+                )
+
+        result = export_utils.find_latest_plate(
+            "DEMO", "SEQ", "SEQ_0010", None, prompt_on_ambiguity=False
+        )
+
+        assert result[-1] == expected
+
+    def test_over_padded_version_folder(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test a v0001 folder is matched against its own _v0001 filenames."""
+        import export_utils
+
+        exr_dir = tmp_path / "FG01" / "v0001" / "exr"
+        exr_dir.mkdir(parents=True)
+        create_image_sequence(exr_dir, "SH010_turnover-plate_FG01_linear_v0001", "exr", range(1001, 1003))
+
+        found = export_utils.find_latest_plate_under(tmp_path / "FG01", "SH010")
+
+        assert found is not None
+        (prefix, _ext, fmin, fmax, _pad, _files), version = found
+        assert prefix == str(exr_dir / "SH010_turnover-plate_FG01_linear_v0001")
+        assert (fmin, fmax, version) == (1001, 1002, "001")
+
+    def test_running_scans_finish_before_return(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a scan still running when the preferred plate hits is waited for, not abandoned."""
+        import export_utils
+
+        finished: list[str] = []
+        started = threading.Barrier(2)
+
+        def scan(bg_dir: Path, _shot: str) -> tuple[Any, str] | None:
+            started.wait(timeout=5)
+            if bg_dir.name == "BG01":
+                time.sleep(0.05)
+            finished.append(bg_dir.name)
+            return ((str(bg_dir), "exr", 1, 2, 4, []), "001") if bg_dir.name == "FG01" else None
+
+        monkeypatch.setattr(export_utils, "find_latest_plate_under", scan)
+
+        found = export_utils._find_latest_plate_in([tmp_path / "FG01", tmp_path / "BG01"], "SH010")
+
+        assert found is not None and found[-1] == "FG01"
+        assert sorted(finished) == ["BG01", "FG01"]
+
+    def test_no_plate_folders_raises(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an empty plate root is reported as having no sequences."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path))
+
+        with pytest.raises(RuntimeError, match="No plate sequences"):
+            export_utils.find_latest_plate("DEMO", "SEQ", "SEQ_0010", None)
+
+
+class TestFindLatestLdUnder:
+    """Tests for find_latest_ld_under function."""
+
+    def test_prefers_exact_name_in_latest_version(
+        self, mock_nuke: MockNukeModule, tmp_path: Path
+    ) -> None:
+        """Test the latest version wins and the exact filename scores highest."""
+        import export_utils
+
+        nld = tmp_path / "FG01" / "nuke_lens_distortion"
+        create_version_dirs(nld, ["v001", "v002"])
+        create_ld_file(nld / "v001", "SEQ_0010", "FG01", 1)
+        create_ld_file(nld / "v002", "SEQ_0010", "FG01", 2)
+        (nld / "v002" / "other_LD_v002.nk").write_text("# other\n")
+
+        best, vnum = export_utils.find_latest_ld_under(tmp_path / "FG01", "SEQ_0010", "FG01")
+
+        assert best == nld / "v002" / "SEQ_0010_mm_default_FG01_LD_v002.nk"
+        assert vnum == "002"
+
+    def test_skips_dot_directories(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test .nk files below dot-named directories are ignored."""
+        import export_utils
+
+        nld = tmp_path / "FG01" / "nuke_lens_distortion"
+        junk = nld / "v001" / "IMG_1241.JPG"
+        junk.mkdir(parents=True)
+        create_ld_file(junk, "SEQ_0010", "FG01", 1)
+
+        assert export_utils.find_latest_ld_under(tmp_path / "FG01", "SEQ_0010", "FG01") == (
+            None, None
+        )
+
+    def test_stops_walking_at_max_score(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test no further files are pulled from the walk after a perfect score."""
+        import export_utils
+
+        vdir = tmp_path / "FG01" / "nuke_lens_distortion" / "v001"
+        sub = vdir / "FG01_SEQ_0010_turnover-plate_FG01_x"
+        sub.mkdir(parents=True)
+        perfect = create_ld_file(sub, "SEQ_0010", "FG01", 1)
+
+        def walk(_root: Path) -> Iterator[os.DirEntry[str]]:
+            with os.scandir(sub) as it:
+                yield from it
+            raise AssertionError("walk continued past a perfect score")
+
+        monkeypatch.setattr(export_utils, "_walk_nk", walk)
+
+        assert export_utils.find_latest_ld_under(tmp_path / "FG01", "SEQ_0010", "FG01") == (
+            perfect, "001"
+        )
+
+    def test_lower_scores_are_not_stated(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test candidates scoring below the current best never pay for a stat."""
+        import export_utils
+
+        vdir = tmp_path / "FG01" / "nuke_lens_distortion" / "v001"
+        vdir.mkdir(parents=True)
+        exact = create_ld_file(vdir, "SEQ_0010", "FG01", 1)
+
+        class NoStatEntry:
+            name = "other_LD_v001.nk"
+            path = os.fspath(vdir / name)
+
+            def stat(self) -> os.stat_result:
+                raise AssertionError("stat called for a losing candidate")
+
+        def walk(_root: Path) -> Iterator[Any]:
+            with os.scandir(vdir) as it:
+                yield next(e for e in it if e.name == exact.name)
+            yield NoStatEntry()
+
+        monkeypatch.setattr(export_utils, "_walk_nk", walk)
+
+        assert export_utils.find_latest_ld_under(tmp_path / "FG01", "SEQ_0010", "FG01") == (
+            exact, "001"
+        )
+
+    def test_finds_nested_files(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test .nk files in plain subdirectories are still found."""
+        import export_utils
+
+        sub = tmp_path / "FG01" / "nuke_lens_distortion" / "v001" / "FG01_SEQ_0010_turnover-plate_FG01_x"
+        sub.mkdir(parents=True)
+        expected = create_ld_file(sub, "SEQ_0010", "FG01", 1)
+
+        assert export_utils.find_latest_ld_under(tmp_path / "FG01", "SEQ_0010", "FG01") == (
+            expected, "001"
+        )
+
+    def test_version_order_is_numeric(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test v10 outranks v9 and non-version folders are ignored."""
+        import export_utils
+
+        nld = tmp_path / "FG01" / "nuke_lens_distortion"
+        create_version_dirs(nld, ["v9", "v10", "vX"])
+        create_ld_file(nld / "v9", "SEQ_0010", "FG01", 9)
+        create_ld_file(nld / "v10", "SEQ_0010", "FG01", 10)
+        create_ld_file(nld / "vX", "SEQ_0010", "FG01", 99)
+
+        best, vnum = export_utils.find_latest_ld_under(tmp_path / "FG01", "SEQ_0010", "FG01")
+
+        assert best is not None and best.parent.name == "v10"
+        assert vnum == "010"
+
+    def test_falls_back_to_older_versions(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test older versions are searched newest-first when the latest is empty."""
+        import export_utils
+
+        nld = tmp_path / "FG01" / "nuke_lens_distortion"
+        create_version_dirs(nld, ["v001", "v002", "v003", "v004"])
+        create_ld_file(nld / "v001", "SEQ_0010", "FG01", 1)
+        create_ld_file(nld / "v003", "SEQ_0010", "FG01", 3)
+
+        _best, vnum = export_utils.find_latest_ld_under(tmp_path / "FG01", "SEQ_0010", "FG01")
+
+        assert vnum == "003"
+
+    def test_over_padded_version_folder(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test a v0001 folder reports the same three-digit version as v001."""
+        import export_utils
+
+        vdir = tmp_path / "FG01" / "nuke_lens_distortion" / "v0001"
+        vdir.mkdir(parents=True)
+        expected = create_ld_file(vdir, "SEQ_0010", "FG01", 1)
+
+        assert export_utils.find_latest_ld_under(tmp_path / "FG01", "SEQ_0010", "FG01") == (
+            expected, "001"
+        )
+
+
+class TestFindLatestLd:
+    """Tests for find_latest_ld function."""
+
+    def test_detected_plate_skips_folder_listing(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a hit under the detected plate never lists the other plate folders."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "LD_ROOT_TEMPLATE", str(tmp_path))
+        vdir = tmp_path / "FG01" / "nuke_lens_distortion" / "v002"
+        vdir.mkdir(parents=True)
+        ld_file = create_ld_file(vdir, "SEQ_0010", "FG01", 2)
+
+        def collect(_root: Path) -> list[tuple[Path, str]]:
+            raise AssertionError("plate folders listed")
+
+        monkeypatch.setattr(export_utils, "collect_plate_dirs", collect)
+
+        assert export_utils.find_latest_ld("DEMO", "SEQ", "SEQ_0010", "artist", "FG01") == (
+            ld_file, "002", "FG01"
+        )
+
+    def test_falls_back_to_other_plates(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test other plate folders are searched when the detected plate has no LD."""
+        import export_utils
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "LD_ROOT_TEMPLATE", str(tmp_path))
+        (tmp_path / "FG01").mkdir()
+        vdir = tmp_path / "BG01" / "nuke_lens_distortion" / "v001"
+        vdir.mkdir(parents=True)
+        ld_file = create_ld_file(vdir, "SEQ_0010", "BG01", 1)
+
+        assert export_utils.find_latest_ld("DEMO", "SEQ", "SEQ_0010", "artist", "FG01") == (
+            ld_file, "001", "BG01"
+        )
+
+
+class TestBuildRead:
+    """Tests for build_read function."""
+
+    def test_exr_sequence(self, mock_nuke: MockNukeModule) -> None:
+        """Test an EXR Read gets its pattern, range and raw/linear settings in one go."""
+        import export_utils
+
+        read = export_utils.build_read("Read_plate", "/plates/FG01.####.exr", 1001, 1050, "EXR")
+
+        assert read["name"].value() == "Read_plate"
+        assert read["file"].value() == "/plates/FG01.####.exr"
+        assert read["file"]._from_user_text_calls is None
+        assert [read[k].value() for k in ("first", "last", "origfirst", "origlast")] == [1001, 1050, 1001, 1050]
+        assert (read["file_type"].value(), read["raw"].value(), read["colorspace"].value()) == ("exr", True, "linear")
+
+    def test_non_exr_keeps_defaults(self, mock_nuke: MockNukeModule) -> None:
+        """Test PNG Reads leave file type and colorspace to the project defaults."""
+        import export_utils
+
+        read = export_utils.build_read("Read_pb", "/pb/Cones.####.png", 1, 10, "png")
+
+        assert (read["first"].value(), read["last"].value()) == (1, 10)
+        assert read["file_type"].value() is None
+        assert read["colorspace"].value() is None
+
+    @pytest.mark.parametrize("error", [ValueError("bad value"), RuntimeError("OCIO config error")])
+    def test_rejected_colorspace_still_returns_read(
+        self, mock_nuke: MockNukeModule, monkeypatch: pytest.MonkeyPatch, error: Exception
+    ) -> None:
+        """Test a colorspace knob that raises leaves the Read configured otherwise."""
+        import export_utils
+
+        def set_value(knob: MockKnob, value: Any) -> None:
+            if value == "linear":
+                raise error
+            knob._value = value
+
+        monkeypatch.setattr(MockKnob, "setValue", set_value)
+
+        read = export_utils.build_read("Read_plate", "/plates/FG01.####.exr", 1001, 1050, "exr")
+
+        assert read["file"].value() == "/plates/FG01.####.exr"
+        assert read["colorspace"].value() is None
+
+    @pytest.mark.parametrize("reload,calls", [(True, 1), (False, 0)])
+    def test_reload_optional(
+        self, mock_nuke: MockNukeModule, monkeypatch: pytest.MonkeyPatch, reload: bool, calls: int
+    ) -> None:
+        """Test the node is only reloaded when asked, so callers can set a format first."""
+        import export_utils
+
+        execute = Mock()
+        monkeypatch.setattr(MockKnob, "execute", execute)
+
+        export_utils.build_read("Read_plate", "/plates/FG01.####.exr", 1, 2, "exr", reload=reload)
+
+        assert execute.call_count == calls
+
+
+class TestBuildPlayblastRead:
+    """Tests for build_playblast_read function."""
+
+    def test_sequence(self, mock_nuke: MockNukeModule) -> None:
+        """Test a sequence playblast is loaded through its hash pattern."""
+        import export_utils
+
+        playblast = {
+            "type": "sequence", "best_prefix": "/pb/Cones", "ext": "png", "fmin": 1, "fmax": 9, "pad": 4
+        }
+        read = export_utils.build_playblast_read(playblast, "003", "Cones")
+
+        assert read["name"].value() == "Read_playblast_Cones_v003"
+        assert read["file"].value() == "/pb/Cones.####.png"
+        assert (read["first"].value(), read["last"].value()) == (1, 9)
+
+    def test_movie(self, mock_nuke: MockNukeModule) -> None:
+        """Test a movie playblast is loaded as typed by the user."""
+        import export_utils
+
+        movie = {"type": "movie", "path": "/pb/Cones.mov"}
+        read = export_utils.build_playblast_read(movie, "001", "Cones")
+
+        assert read["file"]._from_user_text_calls == ["/pb/Cones.mov"]
+
+    def test_unknown_type_raises(self, mock_nuke: MockNukeModule) -> None:
+        """Test an unknown playblast type is reported."""
+        import export_utils
+
+        with pytest.raises(RuntimeError, match="unknown playblast type"):
+            export_utils.build_playblast_read({"type": "gif"}, "001", "Cones")
+
+
+class TestPasteLdGroups:
+    """Tests for paste_ld_groups function."""
+
+    def test_single_paste_makes_no_copy(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test one copy is pasted straight from the file without a temp copy."""
+        import export_utils
+
+        ld_file = tmp_path / "SH010_mm_default_FG01_LD_v001.nk"
+        groups = export_utils.paste_ld_groups(ld_file)
+
+        assert [g.Class() for g in groups] == ["Group"]
+        assert mock_nuke._pasted_files == [str(ld_file)]
+        assert mock_nuke._copied_files == []
+
+
+class TestBuildWriteTank:
+    """Tests for build_write_tank function."""
+
+    def test_configured_and_connected(self, mock_nuke: MockNukeModule) -> None:
+        """Test the WriteTank gets the Camera Elements profile and its input."""
+        import export_utils
+
+        source = MockNode("Crop")
+        write_tank = export_utils.build_write_tank("WriteTank_ConesExport", "cones", source)
+
+        assert write_tank["name"].value() == "WriteTank_ConesExport"
+        assert write_tank.input(0) is source
+        assert write_tank["profile_name"].value() == "Camera Elements"
+        assert write_tank["custom_knob_camera_element"].value() == "cones"
+        assert (write_tank["file_type"].value(), write_tank["channels"].value()) == ("exr", "rgb")
+
+
 @pytest.mark.integration
 class TestIntegration:
     """Integration tests with file system operations."""
 
-    def test_version_directory_sorting(self, tmp_path: Path) -> None:
+    def test_version_directory_sorting(self, version_sort_tree: Path) -> None:
         """Test that version directories sort correctly."""
-        base = tmp_path / "versions"
-        create_version_dirs(base, ["v001", "v003", "v002", "v010"])
+        base = version_sort_tree
 
         import export_utils
 
@@ -309,3 +1098,17 @@ class TestIntegration:
 
         names = [d.name for d in dirs]
         assert names == ["v010", "v003", "v002", "v001"]
+
+    def test_list_version_dirs(self, tmp_path: Path) -> None:
+        """Test list_version_dirs filters non-version folders and sorts latest first."""
+        base = tmp_path / "versions"
+        create_version_dirs(base, ["v001", "v003", "V002", "v010", "notes", "v01a"])
+        (base / "v004").touch()  # Files are never version folders
+
+        import export_utils
+
+        result = export_utils.list_version_dirs(base)
+
+        assert [(n, d.name) for n, d in result] == [
+            (10, "v010"), (3, "v003"), (2, "V002"), (1, "v001")
+        ]
@@ -0,0 +1,197 @@
+"""
+Tests for mm_geo_read module.
+
+Tests the core functionality including:
+- Version number extraction
+- Sequence scanning and grouping
+- Read node creation
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from conftest import MockNukeModule, create_image_sequence
+
+
+@pytest.fixture(autouse=True)
+def _clear_geo_read_caches() -> Iterator[None]:
+    """Start every test with an empty format cache; the mock's formats are reset too."""
+    import mm_geo_read
+
+    mm_geo_read._format_names_cache.clear()
+    yield
+
+
+class TestVersionNum:
+    """Tests for _version_num function."""
+
+    @pytest.mark.parametrize("version_str,expected", [
+        ("v001", 1),
+        ("V123", 123),
+        ("version1", -1),
+        ("001", -1),
+        ("v", -1),
+        ("", -1),
+        ("v1a", -1),
+        ("v-1", -1),
+        ("v\u00b2", -1),
+    ])
+    def test_version_num(self, mock_nuke: MockNukeModule, version_str: str, expected: int) -> None:
+        """Test version number extraction from various formats."""
+        import mm_geo_read
+
+        assert mm_geo_read._version_num(version_str) == expected
+
+
+class TestScanSeq:
+    """Tests for _scan_seq function."""
+
+    def test_finds_sequence(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test matching sequence is found with its frame range and padding."""
+        import mm_geo_read
+
+        create_image_sequence(tmp_path, "SH010_scene_geoRender_v001", "exr", range(1001, 1011))
+
+        prefix, ext, fmin, fmax, pad, files = mm_geo_read._scan_seq(tmp_path, "SH010", "001")
+
+        assert prefix == str(tmp_path / "SH010_scene_geoRender_v001")
+        assert ext == "exr"
+        assert (fmin, fmax, pad) == (1001, 1010, 4)
+        assert len(files) == 10
+
+    def test_prefix_keeps_dotted_layer_names(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test only the trailing .<frame>.<ext> is stripped from the prefix."""
+        import mm_geo_read
+
+        create_image_sequence(tmp_path, "SH010_scene_geo.rec709_v001", "png", range(1, 3))
+
+        prefix, ext, *_rest = mm_geo_read._scan_seq(tmp_path, "SH010", "001")
+
+        assert prefix == str(tmp_path / "SH010_scene_geo.rec709_v001")
+        assert ext == "png"
+
+    def test_ignores_other_versions_and_dirs(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test files for other versions and matching-named dirs are skipped."""
+        import mm_geo_read
+
+        create_image_sequence(tmp_path, "SH010_scene_geoRender_v002", "exr", range(1, 3))
+        (tmp_path / "SH010_scene_geoRender_v001.0001.exr").mkdir()
+
+        assert mm_geo_read._scan_seq(tmp_path, "SH010", "001") is None
+
+    def test_missing_dir_returns_none(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test scanning a nonexistent directory returns None."""
+        import mm_geo_read
+
+        assert mm_geo_read._scan_seq(tmp_path / "missing", "SH010", "001") is None
+
+    def test_largest_group_wins(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test the group with the most frames is chosen."""
+        import mm_geo_read
+
+        create_image_sequence(tmp_path, "SH010_scene_geoA_v001", "exr", range(1, 3))
+        create_image_sequence(tmp_path, "SH010_scene_geoB_v001", "exr", range(1, 6))
+
+        prefix, _ext, fmin, fmax, _pad, _files = mm_geo_read._scan_seq(tmp_path, "SH010", "001")
+
+        assert prefix.endswith("SH010_scene_geoB_v001")
+        assert (fmin, fmax) == (1, 5)
+
+    def test_newest_group_breaks_tie(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test equal-sized groups are resolved by newest modification time."""
+        import mm_geo_read
+
+        old = create_image_sequence(tmp_path, "SH010_scene_geoA_v001", "exr", range(1, 3))
+        create_image_sequence(tmp_path, "SH010_scene_geoB_v001", "exr", range(1, 3))
+        for f in old:
+            os.utime(f, (1_000_000, 1_000_000))
+
+        prefix, *_rest = mm_geo_read._scan_seq(tmp_path, "SH010", "001")
+
+        assert prefix.endswith("SH010_scene_geoB_v001")
+
+    def test_pattern_compiled_once(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test repeated scans for the same shot/version reuse one compiled pattern."""
+        import mm_geo_read
+
+        create_image_sequence(tmp_path, "SH010_scene_geoRender_v001", "exr", range(1, 3))
+        mm_geo_read._scan_seq(tmp_path, "SH010", "001")
+        hits = mm_geo_read._geo_seq_rx.cache_info().hits
+
+        mm_geo_read._scan_seq(tmp_path, "SH010", "001")
+
+        assert mm_geo_read._geo_seq_rx.cache_info().hits == hits + 1
+
+
+class TestMaybeSetFormatFromRes:
+    """Tests for _maybe_set_format_from_res function."""
+
+    def test_format_names_are_cached(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test nuke.formats() is read once and added formats join the cache."""
+        import mm_geo_read
+
+        existing = Mock()
+        existing.name.return_value = "HD_1080"
+        formats = Mock(return_value=[existing])
+        add_format = Mock()
+        monkeypatch.setattr(mock_nuke, "formats", formats)
+        monkeypatch.setattr(mock_nuke, "addFormat", add_format)
+
+        for _ in range(3):
+            read = mock_nuke.nodes.Read()
+            mm_geo_read._maybe_set_format_from_res(read, tmp_path / "4096x2268")
+            assert read["format"].value() == "4096x2268_from_geo"
+
+        assert formats.call_count == 1
+        add_format.assert_called_once_with("4096 2268 0 0 4096 2268 1 4096x2268_from_geo")
+
+    @pytest.mark.parametrize("dir_name", ["4096x", "x2268", "4096X2268", "40x96x22", "geoRender"])
+    def test_non_resolution_names_are_ignored(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, dir_name: str
+    ) -> None:
+        """Test folders that aren't exactly <W>x<H> leave the format untouched."""
+        import mm_geo_read
+
+        read = mock_nuke.nodes.Read()
+        mm_geo_read._maybe_set_format_from_res(read, tmp_path / "geoRender" / dir_name)
+
+        assert read["format"].value() is None
+
+
+class TestCreateLatestGeoRead:
+    """Tests for create_latest_geo_read_hash function."""
+
+    def test_creates_read_for_latest_version(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the newest version's sequence is loaded with its frame range."""
+        from pipeline_config import PipelineConfig
+
+        mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SH010/user/artist/nuke/comp.nk")
+        import mm_geo_read
+
+        monkeypatch.setattr(PipelineConfig, "RENDERS_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        old_dir = tmp_path / "SH010" / "v001" / "geoRender"
+        new_dir = tmp_path / "SH010" / "v002" / "geoRender" / "4096x2268"
+        old_dir.mkdir(parents=True)
+        new_dir.mkdir(parents=True)
+        create_image_sequence(old_dir, "SH010_scene_geoRender_v001", "exr", range(1, 3))
+        create_image_sequence(new_dir, "SH010_scene_geoRender_v002", "exr", range(1001, 1006))
+
+        r = mm_geo_read.create_latest_geo_read_hash()
+
+        expected = f"{new_dir / 'SH010_scene_geoRender_v002'}.####.exr"
+        assert r["file"].value() == expected
+        assert r["file"]._from_user_text_calls is None
+        assert r["name"].value() == "Read_geoRender_v002"
+        assert (r["first"].value(), r["last"].value()) == (1001, 1005)
+        assert (r["file_type"].value(), r["colorspace"].value(), r["raw"].value()) == (
+            "exr", "linear", True
+        )
@@ -0,0 +1,158 @@
+"""
+Tests for mm_ld_import module.
+
+Tests the core functionality including:
+- Plate ID detection from Read nodes
+- Plate folder collection
+- Lens distortion file discovery and scoring
+- Path parsing errors
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from conftest import MockNode, MockNukeModule, create_ld_file
+
+
+@pytest.fixture(autouse=True)
+def _clear_ld_import_caches() -> Iterator[None]:
+    """Start every test without remembered plate folder listings or folder searches."""
+    import export_utils
+    import mm_ld_import
+
+    mm_ld_import._scan_plate_dirs.cache_clear()
+    export_utils.clear_cache()
+    yield
+
+
+class TestDetectPlateFromReads:
+    """Tests for _detect_plate_from_reads function."""
+
+    @pytest.mark.parametrize("file_path,expected", [
+        ("/shows/DEMO/shots/SEQ/SEQ_0010/plate/input_plate/FG01/v001/file.exr", "FG01"),
+        ("/path/to/shot_plate_bg02_linear.exr", "BG02"),
+        ("/path/x_plate_FG01_dir/shot_linear.exr", None),
+        ("/shows/DEMO/plate/output_plate/BG01/v001/shot_plate_FG01_linear.exr", "BG01"),
+        ("", None),
+    ])
+    def test_detect(self, mock_nuke: MockNukeModule, file_path: str, expected: str | None) -> None:
+        """Test plate detection from plate folders and filenames only."""
+        import mm_ld_import
+
+        read_node = MockNode("Read")
+        read_node["file"].setValue(file_path)
+        mock_nuke._add_node(read_node)
+
+        assert mm_ld_import._detect_plate_from_reads() == expected
+
+
+class TestCollectPlateDirs:
+    """Tests for _collect_plate_dirs function."""
+
+    def test_rescans_when_scene_root_changes(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test results are cached per mtime and refreshed after a folder is added."""
+        import mm_ld_import
+
+        (tmp_path / "FG01").mkdir()
+        (tmp_path / "notes").mkdir()
+        assert mm_ld_import._collect_plate_dirs(tmp_path) == [(tmp_path / "FG01", "FG01")]
+
+        hits = mm_ld_import._scan_plate_dirs.cache_info().hits
+        mm_ld_import._collect_plate_dirs(tmp_path)
+        assert mm_ld_import._scan_plate_dirs.cache_info().hits == hits + 1
+
+        (tmp_path / "bg01").mkdir()
+        st = tmp_path.stat()
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert sorted(pid for _d, pid in mm_ld_import._collect_plate_dirs(tmp_path)) == [
+            "BG01", "FG01"
+        ]
+
+    def test_missing_root_returns_empty(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test a nonexistent scene root yields no plate folders."""
+        import mm_ld_import
+
+        assert mm_ld_import._collect_plate_dirs(tmp_path / "missing") == []
+
+
+class TestFindLatestLdForPlates:
+    """Tests for _find_latest_ld_for_plates function."""
+
+    def test_preference_order_wins(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test the first preferred plate with an LD file is chosen, not the newest."""
+        import mm_ld_import
+
+        for plate, version in (("BG01", 5), ("FG01", 1)):
+            vdir = tmp_path / plate / "nuke_lens_distortion" / f"v{version:03d}"
+            vdir.mkdir(parents=True)
+            create_ld_file(vdir, "SEQ_0010", plate, version)
+
+        ld_file, vnum, plate = mm_ld_import._find_latest_ld_for_plates(
+            tmp_path, "SEQ_0010", ["MG01", "FG01", "BG01"]
+        )
+
+        assert plate == "FG01"
+        assert vnum == "001"
+        assert ld_file is not None and ld_file.name == "SEQ_0010_mm_default_FG01_LD_v001.nk"
+
+    def test_running_scans_finish_before_return(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a scan still running when the preferred plate hits is waited for, not abandoned."""
+        import mm_ld_import
+
+        finished: list[str] = []
+        started = threading.Barrier(2)
+
+        def scan(plate_dir: Path, _shot: str, plate: str) -> tuple[Path | None, str | None]:
+            started.wait(timeout=5)
+            if plate == "BG01":
+                time.sleep(0.05)
+            finished.append(plate)
+            return (plate_dir / "ld.nk", "001") if plate == "FG01" else (None, None)
+
+        monkeypatch.setattr(mm_ld_import, "find_latest_ld_under", scan)
+
+        _ld_file, _vnum, plate = mm_ld_import._find_latest_ld_for_plates(
+            tmp_path, "SEQ_0010", ["FG01", "BG01"]
+        )
+
+        assert plate == "FG01"
+        assert sorted(finished) == ["BG01", "FG01"]
+
+    @pytest.mark.parametrize("plates", [["FG01"], ["FG01", "BG01"]])
+    def test_no_match_returns_none(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, plates: list[str]
+    ) -> None:
+        """Test (None, None, None) is returned when no plate has an LD file."""
+        import mm_ld_import
+
+        assert mm_ld_import._find_latest_ld_for_plates(tmp_path, "SEQ_0010", plates) == (
+            None, None, None
+        )
+
+
+class TestErrorConditions:
+    """Tests for error handling and user-friendly error messages."""
+
+    def test_invalid_path_structure_raises_error(self, mock_nuke: MockNukeModule) -> None:
+        """Test that invalid path structure raises RuntimeError."""
+        mock_nuke._set_script_path("/invalid/path/without/shows")
+        import mm_ld_import
+
+        with pytest.raises(RuntimeError, match="Couldn't parse"):
+            mm_ld_import.run()
+
+    def test_truncated_path_raises_error(self, mock_nuke: MockNukeModule) -> None:
+        """Test that a path ending right after /user raises RuntimeError."""
+        mock_nuke._set_script_path("/shows/demo/shots/010/0100/user")
+        import mm_ld_import
+
+        with pytest.raises(RuntimeError, match="enough segments"):
+            mm_ld_import.run()
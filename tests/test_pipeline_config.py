@@ -62,6 +62,19 @@ class TestPipelineConfigPaths:
         assert shot in str(renders_root)
         assert user in str(renders_root)
 
+    def test_repeat_lookup_reuses_path(self) -> None:
+        """Test the same shot's root is formatted once and then shared."""
+        first = PipelineConfig.get_ld_root("demo", "010", "0100", "artist")
+
+        assert PipelineConfig.get_ld_root("demo", "010", "0100", "artist") is first
+
+    def test_template_change_takes_effect(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a changed template is not masked by an earlier cached path."""
+        PipelineConfig.get_plate_root("demo", "010", "0100")
+        monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", "/tmp/{shot}/plate")
+
+        assert PipelineConfig.get_plate_root("demo", "010", "0100") == Path("/tmp/0100/plate")
+
 
 class TestParseShowShotFromPath:
     """Tests for parse_show_shot_from_path method."""
@@ -86,6 +99,16 @@ class TestParseShowShotFromPath:
         assert result["shot"] == "ABC_0010"
         assert result["user"] == "john"
 
+    @pytest.mark.parametrize("nk_path", [
+        "/shows/demo/shots/010/0100/user/artist/comp.nk",
+        "C:\\shows\\demo\\shots\\010\\0100\\user\\artist\\comp.nk",
+    ])
+    def test_string_paths(self, nk_path: str) -> None:
+        """Test plain strings parse without a Path, including Windows separators."""
+        assert PipelineConfig.parse_show_shot_from_path(nk_path) == {
+            "show": "demo", "seq": "010", "shot": "0100", "user": "artist"
+        }
+
     @pytest.mark.parametrize("invalid_path", [
         "/invalid/path/without/shows",
         "/shows/demo/invalid",
@@ -119,6 +142,31 @@ class TestParseShowShotUser:
         assert isinstance(result, tuple)
         assert len(result) == 4
 
+    @pytest.mark.parametrize("path", [
+        "/shows/demo/shots/010/0100/user/artist/comp.nk",
+        "/shows/demo/extra/shots/010/0100/work/user/artist/comp.nk",
+    ])
+    def test_standard_and_fallback_layouts(self, path: str) -> None:
+        """Test the regex shortcut and the segment fallback give the same fields."""
+        assert parse_show_shot_user(path) == ("demo", "010", "0100", "artist")
+
+    @pytest.mark.parametrize("path,expected", [
+        # Each anchor is taken at its first occurrence, as in the segment fallback
+        ("/home/user/shows/demo/shots/010/0100/user/artist/comp.nk",
+         ("demo", "010", "0100", "shows")),
+        ("/shots/old/shows/demo/shots/010/0100/user/artist/comp.nk",
+         ("demo", "old", "shows", "artist")),
+        ("/shows/demo/shots/user/0100/user/artist/comp.nk",
+         ("demo", "user", "0100", "0100")),
+        ("shows/demo/shots/010/0100/user/artist/comp.nk",
+         ("demo", "010", "0100", "artist")),
+    ])
+    def test_repeated_anchor_uses_first_occurrence(
+        self, path: str, expected: tuple[str, str, str, str]
+    ) -> None:
+        """Test an anchor name earlier in the path picks the same fields as the fallback."""
+        assert parse_show_shot_user(path) == expected
+
 
 class TestPipelineConfigConstants:
     """Tests for PipelineConfig constants."""
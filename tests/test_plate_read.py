@@ -10,11 +10,25 @@ Tests the core functionality including:
 
 from __future__ import annotations
 
+import os
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
-from conftest import MockNukeModule, create_image_sequence, create_version_dirs
+from conftest import MockNukeModule, create_image_sequence
+
+
+@pytest.fixture(autouse=True)
+def _clear_format_caches() -> Iterator[None]:
+    """Start every test with empty format caches; the mock's formats are reset too."""
+    import mm_plate_read
+
+    mm_plate_read._format_names_cache.clear()
+    mm_plate_read._res_format_cache.clear()
+    yield
 
 
 class TestVersionNum:
@@ -34,8 +48,10 @@ class TestVersionNum:
         ("v", -1),
         ("", -1),
         ("v1a", -1),
+        ("v-1", -1),
+        ("v\u00b2", -1),
     ])
-    def test_version_num(self, mock_nuke: MockNukeModule, version_str: str, expected: int) -> None:
+    def test_version_num(self, version_str: str, expected: int) -> None:
         """Test version number extraction from various formats."""
         import mm_plate_read
 
@@ -68,16 +84,35 @@ class TestNormPlateToken:
         ("invalid", None),  # No match
         ("123", None),      # Only digits
         ("", None),         # Empty
+        ("FG1A", None),     # Trailing letter
+        ("F-01", None),     # Separator inside letters
+        ("\u00c9G01", None),  # Non-ASCII letter
+        ("FG\u00b2", None),  # Non-ASCII digit
     ])
-    def test_norm_plate_token(
-        self, mock_nuke: MockNukeModule, input_token: str, expected: str | None
-    ) -> None:
+    def test_norm_plate_token(self, input_token: str, expected: str | None) -> None:
         """Test plate ID normalization from various formats."""
         import mm_plate_read
 
         assert mm_plate_read._norm_plate_token(input_token) == expected
 
 
+class TestCandidatePlateIds:
+    """Tests for _candidate_plate_ids_from_path function."""
+
+    @pytest.mark.parametrize("nk_path,expected", [
+        ("/shows/demo/scene/FG01/DM_066_FG01_v001.nk", ["FG01"]),
+        ("/shows/demo/scene/bg1/DM_066_fg1_mg02_v001.nk", ["FG01", "MG02", "BG01"]),
+        ("/shows/demo/scene/comp/DM_066_v001.nk", []),
+        ("/shows/demo/scene/fg01/BG02", ["BG02", "FG01"]),
+    ])
+    def test_candidates(self, mock_nuke: MockNukeModule, nk_path: str, expected: list[str]) -> None:
+        """Test filename tokens come before folders and repeats are dropped."""
+        import mm_plate_read
+
+        assert mm_plate_read._candidate_plate_ids_from_path(Path(nk_path)) == expected
+        assert mm_plate_read._candidate_plate_ids_from_path(nk_path) == expected
+
+
 class TestPathParsing:
     """Tests for path parsing functionality."""
 
@@ -86,22 +121,237 @@ class TestPathParsing:
         ("shots", 2),
         ("user", 5),
     ])
-    def test_find_index(
+    def test_index_map(
         self, mock_nuke: MockNukeModule, target: str, expected: int
     ) -> None:
-        """Test _find_index helper function."""
+        """Test _index_map maps each segment to its index."""
         import mm_plate_read
 
         parts = ("shows", "MYSHOW", "shots", "SEQ", "SEQ_0010", "user", "artist")
-        assert mm_plate_read._find_index(parts, target) == expected
+        assert mm_plate_read._index_map(parts)[target] == expected
 
     @pytest.mark.parametrize("target", ["user", "missing", "notfound"])
-    def test_find_index_not_found(self, mock_nuke: MockNukeModule, target: str) -> None:
-        """Test _find_index returns -1 for missing elements."""
+    def test_index_map_missing(self, mock_nuke: MockNukeModule, target: str) -> None:
+        """Test segments not in the path are absent from _index_map."""
         import mm_plate_read
 
         parts = ("shows", "MYSHOW", "shots")
-        assert mm_plate_read._find_index(parts, target) == -1
+        assert target not in mm_plate_read._index_map(parts)
+
+    def test_index_map_keeps_first_occurrence(self, mock_nuke: MockNukeModule) -> None:
+        """Test _index_map keeps the first index when a segment repeats."""
+        import mm_plate_read
+
+        parts = ("/", "shows", "MYSHOW", "shots", "SEQ", "SEQ_0010", "shots", "comp.nk")
+        idx = mm_plate_read._index_map(parts)
+
+        assert idx["shots"] == 3
+        assert idx.get("user", -1) == -1
+
+
+class TestScanSeq:
+    """Tests for _scan_seq function."""
+
+    def test_finds_plate_sequence(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test matching plate sequence is found with its frame range and padding."""
+        import mm_plate_read
+
+        create_image_sequence(
+            tmp_path, "SH010_turnover-plate_FG01_linear_v002", "exr", range(1001, 1006)
+        )
+
+        prefix, ext, fmin, fmax, pad = mm_plate_read._scan_seq(
+            tmp_path, "SH010", "002", plate_id="FG01"
+        )
+
+        assert prefix == str(tmp_path / "SH010_turnover-plate_FG01_linear_v002")
+        assert (ext, fmin, fmax, pad) == ("exr", 1001, 1005, 4)
+
+    def test_plate_id_filters_and_wildcard_matches(
+        self, mock_nuke: MockNukeModule, tmp_path: Path
+    ) -> None:
+        """Test a specific plate ID excludes other plates while None matches any."""
+        import mm_plate_read
+
+        create_image_sequence(tmp_path, "SH010_turnover-plate_BG01_linear_v001", "exr", range(1, 3))
+
+        assert mm_plate_read._scan_seq(tmp_path, "SH010", "001", plate_id="FG01") is None
+        assert mm_plate_read._scan_seq(tmp_path, "SH010", "001", plate_id=None) is not None
+
+    def test_group_choice_by_count_then_mtime(
+        self, mock_nuke: MockNukeModule, tmp_path: Path
+    ) -> None:
+        """Test the biggest group wins and newest mtime breaks a count tie."""
+        import mm_plate_read
+
+        old = create_image_sequence(tmp_path, "SH010_turnover-plate_FG01_aces_v001", "exr", range(1, 4))
+        create_image_sequence(tmp_path, "SH010_turnover-plate_FG01_linear_v001", "exr", range(1, 4))
+        create_image_sequence(tmp_path, "SH010_turnover-plate_FG01_srgb_v001", "exr", range(1, 3))
+        for f in old:
+            os.utime(f, (1_000_000, 1_000_000))
+
+        prefix, *_rest = mm_plate_read._scan_seq(tmp_path, "SH010", "001", plate_id="FG01")
+
+        assert prefix.endswith("SH010_turnover-plate_FG01_linear_v001")
+
+    def test_group_bounds_span_padding_and_ext_case(
+        self, mock_nuke: MockNukeModule, tmp_path: Path
+    ) -> None:
+        """Test frames group across ext case with the widest padding kept."""
+        import mm_plate_read
+
+        stem = "SH010_turnover-plate_FG01_linear_v001"
+        for name in (f"{stem}.0998.exr", f"{stem}.1001.EXR", f"{stem}.10000.exr", f"{stem}.0999.exr"):
+            (tmp_path / name).touch()
+
+        assert mm_plate_read._scan_seq(tmp_path, "SH010", "001", plate_id="FG01") == (
+            str(tmp_path / stem), "exr", 998, 10000, 5
+        )
+
+    def test_missing_dir_returns_none(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test scanning a nonexistent directory returns None."""
+        import mm_plate_read
+
+        assert mm_plate_read._scan_seq(tmp_path / "missing", "SH010", "001", plate_id=None) is None
+
+
+class TestMaybeSetFormatFromRes:
+    """Tests for _maybe_set_format_from_res function."""
+
+    def test_format_names_are_cached(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test nuke.formats() is read once and added formats join the cache."""
+        import mm_plate_read
+
+        existing = Mock()
+        existing.name.return_value = "HD_1080"
+        formats = Mock(return_value=[existing])
+        add_format = Mock()
+        monkeypatch.setattr(mock_nuke, "formats", formats)
+        monkeypatch.setattr(mock_nuke, "addFormat", add_format)
+
+        for _ in range(3):
+            read = mock_nuke.nodes.Read()
+            mm_plate_read._maybe_set_format_from_res(read, tmp_path / "4448x3096")
+            assert read["format"].value() == "4448x3096_from_plate"
+
+        assert formats.call_count == 1
+        add_format.assert_called_once_with("4448 3096 0 0 4448 3096 1 4448x3096_from_plate")
+
+    def test_repeat_resolution_skips_format_lookup(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a resolution seen before is applied without checking formats again."""
+        import mm_plate_read
+
+        monkeypatch.setattr(mock_nuke, "addFormat", Mock())
+        format_exists = Mock(return_value=False)
+        monkeypatch.setattr(mm_plate_read, "_format_exists", format_exists)
+
+        for seq_dir in (tmp_path / "4448x3096", tmp_path / "v002" / "exr" / "4448x3096"):
+            read = mock_nuke.nodes.Read()
+            mm_plate_read._maybe_set_format_from_res(read, seq_dir)
+            assert read["format"].value() == "4448x3096_from_plate"
+
+        format_exists.assert_called_once_with("4448x3096_from_plate")
+        assert mm_plate_read._res_format_cache == {(4448, 3096): "4448x3096_from_plate"}
+
+
+class TestCreateLatestPlateRead:
+    """Tests for create_latest_plate_read_hash function."""
+
+    @pytest.fixture
+    def plate_root(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point the plate root template at a temporary directory."""
+        from pipeline_config import PipelineConfig
+
+        monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        root = tmp_path / "SH010"
+        root.mkdir()
+        return root
+
+    def test_detected_plate_latest_version(
+        self, mock_nuke: MockNukeModule, plate_root: Path
+    ) -> None:
+        """Test the plate named in the script is used at its newest version."""
+        mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SH010/user/artist/SH010_FG01_v001.nk")
+        import mm_plate_read
+
+        for v in ("v001", "v002"):
+            seq_dir = plate_root / "FG01" / v / "exr" / "4448x3096"
+            seq_dir.mkdir(parents=True)
+            create_image_sequence(
+                seq_dir, f"SH010_turnover-plate_FG01_linear_{v}", "exr", range(1001, 1004)
+            )
+        (plate_root / "BG01" / "v009" / "exr").mkdir(parents=True)
+
+        r = mm_plate_read.create_latest_plate_read_hash()
+
+        assert r["name"].value() == "Read_rawPlate_FG01_v002"
+        assert r["file"].value() == str(
+            plate_root / "FG01" / "v002" / "exr" / "4448x3096"
+            / "SH010_turnover-plate_FG01_linear_v002.####.exr"
+        )
+        assert (r["first"].value(), r["last"].value()) == (1001, 1003)
+        assert r["file"]._from_user_text_calls is None
+        assert (r["file_type"].value(), r["colorspace"].value(), r["raw"].value()) == (
+            "exr", "linear", True
+        )
+
+    def test_wildcard_fallback_across_plates(
+        self, mock_nuke: MockNukeModule, plate_root: Path
+    ) -> None:
+        """Test files named for another plate are found by the wildcard pass."""
+        mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SH010/user/artist/SH010_FG01_v001.nk")
+        import mm_plate_read
+
+        exr_dir = plate_root / "FG01" / "v003" / "exr"
+        exr_dir.mkdir(parents=True)
+        create_image_sequence(exr_dir, "SH010_turnover-plate_FG1_linear_v003", "exr", range(1, 3))
+
+        r = mm_plate_read.create_latest_plate_read_hash()
+
+        assert r["name"].value() == "Read_rawPlate_FG01_v003"
+        assert r["file"].value().endswith("SH010_turnover-plate_FG1_linear_v003.####.exr")
+
+    def test_wildcard_pass_does_not_relist(
+        self, mock_nuke: MockNukeModule, plate_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test every folder is listed once across both search passes."""
+        mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SH010/user/artist/SH010_FG01_v001.nk")
+        import mm_plate_read
+
+        (plate_root / "FG01" / "v004" / "exr" / "4448x3096").mkdir(parents=True)
+        exr_dir = plate_root / "FG01" / "v003" / "exr"
+        exr_dir.mkdir(parents=True)
+        create_image_sequence(exr_dir, "SH010_turnover-plate_FG1_linear_v003", "exr", range(1, 3))
+
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: str | Path) -> Any:
+            listed.append(str(path))
+            return real_scandir(path)
+
+        # os.walk() looks scandir up on the os module, so this counts it too
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        r = mm_plate_read.create_latest_plate_read_hash()
+
+        assert r["name"].value() == "Read_rawPlate_FG01_v003"
+        assert str(exr_dir) in listed
+        assert len(listed) == len(set(listed))
+
+    def test_missing_plate_root_raises(
+        self, mock_nuke: MockNukeModule, plate_root: Path
+    ) -> None:
+        """Test a missing plate root reports the path it looked for."""
+        mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SH020/user/artist/comp.nk")
+        import mm_plate_read
+
+        with pytest.raises(RuntimeError, match="Plate root not found"):
+            mm_plate_read.create_latest_plate_read_hash()
 
 
 class TestErrorConditions:
@@ -205,10 +455,9 @@ class TestMockNukeIntegration:
 class TestIntegration:
     """Integration tests with file system operations."""
 
-    def test_version_directory_sorting(self, tmp_path: Path) -> None:
+    def test_version_directory_sorting(self, version_sort_tree: Path) -> None:
         """Test that version directories sort correctly."""
-        base = tmp_path / "versions"
-        create_version_dirs(base, ["v001", "v003", "v002", "v010"])
+        base = version_sort_tree
 
         dirs = [d for d in base.iterdir() if d.is_dir()]
         dirs.sort(key=lambda d: int(d.name[1:]), reverse=True)
@@ -0,0 +1,170 @@
+"""
+Tests for mm_playblast_read module.
+
+Tests the core functionality including:
+- Playblast sequence and movie detection
+- Read node creation
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from conftest import MockNukeModule, create_image_sequence
+
+
+@pytest.fixture(autouse=True)
+def _clear_playblast_read_caches() -> Iterator[None]:
+    """Start every test with an empty sequence regex cache."""
+    import mm_playblast_read
+
+    mm_playblast_read._playblast_seq_rx.cache_clear()
+    yield
+
+
+class TestScanPlayblast:
+    """Tests for _scan_playblast function."""
+
+    def test_finds_sequence(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test an image sequence named after the category is detected."""
+        import mm_playblast_read
+
+        create_image_sequence(tmp_path, "Wireframe", "png", range(1001, 1011))
+
+        result = mm_playblast_read._scan_playblast(tmp_path, "Wireframe")
+
+        assert result is not None
+        assert result["type"] == "sequence"
+        assert result["best_prefix"] == str(tmp_path / "Wireframe")
+        assert (result["ext"], result["fmin"], result["fmax"], result["pad"]) == (
+            "png", 1001, 1010, 4
+        )
+
+    def test_finds_movie(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test a movie file is returned when there is no sequence."""
+        import mm_playblast_read
+
+        (tmp_path / "wireframe.MOV").touch()
+
+        assert mm_playblast_read._scan_playblast(tmp_path, "Wireframe") == {
+            "type": "movie", "path": str(tmp_path / "wireframe.MOV")
+        }
+
+    def test_sequence_preferred_over_movie(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test a sequence wins when both a sequence and a movie are present."""
+        import mm_playblast_read
+
+        (tmp_path / "Wireframe.mov").touch()
+        create_image_sequence(tmp_path, "Wireframe", "png", range(1, 3))
+
+        result = mm_playblast_read._scan_playblast(tmp_path, "Wireframe")
+
+        assert result is not None and result["type"] == "sequence"
+
+    def test_missing_or_empty_dir_returns_none(self, mock_nuke: MockNukeModule, tmp_path: Path) -> None:
+        """Test nonexistent or unrelated directories yield None."""
+        import mm_playblast_read
+
+        (tmp_path / "Shaded.1001.png").touch()
+        (tmp_path / "Wireframe.mov").mkdir()
+
+        assert mm_playblast_read._scan_playblast(tmp_path / "missing", "Wireframe") is None
+        assert mm_playblast_read._scan_playblast(tmp_path, "Wireframe") is None
+
+    def test_newest_extension_breaks_count_tie(
+        self, mock_nuke: MockNukeModule, tmp_path: Path
+    ) -> None:
+        """Test equal-sized sequences in different formats resolve by newest mtime."""
+        import mm_playblast_read
+
+        old = create_image_sequence(tmp_path, "Wireframe", "jpg", range(1, 4))
+        create_image_sequence(tmp_path, "Wireframe", "png", range(1, 4))
+        for f in old:
+            os.utime(f, (1_000_000, 1_000_000))
+
+        result = mm_playblast_read._scan_playblast(tmp_path, "Wireframe")
+
+        assert result is not None and result["ext"] == "png"
+
+
+class TestInferContextFromNk:
+    """Tests for _infer_context_from_nk function."""
+
+    @pytest.mark.parametrize("nk_path", [
+        "/shows/DEMO/shots/SEQ/SH010/user/artist/nuke/comp.nk",
+        "C:\\shows\\DEMO\\shots\\SEQ\\SH010\\user\\artist\\comp.nk",
+        "/shows/DEMO/shots/SEQ/SH010/work/user/artist/comp.nk",
+    ])
+    def test_parses_context(self, mock_nuke: MockNukeModule, nk_path: str) -> None:
+        """Test standard, backslashed and non-adjacent layouts all parse."""
+        mock_nuke._set_script_path(nk_path)
+        import mm_playblast_read
+
+        assert mm_playblast_read._infer_context_from_nk() == ("DEMO", "SEQ", "SH010", "artist")
+
+    @pytest.mark.parametrize("nk_path,message", [
+        ("/invalid/path/comp.nk", "Couldn't parse"),
+        ("/shows/DEMO/shots/SEQ/SH010/user", "enough segments"),
+    ])
+    def test_bad_path_raises(self, mock_nuke: MockNukeModule, nk_path: str, message: str) -> None:
+        """Test paths without the expected anchors raise a readable error."""
+        mock_nuke._set_script_path(nk_path)
+        import mm_playblast_read
+
+        with pytest.raises(RuntimeError, match=message):
+            mm_playblast_read._infer_context_from_nk()
+
+
+class TestCreateLatestPlayblastRead:
+    """Tests for create_latest_playblast_read function."""
+
+    @pytest.fixture
+    def playblast_root(
+        self, mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Path:
+        """Point the playblast root template at a temporary directory."""
+        from pipeline_config import PipelineConfig
+
+        mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SH010/user/artist/nuke/comp.nk")
+        monkeypatch.setattr(PipelineConfig, "PLAYBLAST_ROOT_TEMPLATE", str(tmp_path / "{shot}"))
+        root = tmp_path / "SH010"
+        root.mkdir()
+        return root
+
+    def test_latest_version_sequence(self, mock_nuke: MockNukeModule, playblast_root: Path) -> None:
+        """Test the newest version with content is loaded."""
+        import mm_playblast_read
+
+        for v in ("v001", "v002"):
+            vdir = playblast_root / "Wireframe" / v
+            vdir.mkdir(parents=True)
+            create_image_sequence(vdir, "Wireframe", "png", range(1001, 1004))
+        (playblast_root / "Wireframe" / "v003").mkdir()
+
+        r = mm_playblast_read.create_latest_playblast_read("Wireframe")
+
+        assert r["name"].value() == "Read_playblast_Wireframe_v002"
+        assert r["file"].value() == str(playblast_root / "Wireframe" / "v002" / "Wireframe.####.png")
+        assert (r["first"].value(), r["last"].value()) == (1001, 1003)
+        assert r["file"]._from_user_text_calls is None
+        assert (r["file_type"].value(), r["raw"].value()) == (None, False)
+
+    def test_missing_category_raises(self, mock_nuke: MockNukeModule, playblast_root: Path) -> None:
+        """Test a missing category folder names the category in the error."""
+        import mm_playblast_read
+
+        with pytest.raises(RuntimeError, match="No 'Shaded' folder"):
+            mm_playblast_read.create_latest_playblast_read("Shaded")
+
+    def test_missing_root_raises(
+        self, mock_nuke: MockNukeModule, playblast_root: Path
+    ) -> None:
+        """Test a missing playblast root is reported as such."""
+        playblast_root.rmdir()
+        import mm_playblast_read
+
+        with pytest.raises(RuntimeError, match="Playblast root not found"):
+            mm_playblast_read.create_latest_playblast_read("Wireframe")
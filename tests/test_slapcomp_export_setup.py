@@ -0,0 +1,120 @@
+"""
+Tests for mm_slapcomp_export_setup module.
+
+Tests the dual-pipeline build against a temporary shot tree:
+- Shared plate Read configuration
+- Per-category playblast Reads, LD groups and WriteTanks
+"""
+
+from __future__ import annotations
+
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from conftest import MockNukeModule, create_export_shot_tree
+
+from pipeline_config import PipelineConfig
+
+
+@pytest.fixture(autouse=True)
+def _clear_export_caches() -> Iterator[None]:
+    """Start every test without cached folder searches."""
+    import export_utils
+
+    export_utils.clear_cache()
+    yield
+
+
+@pytest.fixture
+def shot_tree(mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create plate, LD and Cones/Wireframe playblasts for SH010 under tmp_path."""
+    monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path / "plate"))
+    monkeypatch.setattr(PipelineConfig, "LD_ROOT_TEMPLATE", str(tmp_path / "ld"))
+    monkeypatch.setattr(PipelineConfig, "PLAYBLAST_ROOT_TEMPLATE", str(tmp_path / "playblast"))
+    mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SH010/user/artist/nuke/SH010_FG01_v001.nk")
+
+    create_export_shot_tree(
+        tmp_path, 2, 3, {"Cones": (1, "png"), "Wireframe": (1, "png")}, range(1001, 1011)
+    )
+
+    return tmp_path
+
+
+class TestCreateSlapcompExportSetup:
+    """Tests for create_slapcomp_export_setup function."""
+
+    def test_shared_plate_read(self, mock_nuke: MockNukeModule, shot_tree: Path) -> None:
+        """Test the shared plate Read gets the latest plate and its EXR settings."""
+        import mm_slapcomp_export_setup
+
+        plate_read = mm_slapcomp_export_setup.run()["shared"]["plate_read"]
+
+        assert plate_read["name"].value() == "Read_rawPlate_FG01_v002"
+        assert plate_read["file"].value() == str(
+            shot_tree / "plate" / "FG01" / "v002" / "exr" / "SH010_turnover-plate_FG01_linear_v002.####.exr"
+        )
+        assert (plate_read["first"].value(), plate_read["last"].value()) == (1001, 1010)
+        assert (
+            plate_read["file_type"].value(), plate_read["colorspace"].value(), plate_read["raw"].value()
+        ) == ("exr", "linear", True)
+
+    def test_pipelines_per_category(self, mock_nuke: MockNukeModule, shot_tree: Path) -> None:
+        """Test each category gets its own playblast Read, LD group and WriteTank."""
+        import mm_slapcomp_export_setup
+
+        results = mm_slapcomp_export_setup.run()
+        plate_read = results["shared"]["plate_read"]
+
+        for category, element in (("Cones", "cones"), ("Wireframe", "lineupGeo")):
+            nodes = results[category]
+            assert nodes["playblast_read"]["name"].value() == f"Read_playblast_{category}_v001"
+            assert nodes["ld_group"].name() == f"LD_3DE_FG01_{category}_v003"
+            assert nodes["ld_group"].input(0) is nodes["transform"]
+            assert nodes["merge"].input(1) is plate_read
+            assert nodes["write_tank"]["custom_knob_camera_element"].value() == element
+
+        assert results["Cones"]["ld_group"] is not results["Wireframe"]["ld_group"]
+
+    def test_crops_full_frame(self, mock_nuke: MockNukeModule, shot_tree: Path) -> None:
+        """Test every pipeline's Crop covers the root format."""
+        import mm_slapcomp_export_setup
+
+        results = mm_slapcomp_export_setup.run()
+
+        root = mock_nuke.root()
+        for category in ("Cones", "Wireframe"):
+            assert results[category]["crop"]["box"].value() == [0, 0, root.width(), root.height()]
+
+    def test_ld_file_read_once(self, mock_nuke: MockNukeModule, shot_tree: Path) -> None:
+        """Test the LD .nk is pasted from disk once and the copy is cleaned up."""
+        import mm_slapcomp_export_setup
+
+        mm_slapcomp_export_setup.run()
+
+        ld_file = shot_tree / "ld" / "FG01" / "nuke_lens_distortion" / "v003" / "SH010_mm_default_FG01_LD_v003.nk"
+        first, second = mock_nuke._pasted_files
+        assert first == str(ld_file)
+        assert mock_nuke._copied_files == [second]
+        assert second != first and not Path(second).parent.exists()
+
+    def test_single_undo_step(self, mock_nuke: MockNukeModule, shot_tree: Path) -> None:
+        """Test the whole build is recorded as one undo step."""
+        import mm_slapcomp_export_setup
+
+        mm_slapcomp_export_setup.run()
+
+        assert mock_nuke.Undo._calls == ["begin:Slap Comp Export Setup", "end"]
+
+    def test_missing_playblast_builds_nothing(self, mock_nuke: MockNukeModule, shot_tree: Path) -> None:
+        """Test a missing playblast is reported before any node or LD group is created."""
+        import mm_slapcomp_export_setup
+
+        shutil.rmtree(shot_tree / "playblast" / "Wireframe")
+
+        with pytest.raises(RuntimeError, match="No 'Wireframe' folder"):
+            mm_slapcomp_export_setup.run()
+
+        assert mock_nuke._pasted_files == []
+        assert mock_nuke.allNodes() == []
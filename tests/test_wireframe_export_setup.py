@@ -0,0 +1,75 @@
+"""
+Tests for mm_wireframe_export_setup module.
+
+Tests the single-pipeline build against a temporary shot tree:
+- Playblast and plate Read configuration
+- Node wiring through the LD group into the WriteTank
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from conftest import MockNukeModule, create_export_shot_tree
+
+from pipeline_config import PipelineConfig
+
+
+@pytest.fixture(autouse=True)
+def _clear_export_caches() -> Iterator[None]:
+    """Start every test without cached folder searches."""
+    import export_utils
+
+    export_utils.clear_cache()
+    yield
+
+
+@pytest.fixture
+def shot_tree(mock_nuke: MockNukeModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create plate, LD and an EXR Wireframe playblast for SH010 under tmp_path."""
+    monkeypatch.setattr(PipelineConfig, "PLATE_ROOT_TEMPLATE", str(tmp_path / "plate"))
+    monkeypatch.setattr(PipelineConfig, "LD_ROOT_TEMPLATE", str(tmp_path / "ld"))
+    monkeypatch.setattr(PipelineConfig, "PLAYBLAST_ROOT_TEMPLATE", str(tmp_path / "playblast"))
+    mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SH010/user/artist/nuke/SH010_FG01_v001.nk")
+
+    create_export_shot_tree(tmp_path, 1, 2, {"Wireframe": (4, "exr")}, range(1001, 1006))
+
+    return tmp_path
+
+
+class TestCreatePlayblastExportSetup:
+    """Tests for create_playblast_export_setup function."""
+
+    def test_reads_configured(self, mock_nuke: MockNukeModule, shot_tree: Path) -> None:
+        """Test both Reads get the latest versions, frame ranges and EXR settings."""
+        import mm_wireframe_export_setup
+
+        nodes = mm_wireframe_export_setup.run()
+
+        playblast_read = nodes["playblast_read"]
+        assert playblast_read["name"].value() == "Read_playblast_Wireframe_v004"
+        assert playblast_read["file"].value() == str(
+            shot_tree / "playblast" / "Wireframe" / "v004" / "Wireframe.####.exr"
+        )
+        assert (playblast_read["first"].value(), playblast_read["last"].value()) == (1001, 1005)
+        assert (playblast_read["colorspace"].value(), playblast_read["raw"].value()) == ("linear", True)
+
+        plate_read = nodes["plate_read"]
+        assert plate_read["name"].value() == "Read_rawPlate_FG01_v001"
+        assert (plate_read["first"].value(), plate_read["last"].value()) == (1001, 1005)
+
+    def test_nodes_wired(self, mock_nuke: MockNukeModule, shot_tree: Path) -> None:
+        """Test the playblast feeds the LD group, which the plate is merged over."""
+        import mm_wireframe_export_setup
+
+        nodes = mm_wireframe_export_setup.run()
+
+        assert nodes["transform"].input(0) is nodes["playblast_read"]
+        assert nodes["ld_group"].input(0) is nodes["transform"]
+        assert nodes["ld_group"].name() == "LD_3DE_FG01_v002"
+        assert nodes["merge"].input(0) is nodes["ld_group"]
+        assert nodes["merge"].input(1) is nodes["plate_read"]
+        assert nodes["write_tank"].input(0) is nodes["merge"]
+        assert nodes["write_tank"]["custom_knob_camera_element"].value() == "lineupGeo"
@@ -0,0 +1,105 @@
+"""
+Tests for mm_write_altplates module.
+
+Tests the core functionality including:
+- Filename sanitizing of node names
+- Script path parsing and its cache
+- Write node creation and configuration
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from conftest import MockNode, MockNukeModule
+
+
+@pytest.fixture(autouse=True)
+def _clear_write_altplates_caches() -> Iterator[None]:
+    """Start every test without parsed shot contexts."""
+    import mm_write_altplates
+
+    mm_write_altplates._parse_shot_context.cache_clear()
+    yield
+
+
+class TestSanitizeName:
+    """Tests for _sanitize_name function."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Grade1", "Grade1"),
+        ("My Node! (v2)", "My_Node_v2"),
+        ("__a--b..c__", "a--b..c"),
+        ("a / b \\ c", "a_b_c"),
+        ("Grädé 1", "Grädé_1"),
+        ("日本 ノード", "日本_ノード"),
+        ("!!!", "Graded"),
+        ("", "Graded"),
+    ])
+    def test_sanitize(self, mock_nuke: MockNukeModule, name: str, expected: str) -> None:
+        """Test unsafe characters become single underscores, ASCII or not."""
+        import mm_write_altplates
+
+        assert mm_write_altplates._sanitize_name(name) == expected
+
+
+class TestCreateAltplatesWrite:
+    """Tests for create_altplates_write function."""
+
+    def test_configured_and_connected(self, mock_nuke: MockNukeModule) -> None:
+        """Test the Write is named after the selection, configured and connected."""
+        import mm_write_altplates
+
+        mock_nuke._set_script_path("/shows/DEMO/shots/SEQ/SEQ_0010/user/artist/nuke/comp.nk")
+        grade = MockNode("Grade")
+        grade.setName("Grade 1")
+        mock_nuke._set_selected_nodes([grade])
+
+        w = mm_write_altplates.create_altplates_write()
+
+        assert w["name"].value() == "Write_AltPlates_Grade_1"
+        assert w["file"].value() == (
+            "/shows/DEMO/shots/SEQ/SEQ_0010/user/gabriel-h/mm/nuke/outputs/AltPlates/Grade_1.#.exr"
+        )
+        for knob, value in mm_write_altplates.ALTPLATES_WRITE_KNOBS.items():
+            assert w[knob].value() == value
+        assert w.input(0) is grade
+
+    def test_unsaved_script_raises(self, mock_nuke: MockNukeModule) -> None:
+        """Test an unsaved script shows an error instead of guessing a path."""
+        import mm_write_altplates
+
+        mock_nuke._set_script_path("")
+
+        with pytest.raises(RuntimeError, match="save the Nuke script"):
+            mm_write_altplates.create_altplates_write()
+
+
+class TestParseShotContext:
+    """Tests for _parse_shot_context function."""
+
+    def test_parse_is_cached_per_path(self, mock_nuke: MockNukeModule) -> None:
+        """Test a second lookup of the same script path is a cache hit."""
+        import mm_write_altplates
+
+        path = "/shows/DEMO/shots/SEQ/SEQ_0010/user/artist/nuke/comp.nk"
+        assert mm_write_altplates._parse_shot_context(path) == ("DEMO", "SEQ", "SEQ_0010")
+        mm_write_altplates._parse_shot_context(path)
+
+        assert mm_write_altplates._parse_shot_context.cache_info().hits == 1
+
+    @pytest.mark.parametrize("path,match", [
+        ("/tmp/comp.nk", "Couldn't parse"),
+        ("/shows/DEMO/shots/SEQ", "enough segments"),
+    ])
+    def test_bad_path_raises_every_time(
+        self, mock_nuke: MockNukeModule, path: str, match: str
+    ) -> None:
+        """Test failures are reported on each call rather than cached."""
+        import mm_write_altplates
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match=match):
+                mm_write_altplates._parse_shot_context(path)
+        assert len(mock_nuke._message_calls) == 2